@@ -0,0 +1,56 @@
+"""Measure the throughput of run_batch on BicycleModel scenarios with
+different start poses, wheelbases and steering limits.
+
+Usage: python benchmarks/bench_batch.py [SCENARIOS] [PROCESSES] [CHUNKSIZE]
+"""
+import sys
+
+import numpy as np
+
+import robotics as rbt
+
+STEPS = 2000
+
+
+def simulate(scenario, out):
+    model = rbt.BicycleModel(
+        x=scenario["x"],
+        y=scenario["y"],
+        theta=scenario["theta"],
+        L=scenario["L"],
+        v=2.0,
+        max_steering_angle=scenario["max_steering_angle"],
+        history=rbt.ColumnarHistory(out=out),
+    )
+    for k in range(STEPS):
+        model.update_by_phi_and_accel(0.5 * np.sin(0.01 * k), 0.0, 0.01)
+    return len(model.history)
+
+
+def main(n=200, processes=None, chunksize=4):
+    rng = np.random.RandomState(0)
+    scenarios = {
+        "x": rng.uniform(-10, 10, n),
+        "y": rng.uniform(-10, 10, n),
+        "theta": rng.uniform(-np.pi, np.pi, n),
+        "L": rng.uniform(1.5, 3.5, n),
+        "max_steering_angle": rng.uniform(0.3, 0.7, n),
+    }
+    for p in (0, processes):
+        with rbt.run_batch(
+            simulate, scenarios, rbt.BicycleModel.COLUMNS, STEPS + 1, p, chunksize
+        ) as result:
+            summary = result.summary()
+        print(
+            "processes {:>4}: {:8.1f} scenarios/s {:12,.0f} steps/s, "
+            "{:.2f} ms per scenario".format(
+                "auto" if p is None else p,
+                summary["scenarios_per_second"],
+                summary["steps_per_second"],
+                summary["wall_time_mean"] * 1e3,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
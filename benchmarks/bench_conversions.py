@@ -0,0 +1,64 @@
+"""Compare the batched SO(3) conversions against looping the scalar versions.
+
+Usage: python benchmarks/bench_conversions.py [N]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import robotics as rbt
+
+
+def bench(name, loop, batched, repeat=3):
+    t_loop = min(timeit.repeat(loop, number=1, repeat=repeat))
+    t_batched = min(timeit.repeat(batched, number=1, repeat=repeat))
+    print(
+        "{:<32} loop {:9.4f} s  batched {:9.5f} s  speedup {:8.1f}x".format(
+            name, t_loop, t_batched, t_loop / t_batched
+        )
+    )
+
+
+def main(n=10000):
+    rng = np.random.RandomState(0)
+    rpy = rng.uniform(-np.pi / 2, np.pi / 2, (n, 3))
+    R = rbt.rotation3D_rpy_array(rpy[:, 0], rpy[:, 1], rpy[:, 2])
+    axis = rng.randn(n, 3)
+    q = rbt.axis_angle_to_quaternion_array(axis)
+    q_list = [rbt.vector_to_quaternion(v) for v in q]
+
+    bench(
+        "rotation_to_quaternion",
+        lambda: [rbt.rotation_to_quaternion(m) for m in R],
+        lambda: rbt.rotation_to_quaternion_array(R),
+    )
+    bench(
+        "rpy_to_quaternion",
+        lambda: [rbt.rpy_to_quaternion(*a) for a in rpy],
+        lambda: rbt.rpy_to_quaternion_array(rpy),
+    )
+    bench(
+        "axis_angle_to_quaternion",
+        lambda: [rbt.axis_angle_to_quaternion(a) for a in axis],
+        lambda: rbt.axis_angle_to_quaternion_array(axis),
+    )
+    bench(
+        "quaternion_to_axis_angle",
+        lambda: [rbt.quaternion_to_axis_angle(qi) for qi in q_list],
+        lambda: rbt.quaternion_to_axis_angle_array(q),
+    )
+    bench(
+        "rotation3D_to_axis_angle",
+        lambda: [rbt.rotation3D_to_axis_angle(m) for m in R],
+        lambda: rbt.rotation3D_to_axis_angle_array(R),
+    )
+    bench(
+        "rotation3D_to_rpy",
+        lambda: [rbt.rotation3D_to_rpy(m) for m in R],
+        lambda: rbt.rotation3D_to_rpy_array(R),
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
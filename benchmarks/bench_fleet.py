@@ -0,0 +1,51 @@
+"""Compare vehicle updates per second of N BicycleModel instances and
+one BicycleFleet of N vehicles.
+
+Usage: python benchmarks/bench_fleet.py [N] [STEPS]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import robotics as rbt
+
+
+def main(n=10000, steps=100):
+    dt = 0.01
+    phi = np.random.RandomState(0).uniform(-0.5, 0.5, n)
+
+    models = [
+        rbt.BicycleModel(L=2.5, v=3.0, history=rbt.NullHistory())
+        for _ in range(min(n, 1000))
+    ]
+    phi_list = phi[: len(models)].tolist()
+    t_models = min(
+        timeit.repeat(
+            lambda: [
+                m.update_Euler_by_phi_and_accel(p, 0.0, dt)
+                for m, p in zip(models, phi_list)
+            ],
+            number=10,
+            repeat=3,
+        )
+    ) / (10 * len(models))
+
+    fleet = rbt.BicycleFleet(n, L=2.5, v=3.0, max_steering_angle=np.pi / 4)
+    t_fleet = min(
+        timeit.repeat(
+            lambda: fleet.update_Euler_by_phi_and_accel(phi, 0.0, dt),
+            number=steps,
+            repeat=3,
+        )
+    ) / (steps * n)
+
+    print("BicycleModel   {:14,.0f} vehicle updates/s".format(1 / t_models))
+    print("BicycleFleet   {:14,.0f} vehicle updates/s".format(1 / t_fleet))
+    print(
+        "{} vehicles at 100 Hz use {:.1%} of one core".format(n, 100 * n * t_fleet)
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
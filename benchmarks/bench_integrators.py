@@ -0,0 +1,61 @@
+"""Compare the accuracy and cost of the wheeled model integrators.
+
+A BicycleModel driven by update_by_alpha_and_accel with constant commands is
+integrated over 10 s with every integrator and a range of dt. The position
+error is taken against RK4 with dt = 1e-4. For every integrator the table
+lists the largest dt keeping the error below TOL and the time that run costs.
+
+Usage: python benchmarks/bench_integrators.py [TOL_MM]
+"""
+import sys
+import time
+
+import numpy as np
+
+import robotics as rbt
+
+DURATION = 10.0
+DTS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0)
+
+
+def simulate(dt, integrator):
+    model = rbt.BicycleModel(
+        L=2.5, v=2.0, max_steering_angle=0.6, history=rbt.NullHistory()
+    )
+    update = model.update_by_alpha_and_accel
+    start = time.perf_counter()
+    for _ in range(int(round(DURATION / dt))):
+        update(0.01, 0.1, dt, integrator)
+    elapsed = time.perf_counter() - start
+    return np.array([model.x, model.y]), elapsed
+
+
+def main(tol_mm=1):
+    tol = tol_mm * 1e-3
+    reference, _ = simulate(1e-4, "rk4")
+
+    print("{:>10} {:>8} {:>14} {:>10}".format("integrator", "dt", "error", "time"))
+    for integrator in rbt.INTEGRATORS:
+        best = None
+        for dt in DTS:
+            position, elapsed = simulate(dt, integrator)
+            error = np.linalg.norm(position - reference)
+            print(
+                "{:>10} {:>8} {:>12.3e} m {:>8.2f} ms".format(
+                    integrator, dt, error, elapsed * 1e3
+                )
+            )
+            if error < tol:
+                best = (dt, elapsed)
+        if best is None:
+            print("{:>10} never reaches {} mm".format(integrator, tol_mm))
+        else:
+            print(
+                "{:>10} largest dt {} for {} mm, {:.2f} ms\n".format(
+                    integrator, best[0], tol_mm, best[1] * 1e3
+                )
+            )
+
+
+if __name__ == "__main__":
+    main(*[float(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""Compare the time of one MPPI update of K samples over a horizon of T
+steps with rolling the same samples through BicycleModel objects.
+
+Usage: python benchmarks/bench_mppi.py [K] [T] [PROCESSES]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import robotics as rbt
+
+
+def main(K=1000, T=50, processes=0):
+    dt = 0.05
+    cost = rbt.QuadraticCost((10.0, 3.0, 0.0, 0.0), R=(0.1, 0.01))
+    mppi = rbt.MPPI(
+        np.zeros((T, 2)),
+        dt,
+        cost,
+        samples=K,
+        L=2.5,
+        max_steering_angle=0.6,
+        processes=processes,
+        seed=0,
+    )
+    state = (0.0, 0.0, 0.0, 2.0)
+    with mppi:
+        mppi.update(state)
+        t_batch = min(timeit.repeat(lambda: mppi.update(state), number=1, repeat=5))
+
+    controls = mppi.nominal + np.random.RandomState(0).randn(K, T, 2) * 0.1
+    n_objects = min(K, 100)
+
+    def objects():
+        for k in range(n_objects):
+            model = rbt.BicycleModel(
+                L=2.5, v=2.0, max_steering_angle=0.6, history=rbt.NullHistory()
+            )
+            for phi, accel in controls[k].tolist():
+                model.update_Euler_by_phi_and_accel(phi, accel, dt)
+
+    t_objects = min(timeit.repeat(objects, number=1, repeat=3)) * K / n_objects
+
+    print("K = {}, T = {}, processes = {}".format(K, T, processes))
+    print("MPPI.update            {:10.2f} ms".format(t_batch * 1e3))
+    print("BicycleModel rollouts  {:10.2f} ms".format(t_objects * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
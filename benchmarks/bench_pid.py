@@ -0,0 +1,55 @@
+"""Compare controller calls per second of PID.get_output, PIDFixedRate.step
+and a PIDBank step per channel.
+
+Usage: python benchmarks/bench_pid.py [N]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import robotics as rbt
+
+
+def main(n=100000):
+    errors = np.random.RandomState(0).randn(n).tolist()
+    times = (np.arange(n) * 1e-3).tolist()
+
+    pid = rbt.PID(1.2, 0.7, 0.1)
+    get_output = pid.get_output
+    t_pid = min(
+        timeit.repeat(
+            lambda: [get_output(e, t) for e, t in zip(errors, times)],
+            number=1,
+            repeat=3,
+        )
+    )
+
+    fixed = rbt.PIDFixedRate(1e-3, 1.2, 0.7, 0.1)
+    step = fixed.step
+    t_fixed = min(
+        timeit.repeat(lambda: [step(e) for e in errors], number=1, repeat=3)
+    )
+
+    bank = rbt.PIDBank(1000, 1.2, 0.7, 0.1)
+    bank_errors = np.ones(1000)
+    n_bank = max(1, n // 1000)
+    t_bank = min(
+        timeit.repeat(
+            lambda: [bank.step(bank_errors, t) for t in times[:n_bank]],
+            number=1,
+            repeat=3,
+        )
+    )
+
+    print("PID.get_output      {:12,.0f} calls/s".format(n / t_pid))
+    print("PIDFixedRate.step   {:12,.0f} calls/s".format(n / t_fixed))
+    print(
+        "PIDBank(1000).step  {:12,.0f} channel updates/s".format(
+            n_bank * 1000 / t_bank
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
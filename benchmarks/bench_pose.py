@@ -0,0 +1,68 @@
+"""Compare compact Pose2D/Pose3D types against homogeneous matrix chains.
+
+Usage: python benchmarks/bench_pose.py [N]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import robotics as rbt
+
+
+def bench(name, matrix, compact, repeat=3):
+    t_matrix = min(timeit.repeat(matrix, number=1, repeat=repeat))
+    t_compact = min(timeit.repeat(compact, number=1, repeat=repeat))
+    print(
+        "{:<32} matrix {:9.5f} s  compact {:9.5f} s  speedup {:6.1f}x".format(
+            name, t_matrix, t_compact, t_matrix / t_compact
+        )
+    )
+
+
+def chain(items):
+    result = items[0]
+    for item in items[1:]:
+        result = result @ item if isinstance(result, np.ndarray) else result * item
+    return result
+
+
+def main(n=10000):
+    rng = np.random.RandomState(0)
+    xyt = rng.uniform(-1, 1, (n, 3))
+    T2 = list(rbt.transform2D_array(xyt[:, 0], xyt[:, 1], xyt[:, 2]))
+    P2 = [rbt.Pose2D(*row) for row in xyt]
+    P2_array = rbt.Pose2DArray(xyt)
+
+    q = rng.randn(n, 4)
+    t = rng.randn(n, 3)
+    P3_array = rbt.Pose3DArray(q, t)
+    T3_stack = P3_array.to_matrix()
+    T3 = list(T3_stack)
+    P3 = [P3_array[i] for i in range(n)]
+
+    bench("SE(2) chain compose", lambda: chain(T2), lambda: chain(P2))
+    bench(
+        "SE(2) inverse",
+        lambda: [np.linalg.inv(T) for T in T2],
+        lambda: [p.inv() for p in P2],
+    )
+    bench("SE(3) chain compose", lambda: chain(T3), lambda: chain(P3))
+    bench(
+        "SE(3) inverse",
+        lambda: [np.linalg.inv(T) for T in T3],
+        lambda: [p.inv() for p in P3],
+    )
+    T2_stack = np.array(T2)
+    bench(
+        "SE(2) batch compose", lambda: T2_stack @ T2_stack, lambda: P2_array * P2_array
+    )
+    bench("SE(2) batch inverse", lambda: np.linalg.inv(T2_stack), P2_array.inv)
+    bench(
+        "SE(3) batch compose", lambda: T3_stack @ T3_stack, lambda: P3_array * P3_array
+    )
+    bench("SE(3) batch inverse", lambda: np.linalg.inv(T3_stack), P3_array.inv)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
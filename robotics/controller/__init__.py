@@ -1,2 +1,9 @@
 from .pid import *
 from .pid_clamping import *
+from .pid_bank import *
+from .pid_clamping_bank import *
+from .pid_replay import *
+from .tuning import *
+from .pid_fixed_rate import *
+from .scheduler import *
+from .mppi import *
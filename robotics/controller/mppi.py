@@ -0,0 +1,242 @@
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+BICYCLE_STATE = ("x", "y", "theta", "v")
+
+
+def _accumulate(initial, increments, out):
+    """Fill out (K, T + 1) with the running sums of increments (K, T)
+    starting at initial, in the same order as stepping.
+    """
+    out[:, 0] = initial
+    out[:, 1:] = increments
+    np.add.accumulate(out, axis=1, out=out)
+
+
+def bicycle_rollouts(
+    state, controls, dt, L=1.0, max_steering_angle=np.pi / 2, out=None
+) -> np.array:
+    """Roll K control sequences through the kinematic bicycle at once.
+
+    state: the initial x, y, theta, v.
+    controls: (K, T, 2) steering angle and acceleration commands, applied as
+        BicycleModel.update_Euler_by_phi_and_accel, so the steering angle is
+        clipped to ±max_steering_angle.
+    Return the (K, T + 1, 4) x, y, theta, v states including the initial one.
+    Every state component is a cumulative sum along the horizon, there is
+    no Python loop over K or T.
+    """
+    controls = np.asarray(controls, dtype=float)
+    K, T, _ = controls.shape
+    states = np.empty((K, T + 1, 4)) if out is None else out
+    x0, y0, theta0, v0 = state
+    x, y, theta, v = (states[:, :, i] for i in range(4))
+
+    phi = np.clip(controls[:, :, 0], -max_steering_angle, max_steering_angle)
+    _accumulate(v0, controls[:, :, 1] * dt, v)
+    ds = v[:, :-1] * dt
+    _accumulate(theta0, v[:, :-1] * np.tan(phi) / L * dt, theta)
+    _accumulate(x0, ds * np.cos(theta[:, :-1]), x)
+    _accumulate(y0, ds * np.sin(theta[:, :-1]), y)
+    return states
+
+
+class GaussianNoise:
+    """Zero mean Gaussian control perturbations.
+
+    sigma: the standard deviation of every control channel.
+    __call__(K, T) returns (K, T, len(sigma)) samples. Any callable with the
+    same signature can be used as the noise model of MPPI.
+    """
+
+    __slots__ = ("sigma", "rng")
+
+    def __init__(self, sigma, seed=None):
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.rng = np.random.RandomState(seed)
+
+    def __call__(self, K, T) -> np.array:
+        return self.rng.standard_normal((K, T, len(self.sigma))) * self.sigma
+
+
+class QuadraticCost:
+    """The cost of every rollout, summed over the horizon
+
+        Σ (s - ref)ᵀ Q (s - ref) + Σ uᵀ R u + (s_T - ref_T)ᵀ Q_T (s_T - ref_T)
+
+    reference: the (4,) or (T + 1, 4) reference x, y, theta, v states.
+    Q, R, terminal: the diagonals of the state, control and terminal weights.
+    The heading error is wrapped to [-pi, pi).
+    """
+
+    __slots__ = ("reference", "Q", "R", "terminal")
+
+    def __init__(self, reference, Q=(1.0, 1.0, 0.0, 0.0), R=(0.0, 0.0), terminal=None):
+        self.reference = np.asarray(reference, dtype=float)
+        self.Q = np.asarray(Q, dtype=float)
+        self.R = np.asarray(R, dtype=float)
+        self.terminal = self.Q if terminal is None else np.asarray(terminal, float)
+
+    def __call__(self, states, controls) -> np.array:
+        error = states - self.reference
+        error[:, :, 2] = (error[:, :, 2] + np.pi) % (2 * np.pi) - np.pi
+        weighted = error ** 2 @ self.Q
+        return (
+            weighted[:, :-1].sum(axis=1)
+            + error[:, -1] ** 2 @ self.terminal
+            + (controls ** 2 @ self.R).sum(axis=1)
+        )
+
+
+def _rollout_costs(args) -> np.array:
+    """Roll out one chunk of the samples in a worker and return only the
+    costs, so the states never cross the process boundary.
+    """
+    state, controls, dt, L, max_steering_angle, cost = args
+    states = bicycle_rollouts(state, controls, dt, L, max_steering_angle)
+    return cost(states, controls)
+
+
+class MPPI:
+    """Model predictive path integral control of a kinematic bicycle.
+
+    Every update perturbs the nominal (T, 2) steering angle and acceleration
+    sequence with K noise samples, rolls them all out with bicycle_rollouts,
+    and moves the nominal sequence by the perturbations weighted with
+    exp(-cost / temperature).
+
+    cost: a picklable cost(states (K, T + 1, 4), controls (K, T, 2)) -> (K,),
+        e.g. QuadraticCost. Rollouts with NaN cost get no weight.
+    noise: a callable noise(K, T) -> (K, T, 2), GaussianNoise(sigma) by default.
+    samples: K, the number of sampled control sequences per update.
+    processes: the size of the process pool, 0 evaluates in this process
+        and None uses os.cpu_count(). The pool is kept until close().
+    chunk_size: the number of samples rolled out at once, bounding the
+        memory of one chunk and the work of one pool task. All samples in
+        one chunk by default in this process, and one chunk per process
+        otherwise.
+    """
+
+    __slots__ = (
+        "nominal",
+        "dt",
+        "cost",
+        "noise",
+        "samples",
+        "temperature",
+        "L",
+        "max_steering_angle",
+        "processes",
+        "chunk_size",
+        "costs",
+        "weights",
+        "states",
+        "_pool",
+    )
+
+    def __init__(
+        self,
+        nominal,
+        dt,
+        cost,
+        noise=None,
+        samples=1000,
+        temperature=1.0,
+        L=1.0,
+        max_steering_angle=np.pi / 2,
+        processes=0,
+        chunk_size=None,
+        sigma=(0.1, 0.5),
+        seed=None,
+    ):
+        self.nominal = np.array(nominal, dtype=float).reshape(-1, 2)
+        self.dt = dt
+        self.cost = cost
+        self.noise = GaussianNoise(sigma, seed) if noise is None else noise
+        self.samples = samples
+        self.temperature = temperature
+        self.L = L
+        self.max_steering_angle = max_steering_angle
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.costs = None
+        self.weights = None
+        self.states = None
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    def __costs(self, state, controls):
+        K = len(controls)
+        if self.processes == 0 and (self.chunk_size is None or self.chunk_size >= K):
+            self.states = bicycle_rollouts(
+                state, controls, self.dt, self.L, self.max_steering_angle
+            )
+            return self.cost(self.states, controls)
+
+        self.states = None
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = -(-K // (self.processes or os.cpu_count()))
+        tasks = [
+            (state, controls[i : i + chunk_size], self.dt, self.L)
+            + (self.max_steering_angle, self.cost)
+            for i in range(0, K, chunk_size)
+        ]
+        if self.processes == 0:
+            return np.concatenate([_rollout_costs(task) for task in tasks])
+        if self._pool is None:
+            self._pool = Pool(self.processes)
+        return np.concatenate(self._pool.map(_rollout_costs, tasks))
+
+    def update(self, state) -> np.array:
+        """Run one MPPI iteration from state (x, y, theta, v) and return the
+        updated (T, 2) nominal control sequence.
+        """
+        state = np.asarray(state, dtype=float)
+        limit = self.max_steering_angle
+        T = len(self.nominal)
+
+        controls = self.nominal + self.noise(self.samples, T)
+        np.clip(controls[:, :, 0], -limit, limit, out=controls[:, :, 0])
+        costs = self.__costs(state, controls)
+        costs = np.where(np.isnan(costs), np.inf, costs)
+        self.costs = costs
+
+        beta = costs.min()
+        if not np.isfinite(beta):
+            self.weights = np.zeros(len(costs))
+            return self.nominal
+        weights = np.exp(-(costs - beta) / self.temperature)
+        weights /= weights.sum()
+        self.weights = weights
+
+        self.nominal += np.tensordot(weights, controls - self.nominal, axes=1)
+        np.clip(self.nominal[:, 0], -limit, limit, out=self.nominal[:, 0])
+        return self.nominal
+
+    def shift(self, steps=1):
+        """Drop the first steps controls after they were applied and repeat
+        the last control, to warm start the next update.
+
+        steps is clamped to the horizon, shifting by the whole horizon or
+        more fills every step with the last control.
+        """
+        if steps < 0:
+            raise ValueError("steps should not be negative")
+        steps = min(steps, len(self.nominal) - 1)
+        if steps == 0:
+            return
+        self.nominal[:-steps] = self.nominal[steps:]
+        self.nominal[-steps:] = self.nominal[-steps - 1]
@@ -0,0 +1,81 @@
+import numpy as np
+
+
+class PIDBank:
+    """N independent PID loops whose gains and states are stored in arrays.
+
+    kP, kI, kD: scalars or arrays of length n.
+
+    step follows PID.get_output channel by channel: the first call of a
+    channel only records its timestamp, and calls with dt <= 0 keep the
+    integral, the derivative and the timestamp of that channel unchanged.
+    A channel that has not been stepped yet has last_time NaN.
+    """
+
+    __slots__ = ("P", "I", "D", "kP", "kI", "kD", "output", "last_error", "last_time")
+
+    def __init__(self, n, kP=0.0, kI=0.0, kD=0.0):
+        self.P = np.zeros(n)
+        self.I = np.zeros(n)
+        self.D = np.zeros(n)
+
+        self.kP = np.broadcast_to(np.asarray(kP, dtype=float), (n,)).copy()
+        self.kI = np.broadcast_to(np.asarray(kI, dtype=float), (n,)).copy()
+        self.kD = np.broadcast_to(np.asarray(kD, dtype=float), (n,)).copy()
+
+        self.output = np.zeros(n)
+        self.last_error = np.zeros(n)
+        self.last_time = np.full(n, np.nan)
+
+    def __len__(self) -> int:
+        return self.P.shape[0]
+
+    def reset(self, mask=None):
+        """Reset the state of the channels selected by mask, or of all channels.
+        """
+        if mask is None:
+            mask = slice(None)
+        self.P[mask] = 0.0
+        self.I[mask] = 0.0
+        self.D[mask] = 0.0
+        self.output[mask] = 0.0
+        self.last_error[mask] = 0.0
+        self.last_time[mask] = np.nan
+
+    def __update(self, current_error, t):
+        """
+        current_error: the (n,) differences between the setpoints and
+            the measured process variables.
+        t: the sampling timestamp in seconds, a scalar or an (n,) array.
+        """
+        current_error = np.broadcast_to(current_error, self.P.shape)
+        t = np.broadcast_to(np.asarray(t, dtype=float), self.P.shape)
+
+        # same update order as PID.__update
+        self.P[:] = current_error
+        self.last_error[:] = current_error
+        first = np.isnan(self.last_time)
+        with np.errstate(invalid="ignore"):
+            dt = t - self.last_time
+            active = ~first & (dt > 0.0)
+
+        dt_active = dt[active]
+        error_active = current_error[active]
+        self.I[active] += error_active * dt_active
+        self.D[active] = (error_active - self.last_error[active]) / dt_active
+        self.last_time[first | active] = t[first | active]
+
+    def __compute_output(self):
+        np.multiply(self.kP, self.P, out=self.output)
+        self.output += self.kI * self.I
+        self.output += self.kD * self.D
+
+    def step(self, current_error, t) -> np.array:
+        """Step all channels and return a copy of the (n,) outputs, so the
+        outputs of earlier steps are not overwritten.
+        """
+        self.__update(current_error, t)
+        self.__compute_output()
+        return self.output.copy()
+
+    get_output = step
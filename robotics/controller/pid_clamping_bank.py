@@ -0,0 +1,121 @@
+import numpy as np
+
+
+class PIDClampingBank:
+    """N independent anti-windup PID loops whose gains, limits and states
+    are stored in arrays.
+
+    kP, kI, kD, max_output, min_output: scalars or arrays of length n.
+    min_output defaults to -max_output per channel.
+
+    step follows PIDClamping.get_output channel by channel, the integrator
+    rollback is applied with a mask to every channel whose output saturates
+    or has the same sign as its error.
+    """
+
+    __slots__ = (
+        "P",
+        "I",
+        "D",
+        "kP",
+        "kI",
+        "kD",
+        "output",
+        "last_error",
+        "last_time",
+        "last_I",
+        "delta_I",
+        "max_output",
+        "min_output",
+        "dt",
+    )
+
+    def __init__(self, n, kP=0.0, kI=0.0, kD=0.0, max_output=np.inf, min_output=None):
+        self.P = np.zeros(n)
+        self.I = np.zeros(n)
+        self.D = np.zeros(n)
+
+        self.kP = np.broadcast_to(np.asarray(kP, dtype=float), (n,)).copy()
+        self.kI = np.broadcast_to(np.asarray(kI, dtype=float), (n,)).copy()
+        self.kD = np.broadcast_to(np.asarray(kD, dtype=float), (n,)).copy()
+
+        self.last_I = np.zeros(n)
+        self.delta_I = np.zeros(n)
+
+        self.max_output = np.broadcast_to(
+            np.asarray(max_output, dtype=float), (n,)
+        ).copy()
+        if min_output is None:
+            self.min_output = -self.max_output
+        else:
+            self.min_output = np.broadcast_to(
+                np.asarray(min_output, dtype=float), (n,)
+            ).copy()
+
+        self.output = np.zeros(n)
+        self.last_error = np.zeros(n)
+        self.last_time = np.full(n, np.nan)
+        self.dt = np.zeros(n)
+
+    def __len__(self) -> int:
+        return self.P.shape[0]
+
+    def reset(self, mask=None):
+        """Reset the state of the channels selected by mask, or of all channels.
+        """
+        if mask is None:
+            mask = slice(None)
+        self.P[mask] = 0.0
+        self.I[mask] = 0.0
+        self.D[mask] = 0.0
+        self.last_I[mask] = 0.0
+        self.delta_I[mask] = 0.0
+        self.output[mask] = 0.0
+        self.last_error[mask] = 0.0
+        self.last_time[mask] = np.nan
+        self.dt[mask] = 0.0
+
+    def __update(self, current_error, t):
+        """
+        current_error: the (n,) differences between the setpoints and
+            the measured process variables.
+        t: the sampling timestamp in seconds, a scalar or an (n,) array.
+        """
+        current_error = np.broadcast_to(current_error, self.P.shape)
+        t = np.broadcast_to(np.asarray(t, dtype=float), self.P.shape)
+
+        # same update order as PIDClamping.__update
+        self.P[:] = current_error
+        self.last_error[:] = current_error
+        first = np.isnan(self.last_time)
+        self.dt[~first] = t[~first] - self.last_time[~first]
+        active = ~first & (self.dt > 0.0)
+
+        dt_active = self.dt[active]
+        error_active = current_error[active]
+        self.last_I[active] = self.I[active]
+        self.delta_I[active] = error_active * dt_active
+        self.I[active] += self.delta_I[active]
+        self.D[active] = (error_active - self.last_error[active]) / dt_active
+        self.last_time[first | active] = t[first | active]
+
+    def __compute_output(self):
+        u = self.kP * self.P + self.kI * self.I + self.kD * self.D
+        rollback = (
+            (u > self.max_output)
+            | (u < self.min_output)
+            | (np.sign(u) == np.sign(self.P))
+        )
+        self.I[rollback] = self.last_I[rollback]
+        u[rollback] -= self.kI[rollback] * self.delta_I[rollback]
+        self.output[:] = u
+
+    def step(self, current_error, t) -> np.array:
+        """Step all channels and return a copy of the (n,) outputs, so the
+        outputs of earlier steps are not overwritten.
+        """
+        self.__update(current_error, t)
+        self.__compute_output()
+        return self.output.copy()
+
+    get_output = step
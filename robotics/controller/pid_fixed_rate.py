@@ -0,0 +1,87 @@
+import numpy as np
+
+
+class PIDFixedRate:
+    """A PID controller for loops running at a known, fixed sample period,
+    written in incremental (velocity) form
+
+        u[k] = u[k-1] + q0 e[k] + q1 e[k-1] + q2 e[k-2]
+
+        q0 = kP + kI Ts + kD / Ts
+        q1 = -kP - 2 kD / Ts
+        q2 = kD / Ts
+
+    which equals the positional form kP e[k] + kI Ts Σ e + kD (e[k] - e[k-1]) / Ts
+    with e[-1] = e[-2] = 0. The coefficients are computed once, so a step is
+    three multiply-adds and no timestamp bookkeeping.
+
+    sample_time: the fixed sample period Ts in seconds.
+    max_output, min_output: the output is clamped to these limits, which in
+        the incremental form also stops the integrator from winding up.
+    """
+
+    __slots__ = (
+        "kP",
+        "kI",
+        "kD",
+        "sample_time",
+        "max_output",
+        "min_output",
+        "q0",
+        "q1",
+        "q2",
+        "e1",
+        "e2",
+        "output",
+    )
+
+    def __init__(
+        self, sample_time, kP=0.0, kI=0.0, kD=0.0, max_output=np.inf, min_output=None
+    ):
+        if sample_time <= 0.0:
+            raise ValueError("sample_time should be positive")
+        self.sample_time = sample_time
+        self.max_output = max_output
+        if min_output is None:
+            self.min_output = -max_output
+        else:
+            self.min_output = min_output
+        self.set_gains(kP, kI, kD)
+        self.reset()
+
+    def set_gains(self, kP, kI, kD):
+        """Change the gains and recompute the discrete coefficients,
+        the controller state is kept.
+        """
+        self.kP = kP
+        self.kI = kI
+        self.kD = kD
+        Ts = self.sample_time
+        self.q0 = kP + kI * Ts + kD / Ts
+        self.q1 = -kP - 2.0 * kD / Ts
+        self.q2 = kD / Ts
+
+    def reset(self, output=0.0):
+        self.e1 = 0.0
+        self.e2 = 0.0
+        self.output = output
+
+    def step(self, current_error):
+        """
+        current_error: the difference between a desired setpoint SP and
+            a measured process variable PV, sampled every sample_time.
+        """
+        u = (
+            self.output
+            + self.q0 * current_error
+            + self.q1 * self.e1
+            + self.q2 * self.e2
+        )
+        if u > self.max_output:
+            u = self.max_output
+        elif u < self.min_output:
+            u = self.min_output
+        self.e2 = self.e1
+        self.e1 = current_error
+        self.output = u
+        return u
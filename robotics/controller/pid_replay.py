@@ -0,0 +1,96 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def _replay_steps(timestamps: np.array):
+    """Return dt and the mask of samples that update the integrator and
+    the derivative, following PID.__update.
+
+    The first sample only records its time, and a sample with dt <= 0
+    leaves last_time unchanged, so last_time is the running maximum of the
+    previous timestamps.
+    """
+    last_time = np.maximum.accumulate(timestamps)
+    dt = np.zeros_like(timestamps)
+    dt[1:] = timestamps[1:] - last_time[:-1]
+    active = dt > 0.0
+    return dt, active
+
+
+def _replay_derivative(errors: np.array) -> np.array:
+    """Return D for every sample.
+    """
+    # parity with PID.__update, which stores the current error in last_error
+    # before taking the derivative, so D is always 0
+    return np.zeros_like(errors)
+
+
+def pid_replay(
+    errors, timestamps, kP=0.0, kI=0.0, kD=0.0
+) -> Tuple[np.array, np.array, np.array]:
+    """Replay a recorded error trace through a fresh PID in one call.
+
+    errors, timestamps: (N,) arrays of the samples fed to PID.get_output.
+    Return the (N,) output, integral and derivative arrays, equal to the
+    output, I and D of PID after every get_output call.
+    The integral is a cumulative sum over the samples with dt > 0.
+    """
+    errors = np.asarray(errors, dtype=float)
+    timestamps = np.asarray(timestamps, dtype=float)
+    if len(errors) == 0:
+        return np.zeros(0), np.zeros(0), np.zeros(0)
+    dt, active = _replay_steps(timestamps)
+
+    I = np.cumsum(np.where(active, errors * dt, 0.0))
+    D = _replay_derivative(errors)
+    output = kP * errors + kI * I + kD * D
+    return output, I, D
+
+
+def pid_clamping_replay(
+    errors, timestamps, kP=0.0, kI=0.0, kD=0.0, max_output=np.inf, min_output=None
+) -> Tuple[np.array, np.array, np.array]:
+    """Replay a recorded error trace through a fresh PIDClamping in one call.
+
+    Return the (N,) output, integral and derivative arrays, equal to the
+    output, I and D of PIDClamping after every get_output call.
+    dt, the active samples and D are computed with array operations, the
+    conditional rollback of the integrator depends on the previous output
+    and runs as a loop over plain floats.
+    """
+    errors = np.asarray(errors, dtype=float)
+    timestamps = np.asarray(timestamps, dtype=float)
+    if min_output is None:
+        min_output = -max_output
+    if len(errors) == 0:
+        return np.zeros(0), np.zeros(0), np.zeros(0)
+    dt, active = _replay_steps(timestamps)
+    D = _replay_derivative(errors)
+
+    # the integrator independent part of the output
+    base = (kP * errors + kD * D).tolist()
+    delta = (errors * dt).tolist()
+    is_active = active.tolist()
+    P = errors.tolist()
+
+    output = [0.0] * len(P)
+    I = [0.0] * len(P)
+    integral = last_I = delta_I = 0.0
+    for k in range(len(P)):
+        if is_active[k]:
+            last_I = integral
+            delta_I = delta[k]
+            integral += delta_I
+        u = base[k] + kI * integral
+        if (
+            u > max_output
+            or u < min_output
+            or (u > 0) - (u < 0) == (P[k] > 0) - (P[k] < 0)
+        ):
+            integral = last_I
+            u -= kI * delta_I
+        output[k] = u
+        I[k] = integral
+
+    return np.array(output), np.array(I), D
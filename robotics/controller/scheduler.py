@@ -0,0 +1,264 @@
+import asyncio
+import bisect
+import heapq
+import itertools
+import time
+
+import numpy as np
+
+
+class MonotonicClock:
+    """Wall clock based on time.monotonic, tasks really sleep until release.
+    """
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    async def sleep_until(self, t: float):
+        await asyncio.sleep(max(0.0, t - self.now()))
+
+    def task_started(self):
+        pass
+
+    def task_finished(self):
+        pass
+
+
+class SimulatedClock:
+    """Virtual clock that runs the scheduler as fast as possible.
+
+    Time only advances when every running task is waiting for its next
+    release, it then jumps to the earliest pending release. Task bodies
+    take zero simulated time, so latency and jitter only come from the
+    scheduling itself, which makes runs deterministic and usable in tests.
+    """
+
+    def __init__(self, start=0.0):
+        self.time = start
+        self.__waiters = []
+        self.__running = 0
+        self.__counter = itertools.count()
+
+    def now(self) -> float:
+        return self.time
+
+    async def sleep_until(self, t: float):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.__waiters, (t, next(self.__counter), future))
+        self.__advance()
+        await future
+
+    def task_started(self):
+        self.__running += 1
+
+    def task_finished(self):
+        self.__running -= 1
+        self.__advance()
+
+    def __advance(self):
+        if self.__waiters and len(self.__waiters) >= self.__running:
+            t, _, future = heapq.heappop(self.__waiters)
+            self.time = max(self.time, t)
+            future.set_result(None)
+
+
+class Histogram:
+    """Counts of values falling into fixed bins, values above the last edge
+    are counted in the last bin.
+    """
+
+    __slots__ = ("edges", "counts", "count", "total", "max")
+
+    def __init__(self, edges):
+        self.edges = list(edges)
+        self.counts = [0] * (len(self.edges) - 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float):
+        idx = bisect.bisect_right(self.edges, value) - 1
+        self.counts[min(max(idx, 0), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Return the upper edge of the bin containing the q quantile.
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for upper, c in zip(self.edges[1:], self.counts):
+            cumulative += c
+            if cumulative >= target:
+                return upper
+        return self.edges[-1]
+
+
+class TaskStats:
+    """Timing instrumentation of one periodic task.
+
+    latency: start time minus release time.
+    jitter: absolute deviation of the interval between two starts from the period.
+    execution: time spent in the task body.
+    overruns: the number of releases missed after every run because the
+        task finished after its next release, in bins of one release.
+        overruns.total is the number of missed releases and overruns.max
+        the longest burst.
+    """
+
+    __slots__ = ("name", "period", "latency", "jitter", "execution", "overruns")
+
+    def __init__(self, name, period, bins=50):
+        self.name = name
+        self.period = period
+        edges = np.linspace(0.0, 2 * period, bins + 1)
+        self.latency = Histogram(edges)
+        self.jitter = Histogram(edges)
+        self.execution = Histogram(edges)
+        self.overruns = Histogram(np.arange(bins + 1))
+
+    def summary(self) -> dict:
+        return {
+            "name": self.name,
+            "period": self.period,
+            "runs": self.latency.count,
+            "latency_mean": self.latency.mean(),
+            "latency_p99": self.latency.quantile(0.99),
+            "latency_max": self.latency.max,
+            "jitter_mean": self.jitter.mean(),
+            "jitter_max": self.jitter.max,
+            "execution_mean": self.execution.mean(),
+            "execution_max": self.execution.max,
+            "overruns": int(self.overruns.total),
+            "overruns_max": int(self.overruns.max),
+        }
+
+
+class Scheduler:
+    """Drive PID loops, model updates and other callbacks at fixed periods
+    from one asyncio event loop.
+
+    clock: MonotonicClock for real time, SimulatedClock to run faster than
+        real time.
+    """
+
+    def __init__(self, clock=None):
+        self.clock = MonotonicClock() if clock is None else clock
+        self.stats = {}
+        self.__tasks = []
+        self.__start = 0.0
+
+    def add_task(self, callback, period, name=None, offset=0.0):
+        """Call callback(t) every period seconds, callback may be a
+        coroutine function. offset delays the first release.
+        """
+        if period <= 0.0:
+            raise ValueError("period should be positive")
+        if name is None:
+            name = "task{}".format(len(self.__tasks))
+        if name in self.stats:
+            raise ValueError("task {} already exists".format(name))
+        self.stats[name] = TaskStats(name, period)
+        self.__tasks.append((name, callback, period, offset))
+        return self.stats[name]
+
+    def add_controller(self, controller, period, error_fn, output_fn=None, **kwargs):
+        """Step a PID or PIDClamping every period.
+
+        error_fn(t) returns the current error, output_fn(output) receives
+        the controller output.
+        """
+
+        def step(t):
+            output = controller.get_output(error_fn(t), t)
+            if output_fn is not None:
+                output_fn(output)
+
+        return self.add_task(step, period, **kwargs)
+
+    def add_model(
+        self,
+        model,
+        period,
+        command_fn,
+        method="update_Euler_by_omega_and_accel",
+        **kwargs
+    ):
+        """Update a UnicycleModel or BicycleModel every period.
+
+        command_fn(t) returns the command tuple of the update method,
+        e.g. (omega, accel), and dt is the time since the previous update.
+        """
+        update = getattr(model, method)
+        last = []
+
+        def step(t):
+            dt = t - last[0] if last else period
+            last[:] = [t]
+            update(*command_fn(t), dt)
+
+        return self.add_task(step, period, **kwargs)
+
+    async def __run_task(self, name, callback, period, offset, end):
+        clock = self.clock
+        stats = self.stats[name]
+        is_coroutine = asyncio.iscoroutinefunction(callback)
+        # releases are counted instead of accumulated to avoid drift
+        first_release = self.__start + offset
+        k = 0
+        release = first_release
+        last_start = None
+        try:
+            while release < end:
+                await clock.sleep_until(release)
+                start = clock.now()
+                stats.latency.record(start - release)
+                if last_start is not None:
+                    stats.jitter.record(abs(start - last_start - period))
+                last_start = start
+
+                if is_coroutine:
+                    await callback(start)
+                else:
+                    callback(start)
+
+                finish = clock.now()
+                stats.execution.record(finish - start)
+                k += 1
+                release = first_release + k * period
+                missed = 0
+                if finish > release:
+                    missed = int((finish - release) // period) + 1
+                    k += missed
+                    release = first_release + k * period
+                stats.overruns.record(missed)
+        finally:
+            clock.task_finished()
+
+    async def run(self, duration):
+        """Run all registered tasks for duration seconds of clock time.
+        """
+        self.__start = self.clock.now()
+        end = self.__start + duration
+        # every task counts as running before any of them starts waiting
+        for _ in self.__tasks:
+            self.clock.task_started()
+        await asyncio.gather(*(self.__run_task(*task, end) for task in self.__tasks))
+
+    def run_sync(self, duration):
+        """Run the scheduler in a new event loop until duration has elapsed.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.run(duration))
+        finally:
+            loop.close()
+
+    def summary(self) -> list:
+        return [stats.summary() for stats in self.stats.values()]
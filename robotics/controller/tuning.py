@@ -0,0 +1,294 @@
+import itertools
+import json
+import os
+import sys
+from multiprocessing import Pool
+from typing import Dict, List
+
+import numpy as np
+
+from ..model import BicycleModel
+from ..pose import wrap_2_pi
+from ..utils import calc_spline_course
+from .pid import PID
+from .pid_clamping import PIDClamping
+
+
+class PathFollowingScenario:
+    """A closed-loop BicycleModel path following scenario for gain tuning.
+
+    cx, cy, cyaw: the reference path, e.g. from calc_spline_course.
+    speed: the constant forward speed.
+    dt: the control and integration period.
+    L, max_steering_angle: the BicycleModel parameters.
+    heading_gain: the steering error is the heading error plus
+        arctan2(heading_gain * cross_track_error, speed), as in the
+        Stanley controller, and is fed to the PID that outputs the
+        steering angle.
+    max_output: use PIDClamping with this output limit instead of PID.
+    max_time: the rollout stops after this time even if the goal is missed.
+    """
+
+    def __init__(
+        self,
+        cx,
+        cy,
+        cyaw,
+        speed=3.0,
+        dt=0.05,
+        L=2.5,
+        max_steering_angle=np.pi / 4,
+        heading_gain=1.0,
+        max_output=None,
+        max_time=None,
+        x0=None,
+        y0=None,
+        theta0=None,
+    ):
+        self.cx = np.asarray(cx, dtype=float)
+        self.cy = np.asarray(cy, dtype=float)
+        self.cyaw = np.asarray(cyaw, dtype=float)
+        self.speed = speed
+        self.dt = dt
+        self.L = L
+        self.max_steering_angle = max_steering_angle
+        self.heading_gain = heading_gain
+        self.max_output = max_output
+        if max_time is None:
+            length = np.sum(np.hypot(np.diff(self.cx), np.diff(self.cy)))
+            max_time = 2 * length / speed
+        self.max_time = max_time
+        self.x0 = self.cx[0] if x0 is None else x0
+        self.y0 = self.cy[0] if y0 is None else y0
+        self.theta0 = self.cyaw[0] if theta0 is None else theta0
+
+    @classmethod
+    def from_waypoints(cls, x, y, ds=0.1, **kwargs):
+        cx, cy, cyaw, _, _ = calc_spline_course(x, y, ds=ds)
+        return cls(cx, cy, cyaw, **kwargs)
+
+    def rollout(self, kP, kI, kD) -> Dict[str, np.array]:
+        """Run the closed loop with the given gains and return the
+        time, cross_track_error, heading_error and steering histories
+        together with the fraction of the path that was completed.
+        """
+        if self.max_output is None:
+            controller = PID(kP, kI, kD)
+        else:
+            controller = PIDClamping(kP, kI, kD, max_output=self.max_output)
+        model = BicycleModel(
+            x=self.x0,
+            y=self.y0,
+            theta=self.theta0,
+            L=self.L,
+            v=self.speed,
+            max_steering_angle=self.max_steering_angle,
+        )
+
+        n_steps = int(np.ceil(self.max_time / self.dt))
+        last = len(self.cx) - 1
+        cross_track = np.zeros(n_steps)
+        heading = np.zeros(n_steps)
+        steering = np.zeros(n_steps)
+        index = 0
+        step = 0
+        while step < n_steps and index < last:
+            # search the nearest reference point ahead of the previous one
+            window = slice(index, min(index + 50, last + 1))
+            dx = model.x - self.cx[window]
+            dy = model.y - self.cy[window]
+            index += int(np.argmin(dx ** 2 + dy ** 2))
+
+            yaw = self.cyaw[index]
+            # positive when the path is on the left of the vehicle
+            e = np.sin(yaw) * (model.x - self.cx[index]) - np.cos(yaw) * (
+                model.y - self.cy[index]
+            )
+            heading_error = wrap_2_pi(yaw - model.theta)
+            error = heading_error + np.arctan2(self.heading_gain * e, self.speed)
+
+            phi = controller.get_output(error, step * self.dt)
+            model.update_Euler_by_phi_and_accel(phi, 0.0, self.dt)
+
+            cross_track[step] = e
+            heading[step] = heading_error
+            steering[step] = model.phi
+            step += 1
+
+        return {
+            "time": np.arange(step) * self.dt,
+            "cross_track_error": cross_track[:step],
+            "heading_error": heading[:step],
+            "steering": steering[:step],
+            "completion": index / last,
+        }
+
+
+def rms_cross_track_error(result) -> float:
+    return float(np.sqrt(np.mean(result["cross_track_error"] ** 2)))
+
+
+def max_cross_track_error(result) -> float:
+    return float(np.max(np.abs(result["cross_track_error"])))
+
+
+def rms_heading_error(result) -> float:
+    return float(np.sqrt(np.mean(result["heading_error"] ** 2)))
+
+
+def steering_rate(result) -> float:
+    """The root mean square steering angle rate, penalizing chattering gains.
+    """
+    if len(result["time"]) < 2:
+        return 0.0
+    rate = np.diff(result["steering"]) / np.diff(result["time"])
+    return float(np.sqrt(np.mean(rate ** 2)))
+
+
+def incompletion(result) -> float:
+    return 1.0 - result["completion"]
+
+
+DEFAULT_METRICS = {
+    "rms_cross_track_error": rms_cross_track_error,
+    "max_cross_track_error": max_cross_track_error,
+    "steering_rate": steering_rate,
+    "incompletion": incompletion,
+}
+
+DEFAULT_WEIGHTS = {
+    "rms_cross_track_error": 1.0,
+    "max_cross_track_error": 0.5,
+    "steering_rate": 0.01,
+    "incompletion": 10.0,
+}
+
+
+def gain_grid(kP=(0.0,), kI=(0.0,), kD=(0.0,)) -> np.array:
+    """Return the (M, 3) cartesian product of the candidate gains.
+    """
+    return np.array(list(itertools.product(kP, kI, kD)), dtype=float).reshape(-1, 3)
+
+
+def random_gains(n, kP=(0.0, 1.0), kI=(0.0, 0.0), kD=(0.0, 0.0), seed=None):
+    """Return (n, 3) gains sampled uniformly from the (low, high) ranges.
+    """
+    rng = np.random.RandomState(seed)
+    low, high = np.array([kP, kI, kD], dtype=float).T
+    return rng.uniform(low, high, (n, 3))
+
+
+def print_progress(done: int, total: int):
+    sys.stderr.write("\r{}/{} rollouts".format(done, total))
+    if done == total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+def _evaluate(args):
+    """Roll out one gain set in a worker and return only the metric values,
+    so the histories never cross the process boundary.
+    """
+    scenario, metrics, gains = args
+    row = {"kP": gains[0], "kI": gains[1], "kD": gains[2]}
+    try:
+        result = scenario.rollout(*gains)
+        for name, metric in metrics.items():
+            row[name] = metric(result)
+    except Exception as e:
+        row["error"] = repr(e)
+    return row
+
+
+def tune_gains(
+    scenario,
+    gains,
+    metrics=None,
+    weights=None,
+    processes=None,
+    chunksize=1,
+    progress=None,
+    checkpoint=None,
+) -> List[dict]:
+    """Evaluate every gain set of gains on scenario and rank them by cost.
+
+    scenario: an object with a picklable rollout(kP, kI, kD) method,
+        e.g. PathFollowingScenario.
+    gains: (M, 3) kP, kI, kD rows, see gain_grid and random_gains.
+    metrics: a dict of name to picklable function(rollout result) -> float,
+        DEFAULT_METRICS by default.
+    weights: a dict of name to weight, the cost is the weighted sum of the
+        metrics. Metrics without a weight are reported but not scored, a
+        weight of an unknown metric raises ValueError. DEFAULT_WEIGHTS with
+        the default metrics, and a weight of 1.0 for every custom metric.
+    processes: the size of the process pool, 0 evaluates in this process
+        and None uses os.cpu_count().
+    progress: a callable progress(done, total), e.g. print_progress.
+    checkpoint: a JSON lines file that every finished rollout is appended to.
+        Gain sets already present in it are not evaluated again, so an
+        interrupted sweep resumes where it stopped.
+
+    Return a list of dicts with the gains, the metric values and the cost,
+    sorted by increasing cost. Failed or diverged rollouts cost inf.
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS if metrics is None else dict.fromkeys(metrics, 1.0)
+    if metrics is None:
+        metrics = DEFAULT_METRICS
+    unknown = sorted(set(weights) - set(metrics))
+    if unknown:
+        raise ValueError(
+            "weights of unknown metrics {}, the metrics are {}".format(
+                unknown, sorted(metrics)
+            )
+        )
+    gains = np.asarray(gains, dtype=float).reshape(-1, 3)
+
+    rows = {}
+    if checkpoint is not None and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    rows[(row["kP"], row["kI"], row["kD"])] = row
+
+    pending = [g for g in map(tuple, gains.tolist()) if g not in rows]
+    total = len(gains)
+    done = total - len(pending)
+    if progress is not None:
+        progress(done, total)
+
+    tasks = ((scenario, metrics, g) for g in pending)
+    log = open(checkpoint, "a") if checkpoint is not None else None
+    pool = Pool(processes) if processes != 0 and pending else None
+    try:
+        results = (
+            map(_evaluate, tasks)
+            if pool is None
+            else pool.imap_unordered(_evaluate, tasks, chunksize)
+        )
+        for row in results:
+            rows[(row["kP"], row["kI"], row["kD"])] = row
+            if log is not None:
+                log.write(json.dumps(row) + "\n")
+                log.flush()
+            done += 1
+            if progress is not None:
+                progress(done, total)
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if log is not None:
+            log.close()
+
+    ranked = []
+    for g in map(tuple, gains.tolist()):
+        row = dict(rows[g])
+        if "error" in row:
+            row["cost"] = np.inf
+        else:
+            cost = sum(w * row[name] for name, w in weights.items())
+            row["cost"] = cost if np.isfinite(cost) else np.inf
+        ranked.append(row)
+    ranked.sort(key=lambda row: row["cost"])
+    return ranked
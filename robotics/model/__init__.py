@@ -1 +1,5 @@
+from .batch import *
+from .columnar_log import *
+from .fleet import *
+from .history import *
 from .wheeled_mobile_robot import *
@@ -0,0 +1,215 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class BatchResult:
+    """The recorded states of every scenario of run_batch.
+
+    data: the (S, len(columns), max_steps) float64 results, in shared memory
+        when the batch ran in a process pool. Copy what you keep before close.
+    lengths: the (S,) number of steps recorded by every scenario.
+    wall_time: the (S,) seconds spent in every simulation, NaN if it failed.
+    errors: the error message of every failed scenario, None otherwise.
+    elapsed: the wall time of the whole batch.
+    """
+
+    __slots__ = (
+        "columns",
+        "data",
+        "lengths",
+        "wall_time",
+        "errors",
+        "elapsed",
+        "_shm",
+    )
+
+    def __init__(self, columns, data, shm=None):
+        self.columns = tuple(columns)
+        self.data = data
+        self.lengths = np.zeros(len(data), dtype=int)
+        self.wall_time = np.full(len(data), np.nan)
+        self.errors = [None] * len(data)
+        self.elapsed = 0.0
+        self._shm = shm
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def result(self, i) -> dict:
+        """Return the recorded columns of scenario i as zero-copy views.
+        """
+        n = self.lengths[i]
+        return {name: self.data[i, j, :n] for j, name in enumerate(self.columns)}
+
+    def failed(self) -> list:
+        return [i for i, error in enumerate(self.errors) if error is not None]
+
+    def summary(self) -> dict:
+        ok = ~np.isnan(self.wall_time)
+        rate = 1.0 / self.elapsed if self.elapsed else 0.0
+        return {
+            "scenarios": len(self),
+            "failed": len(self.failed()),
+            "elapsed": self.elapsed,
+            "scenarios_per_second": len(self) * rate,
+            "steps_per_second": int(self.lengths.sum()) * rate,
+            "wall_time_mean": float(self.wall_time[ok].mean()) if ok.any() else 0.0,
+            "wall_time_max": float(self.wall_time[ok].max()) if ok.any() else 0.0,
+        }
+
+    def close(self):
+        """Release the shared memory, the results are no longer available.
+        """
+        self.data = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                # views returned by result are still alive, the memory is
+                # freed once they are gone
+                pass
+            self._shm.unlink()
+            self._shm = None
+
+
+def _scenario_rows(scenarios) -> list:
+    """Return the scenario table as a list of dicts, scenarios is either a
+    sequence of dicts or a dict of equally long columns.
+    """
+    if isinstance(scenarios, dict):
+        keys = list(scenarios)
+        return [dict(zip(keys, values)) for values in zip(*scenarios.values())]
+    return list(scenarios)
+
+
+def _run_chunk(args) -> list:
+    """Run the scenarios of one chunk, writing their states straight into
+    the shared result array, and return only the lengths, times and errors.
+    """
+    simulate, target, shape, indices, scenarios = args
+    shm = None
+    if isinstance(target, str):
+        # the workers share the resource tracker of the parent, which
+        # unlinks the block in BatchResult.close
+        shm = shared_memory.SharedMemory(name=target)
+        data = np.ndarray(shape, buffer=shm.buf)
+    else:
+        data = target
+
+    rows = []
+    for i, scenario in zip(indices, scenarios):
+        start = time.perf_counter()
+        try:
+            n = int(simulate(scenario, data[i]))
+            if not 0 <= n <= shape[2]:
+                raise ValueError("{} steps exceed max_steps {}".format(n, shape[2]))
+            rows.append((i, n, time.perf_counter() - start, None))
+        except Exception as e:
+            rows.append((i, 0, np.nan, repr(e)))
+
+    del data
+    if shm is not None:
+        shm.close()
+    return rows
+
+
+def _run_pool(tasks, processes, record) -> list:
+    """Run the tasks in a process pool, return the tasks lost with a worker
+    process that died.
+    """
+    lost = []
+    with ProcessPoolExecutor(processes) as executor:
+        futures = {executor.submit(_run_chunk, task): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                record(future.result())
+            except BrokenProcessPool:
+                lost.append(futures[future])
+            except Exception as e:
+                _, _, _, indices, _ = futures[future]
+                record([(i, 0, np.nan, repr(e)) for i in indices])
+    return lost
+
+
+def run_batch(
+    simulate,
+    scenarios,
+    columns,
+    max_steps,
+    processes=None,
+    chunksize=1,
+    progress=None,
+) -> BatchResult:
+    """Run independent simulations of a scenario table in a process pool.
+
+    simulate: a picklable simulate(scenario, out) -> int. It runs one
+        scenario, records its states into out, the (len(columns), max_steps)
+        slice of the shared result array, e.g. through
+        ColumnarHistory(out=out), and returns the number of recorded steps.
+    scenarios: a sequence of dicts, or a dict of equally long columns,
+        e.g. start poses, L, max_steering_angle and controller gains.
+    processes: the size of the process pool, 0 runs in this process and
+        None uses os.cpu_count().
+    chunksize: the number of scenarios sent to a worker at once.
+    progress: a callable progress(done, total).
+
+    Only the step counts, wall times and errors are pickled back. A scenario
+    raising an exception is reported in errors and the batch continues. When
+    a worker process dies, its scenarios are run again one at a time in a
+    fresh process so the failing one can be told apart.
+    """
+    scenarios = _scenario_rows(scenarios)
+    shape = (len(scenarios), len(columns), max_steps)
+    shm = None
+    if processes == 0:
+        data = np.zeros(shape)
+    else:
+        size = max(1, int(np.prod(shape)) * 8)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        data = np.ndarray(shape, buffer=shm.buf)
+        data[:] = 0.0
+    result = BatchResult(columns, data, shm)
+
+    done = [0]
+
+    def record(rows):
+        for i, n, wall_time, error in rows:
+            result.lengths[i] = n
+            result.wall_time[i] = wall_time
+            result.errors[i] = error
+        done[0] += len(rows)
+        if progress is not None:
+            progress(done[0], len(scenarios))
+
+    target = data if shm is None else shm.name
+    chunksize = max(1, chunksize)
+    tasks = [
+        (simulate, target, shape, indices, [scenarios[i] for i in indices])
+        for indices in (
+            list(range(k, min(k + chunksize, len(scenarios))))
+            for k in range(0, len(scenarios), chunksize)
+        )
+    ]
+
+    start = time.perf_counter()
+    if shm is None:
+        for task in tasks:
+            record(_run_chunk(task))
+    else:
+        for _, _, _, indices, rows in _run_pool(tasks, processes, record):
+            for i, scenario in zip(indices, rows):
+                task = (simulate, target, shape, [i], [scenario])
+                if _run_pool([task], 1, record):
+                    record([(i, 0, np.nan, "worker process died")])
+    result.elapsed = time.perf_counter() - start
+    return result
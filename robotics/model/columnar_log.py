@@ -0,0 +1,200 @@
+import json
+import os
+
+import numpy as np
+
+from .history import History
+
+MAGIC = b"RBTLOG1\n"
+HEADER_ALIGNMENT = 64
+
+
+class LogWriter:
+    """Stream fixed-width float64 records to a columnar log file.
+
+    The file starts with MAGIC and a JSON header describing the columns,
+    padded to a multiple of HEADER_ALIGNMENT bytes, followed by little endian
+    float64 records of len(columns) values each. Rows are buffered and
+    written chunk_size at a time, a partially written last record left by a
+    crash is ignored by LogReader.
+
+    rows: the number of rows appended so far, buffered ones included.
+    """
+
+    __slots__ = ("path", "columns", "chunk_size", "rows", "_file", "_buffer", "_size")
+
+    def __init__(self, path, columns, chunk_size=4096, time_column="time"):
+        self.path = path
+        self.columns = tuple(columns)
+        self.chunk_size = max(1, chunk_size)
+        if time_column not in self.columns:
+            time_column = None
+        header = {"columns": self.columns, "dtype": "<f8", "time": time_column}
+        header = MAGIC + json.dumps(header).encode() + b"\n"
+        header += b" " * (-len(header) % HEADER_ALIGNMENT)
+
+        self._file = open(path, "wb")
+        self._file.write(header)
+        self._buffer = np.empty((self.chunk_size, len(self.columns)), dtype="<f8")
+        self._size = 0
+        self.rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(self, row):
+        self._buffer[self._size] = row
+        self._size += 1
+        self.rows += 1
+        if self._size == self.chunk_size:
+            self.flush()
+
+    def extend(self, rows):
+        """Append the rows of a (T, len(columns)) array.
+        """
+        rows = np.asarray(rows, dtype="<f8")
+        self.rows += len(rows)
+        free = self.chunk_size - self._size
+        if len(rows) < free:
+            self._buffer[self._size : self._size + len(rows)] = rows
+            self._size += len(rows)
+            return
+        self._buffer[self._size :] = rows[:free]
+        self._size = self.chunk_size
+        self.flush()
+        rest = np.ascontiguousarray(rows[free:])
+        whole = len(rest) - len(rest) % self.chunk_size
+        self._file.write(rest[:whole])
+        self._buffer[: len(rest) - whole] = rest[whole:]
+        self._size = len(rest) - whole
+
+    def flush(self):
+        if self._file.closed:
+            return
+        self._file.write(self._buffer[: self._size])
+        self._file.flush()
+        self._size = 0
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class LogReader:
+    """Read a log written by LogWriter through a read-only np.memmap.
+
+    data: the (N, len(columns)) records, column and time_slice return
+        views of it, nothing is copied into memory until it is used.
+    index_stride: every index_stride-th timestamp is kept in memory as a
+        sparse index, so time_slice only touches two blocks of the file.
+        The time column should be non-decreasing.
+    """
+
+    __slots__ = ("path", "columns", "time_column", "data", "index_stride", "_index")
+
+    def __init__(self, path, index_stride=1024):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError("{} is not a robotics log".format(path))
+            header = json.loads(f.readline())
+            offset = f.tell()
+        offset += -offset % HEADER_ALIGNMENT
+        self.columns = tuple(header["columns"])
+        self.time_column = header["time"]
+
+        width = 8 * len(self.columns)
+        n = (os.path.getsize(path) - offset) // width
+        if n > 0:
+            self.data = np.memmap(
+                path,
+                dtype=header["dtype"],
+                mode="r",
+                offset=offset,
+                shape=(n, len(self.columns)),
+            )
+        else:
+            self.data = np.empty((0, len(self.columns)))
+        self.index_stride = index_stride
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def column(self, name) -> np.array:
+        return self.data[:, self.columns.index(name)]
+
+    def __getitem__(self, name) -> np.array:
+        return self.column(name)
+
+    def __bound(self, t) -> int:
+        """Return the first row whose time is not before t.
+        """
+        time = self.column(self.time_column)
+        if self._index is None:
+            self._index = np.array(time[:: self.index_stride])
+        k = int(np.searchsorted(self._index, t))
+        lo = max(k - 1, 0) * self.index_stride
+        hi = min(k * self.index_stride, len(time))
+        return lo + int(np.searchsorted(time[lo:hi], t))
+
+    def time_slice(self, start=-np.inf, stop=np.inf) -> np.array:
+        """Return a view of the records with start <= time < stop.
+        """
+        if self.time_column is None:
+            raise ValueError("{} has no time column".format(self.path))
+        return self.data[self.__bound(start) : self.__bound(stop)]
+
+
+class LogHistory(History):
+    """Stream the recorded rows of a model to a LogWriter file instead of
+    keeping them in memory.
+
+    column flushes the buffered rows and returns a memory-mapped view of the
+    file, close() finishes the log. The LogReader is kept and only mapped
+    again once more rows were appended.
+    """
+
+    __slots__ = ("path", "chunk_size", "writer", "_reader")
+
+    def __init__(self, path, chunk_size=4096, decimation=1):
+        super().__init__(decimation)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.writer = None
+        self._reader = None
+
+    def _start(self):
+        self.close()
+        self._reader = None
+        self.writer = LogWriter(self.path, self.columns, self.chunk_size)
+
+    def _record(self, row):
+        self.writer.append(row)
+
+    def _extend(self, rows):
+        self.writer.extend(rows.T)
+
+    def _column(self, idx):
+        return self.reader().data[:, idx]
+
+    def reader(self, index_stride=1024) -> LogReader:
+        reader = self._reader
+        if (
+            reader is None
+            or len(reader) != self.writer.rows
+            or reader.index_stride != index_stride
+        ):
+            self.writer.flush()
+            reader = self._reader = LogReader(self.path, index_stride)
+        return reader
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+    def __len__(self) -> int:
+        return self.writer.rows
@@ -0,0 +1,200 @@
+import numpy as np
+
+
+def _state(value, n) -> np.array:
+    """Return a float64 (n,) copy of a scalar or per-vehicle value.
+    """
+    return np.array(np.broadcast_to(np.asarray(value, dtype=float), (n,)))
+
+
+class UnicycleFleet:
+    """N unicycle models stepped together, with the update_Euler_by_xxx
+    methods of UnicycleModel.
+
+    x, y, theta, omega, v: (N,) arrays, scalars are broadcast to every vehicle.
+    Commands and dt of the update_xxx functions may be scalars or (N,) arrays.
+    time: the (N,) time of every vehicle, they differ when dt does.
+    No history is recorded, read the state arrays after every update instead.
+    """
+
+    __slots__ = ("n", "x", "y", "theta", "omega", "v", "time", "_buffer")
+
+    def __init__(self, n, x=0.0, y=0.0, theta=0.0, omega=0.0, v=0.0):
+        self.n = n
+        self.x = _state(x, n)
+        self.y = _state(y, n)
+        self.theta = _state(theta, n)
+        self.omega = _state(omega, n)
+        self.v = _state(v, n)
+        self.time = np.zeros(n)
+        self._buffer = np.empty(n)
+
+    @classmethod
+    def from_models(cls, models):
+        """Build a fleet from the current state of UnicycleModel instances.
+        """
+        return cls(
+            len(models),
+            [m.x for m in models],
+            [m.y for m in models],
+            [m.theta for m in models],
+            [m.omega for m in models],
+            [m.v for m in models],
+        )
+
+    def __update_observation(self, dt):
+        buffer = self._buffer
+        np.multiply(self.v, dt, out=buffer)
+        self.x += np.cos(self.theta) * buffer
+        self.y += np.sin(self.theta) * buffer
+        self.time += dt
+
+    def update_Euler_by_omega_and_v(self, omega, v, dt):
+        """
+        omega: steering rate.
+        dt: the sampling period.
+        """
+        self.__update_observation(dt)
+        self.theta += omega * dt
+        self.v[:] = v
+
+    def update_Euler_by_omega_and_accel(self, omega, accel, dt):
+        """
+        omega: steering rate.
+        accel: acceleration.
+        dt: the sampling period.
+        """
+        self.__update_observation(dt)
+        self.theta += omega * dt
+        self.v += accel * dt
+
+    def update_Euler_by_alpha_and_accel(self, alpha, accel, dt):
+        """
+        alpha: steering angular acceleration.
+        accel: acceleration.
+        dt: the sampling period.
+        """
+        self.__update_observation(dt)
+        self.theta += self.omega * dt
+        self.omega += alpha * dt
+        self.v += accel * dt
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self):
+        return "UnicycleFleet of {} vehicles".format(self.n)
+
+
+class BicycleFleet:
+    """N bicycle models stepped together, with the update_Euler_by_xxx
+    methods of BicycleModel.
+
+    x, y, theta, phi, omega, v, L, max_steering_angle: (N,) arrays, scalars
+        are broadcast to every vehicle.
+    Commands and dt of the update_xxx functions may be scalars or (N,) arrays.
+    time: the (N,) time of every vehicle, they differ when dt does.
+    The steering angle is clipped to ±max_steering_angle of every vehicle.
+    """
+
+    __slots__ = (
+        "n",
+        "x",
+        "y",
+        "theta",
+        "phi",
+        "omega",
+        "v",
+        "L",
+        "max_steering_angle",
+        "time",
+        "_buffer",
+    )
+
+    def __init__(
+        self,
+        n,
+        x=0.0,
+        y=0.0,
+        theta=0.0,
+        L=1.0,
+        phi=0.0,
+        omega=0.0,
+        v=0.0,
+        max_steering_angle=np.pi / 2,
+    ):
+        self.n = n
+        self.x = _state(x, n)
+        self.y = _state(y, n)
+        self.theta = _state(theta, n)
+        self.phi = _state(phi, n)
+        self.omega = _state(omega, n)
+        self.v = _state(v, n)
+        self.L = _state(L, n)
+        self.max_steering_angle = _state(max_steering_angle, n)
+        self.time = np.zeros(n)
+        self._buffer = np.empty(n)
+
+    @classmethod
+    def from_models(cls, models):
+        """Build a fleet from the current state of BicycleModel instances.
+        """
+        return cls(
+            len(models),
+            [m.x for m in models],
+            [m.y for m in models],
+            [m.theta for m in models],
+            [m.L for m in models],
+            [m.phi for m in models],
+            [m.omega for m in models],
+            [m.v for m in models],
+            [m.max_steering_angle for m in models],
+        )
+
+    def __update_observation(self, phi, dt):
+        limit = self.max_steering_angle
+        np.clip(phi, -limit, limit, out=self.phi)
+        buffer = self._buffer
+        np.multiply(self.v, dt, out=buffer)
+        self.x += np.cos(self.theta) * buffer
+        self.y += np.sin(self.theta) * buffer
+        buffer *= np.tan(self.phi)
+        buffer /= self.L
+        self.theta += buffer
+        self.time += dt
+
+    def update_Euler_by_phi_and_accel(self, phi, accel, dt):
+        """
+        phi: steering angle.
+        accel: acceleration.
+        dt: the sampling period.
+        """
+        self.__update_observation(phi, dt)
+        self.v += accel * dt
+
+    def update_Euler_by_omega_and_accel(self, omega, accel, dt):
+        """
+        omega: steering rate.
+        accel: acceleration.
+        dt: the sampling period.
+        """
+        self.__update_observation(self.phi, dt)
+        self.phi += omega * dt
+        self.v += accel * dt
+
+    def update_Euler_by_alpha_and_accel(self, alpha, accel, dt):
+        """
+        alpha: steering angular acceleration.
+        accel: acceleration.
+        dt: the sampling period.
+        """
+        self.__update_observation(self.phi, dt)
+        self.phi += self.omega * dt
+        self.omega += alpha * dt
+        self.v += accel * dt
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self):
+        return "BicycleFleet of {} vehicles".format(self.n)
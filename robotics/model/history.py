@@ -0,0 +1,260 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class History(ABC):
+    """Base of the history backends of the wheeled mobile robot models.
+
+    A model calls start(columns, row) once with its column names and initial
+    state, then append(row) after every update, or extend(rows) with a
+    (columns, T) array after a rollout. reserve(n) is called before the
+    state changes, so a backend that cannot store the rows raises while
+    the model still matches its history. Rows are tuples of floats in column
+    order. With decimation k only every k-th appended row is kept, the
+    initial row is always kept.
+    """
+
+    __slots__ = ("columns", "decimation", "_index", "_count")
+
+    def __init__(self, decimation=1):
+        if decimation < 1:
+            raise ValueError("decimation should be at least 1")
+        self.decimation = decimation
+        self.columns = ()
+        self._index = {}
+        self._count = 0
+
+    def start(self, columns, row):
+        self.columns = tuple(columns)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self._count = 0
+        self._start()
+        self._record(row)
+
+    def append(self, row):
+        self._count += 1
+        if self._count % self.decimation == 0:
+            self._record(row)
+
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=float)
+        first = (-self._count - 1) % self.decimation
+        self._count += rows.shape[1]
+        rows = rows[:, first :: self.decimation]
+        if rows.shape[1]:
+            self._extend(rows)
+
+    def reserve(self, n=1):
+        """Raise if the rows of the next n appends cannot be stored.
+        """
+        d = self.decimation
+        kept = (self._count + n) // d - self._count // d
+        if kept:
+            self._reserve(kept)
+
+    def column(self, name):
+        return self._column(self._index[name])
+
+    def _reserve(self, kept):
+        """Check that kept more rows can be stored, the storage grows anyway
+        by default.
+        """
+
+    @abstractmethod
+    def _start(self):
+        """Prepare the storage of self.columns.
+        """
+
+    @abstractmethod
+    def _record(self, row):
+        """Store one kept row.
+        """
+
+    @abstractmethod
+    def _extend(self, rows):
+        """Store the kept (columns, T) rows.
+        """
+
+    @abstractmethod
+    def _column(self, idx):
+        """Return the recorded values of column idx.
+        """
+
+
+class ListHistory(History):
+    """Keep one Python list per column, column returns the list itself.
+    """
+
+    __slots__ = ("lists",)
+
+    def _start(self):
+        self.lists = [[] for _ in self.columns]
+
+    def _record(self, row):
+        for values, v in zip(self.lists, row):
+            values.append(v)
+
+    def _extend(self, rows):
+        for values, v in zip(self.lists, rows.tolist()):
+            values.extend(v)
+
+    def _column(self, idx):
+        return self.lists[idx]
+
+    def __len__(self) -> int:
+        return len(self.lists[0]) if self.columns else 0
+
+
+class ColumnarHistory(History):
+    """Keep the rows in one growable (columns, capacity) float64 array.
+
+    column returns a zero-copy contiguous view of the recorded values,
+    views taken before the buffer grows keep pointing at the old buffer.
+
+    out: a (columns, capacity) float64 array to record into, e.g. shared
+        memory. It never grows or gets replaced, recording into an out whose
+        row count differs from the columns or beyond its capacity raises
+        ValueError, before the model changes its state.
+    """
+
+    __slots__ = ("data", "size", "fixed")
+
+    def __init__(self, capacity=1024, decimation=1, out=None):
+        super().__init__(decimation)
+        self.data = np.empty((0, max(1, capacity))) if out is None else out
+        self.size = 0
+        self.fixed = out is not None
+
+    def _start(self):
+        if self.data.shape[0] != len(self.columns):
+            if self.fixed:
+                raise ValueError(
+                    "out has {} rows for the {} columns {}".format(
+                        self.data.shape[0], len(self.columns), self.columns
+                    )
+                )
+            self.data = np.empty((len(self.columns), self.data.shape[1]))
+        self.size = 0
+
+    def _reserve(self, kept):
+        if self.fixed:
+            self.__reserve(self.size + kept)
+
+    def __reserve(self, size):
+        capacity = self.data.shape[1]
+        if size > capacity:
+            if self.fixed:
+                raise ValueError(
+                    "out holds {} records, {} were recorded".format(capacity, size)
+                )
+            while capacity < size:
+                capacity *= 2
+            data = np.empty((self.data.shape[0], capacity))
+            data[:, : self.size] = self.data[:, : self.size]
+            self.data = data
+
+    def _record(self, row):
+        self.__reserve(self.size + 1)
+        self.data[:, self.size] = row
+        self.size += 1
+
+    def _extend(self, rows):
+        end = self.size + rows.shape[1]
+        self.__reserve(end)
+        self.data[:, self.size : end] = rows
+        self.size = end
+
+    def _column(self, idx):
+        return self.data[idx, : self.size]
+
+    def to_array(self) -> np.array:
+        """Return a zero-copy (columns, N) view of all recorded rows.
+        """
+        return self.data[:, : self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RingHistory(History):
+    """Keep only the newest capacity rows in a fixed float64 buffer.
+
+    Every row is written twice, capacity columns apart, so the newest rows
+    are always one contiguous window and column stays a zero-copy view.
+    """
+
+    __slots__ = ("capacity", "data", "size", "head")
+
+    def __init__(self, capacity=1024, decimation=1):
+        super().__init__(decimation)
+        if capacity < 1:
+            raise ValueError("capacity should be at least 1")
+        self.capacity = capacity
+        self.data = np.empty((0, 2 * capacity))
+        self.size = 0
+        self.head = 0
+
+    def _start(self):
+        self.data = np.empty((len(self.columns), 2 * self.capacity))
+        self.size = 0
+        self.head = 0
+
+    def _record(self, row):
+        end = (self.head + self.size) % self.capacity
+        self.data[:, end] = row
+        self.data[:, end + self.capacity] = row
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.head = (self.head + 1) % self.capacity
+
+    def _extend(self, rows):
+        capacity = self.capacity
+        rows = rows[:, -capacity:]
+        m = rows.shape[1]
+        idx = (self.head + self.size + np.arange(m)) % capacity
+        self.data[:, idx] = rows
+        self.data[:, idx + capacity] = rows
+        size = min(capacity, self.size + m)
+        self.head = (self.head + self.size + m - size) % capacity
+        self.size = size
+
+    def _column(self, idx):
+        return self.data[idx, self.head : self.head + self.size]
+
+    def to_array(self) -> np.array:
+        """Return a zero-copy (columns, N) view of the newest rows.
+        """
+        return self.data[:, self.head : self.head + self.size]
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class NullHistory(History):
+    """Record nothing, for runs where only the final state matters.
+    """
+
+    __slots__ = ()
+
+    def append(self, row):
+        pass
+
+    def extend(self, rows):
+        pass
+
+    def _start(self):
+        pass
+
+    def _record(self, row):
+        pass
+
+    def _extend(self, rows):
+        pass
+
+    def _column(self, idx):
+        return np.empty(0)
+
+    def __len__(self) -> int:
+        return 0
@@ -1,5 +1,79 @@
+import math
+
 import numpy as np
 
+from .history import ListHistory
+
+INTEGRATORS = ("euler", "midpoint", "rk4", "exact")
+
+
+def _commands(*commands):
+    """Broadcast scalar or (T,) commands and dt to float64 (T,) arrays.
+    """
+    return np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(c, dtype=float)) for c in commands)
+    )
+
+
+def _accumulate(initial, increments) -> np.array:
+    """Return the (T + 1,) states of state += increments[k], summed in the
+    same order as stepping so the results are identical.
+    """
+    return np.cumsum(np.concatenate(([initial], increments)))
+
+
+def _clipped_accumulate(initial, increments, limit) -> np.array:
+    """Return the (T + 1,) states of state = clip(state) + increments[k],
+    the recurrence of the bicycle steering angle.
+
+    The running sum is used as is while it stays within the limit, the
+    steps from the first clipped state on run as a loop over plain floats.
+    """
+    states = _accumulate(initial, increments)
+    over = np.flatnonzero(np.abs(states[:-1]) > limit)
+    if len(over) == 0:
+        return states
+    k = over[0]
+    state = states[k]
+    for i, increment in enumerate(increments[k:].tolist(), k + 1):
+        state = min(max(state, -limit), limit) + increment
+        states[i] = state
+    return states
+
+
+def _check_integrator(integrator):
+    if integrator not in INTEGRATORS:
+        raise ValueError(
+            "integrator should be one of {}, got {}".format(INTEGRATORS, integrator)
+        )
+
+
+def _integrate(derivative, state, dt, integrator):
+    """Advance the state tuple by dt with the midpoint or RK4 method,
+    derivative(state) returns the time derivative of every component.
+    """
+    if integrator == "midpoint":
+        k1 = derivative(state)
+        k2 = derivative([s + 0.5 * dt * k for s, k in zip(state, k1)])
+        return [s + dt * k for s, k in zip(state, k2)]
+    k1 = derivative(state)
+    k2 = derivative([s + 0.5 * dt * k for s, k in zip(state, k1)])
+    k3 = derivative([s + 0.5 * dt * k for s, k in zip(state, k2)])
+    k4 = derivative([s + dt * k for s, k in zip(state, k3)])
+    return [
+        s + dt / 6.0 * (a + 2.0 * b + 2.0 * c + d)
+        for s, a, b, c, d in zip(state, k1, k2, k3, k4)
+    ]
+
+
+def _arc(x, y, theta, distance, dtheta):
+    """Move distance along the circular arc that starts at heading theta
+    and turns by dtheta, a straight line when dtheta is 0.
+    """
+    h = 0.5 * dtheta
+    chord = distance * (math.sin(h) / h if abs(h) > 1e-9 else 1.0 - h * h / 6.0)
+    return x + chord * math.cos(theta + h), y + chord * math.sin(theta + h)
+
 
 class UnicycleModel:
     """Generate a unicycle model.
@@ -12,24 +86,16 @@ class UnicycleModel:
 
     When calling update_xxx functions, dt should be provided,
     which stands for the sampling period for this update.
+
+    history: the backend recording the states after every update,
+        ListHistory by default, see robotics.model.history.
     """
 
-    __slots__ = (
-        "x",
-        "y",
-        "theta",
-        "omega",
-        "v",
-        "time",
-        "x_history",
-        "y_history",
-        "theta_history",
-        "omega_history",
-        "v_history",
-        "time_history",
-    )
+    COLUMNS = ("time", "x", "y", "theta", "omega", "v")
+
+    __slots__ = ("x", "y", "theta", "omega", "v", "time", "history")
 
-    def __init__(self, x=0.0, y=0.0, theta=0.0, omega=0.0, v=0.0):
+    def __init__(self, x=0.0, y=0.0, theta=0.0, omega=0.0, v=0.0, history=None):
         self.x = x
         self.y = y
         self.theta = theta
@@ -37,25 +103,43 @@ class UnicycleModel:
         self.v = v
 
         self.time = 0
-        self.time_history = [0]
-        self.x_history = [x]
-        self.y_history = [y]
-        self.theta_history = [theta]
-        self.omega_history = [omega]
-        self.v_history = [v]
+        self.history = ListHistory() if history is None else history
+        self.history.start(self.COLUMNS, (0, x, y, theta, omega, v))
 
     def __update_history(self):
-        self.time_history.append(self.time)
-        self.x_history.append(self.x)
-        self.y_history.append(self.y)
-        self.theta_history.append(self.theta)
-        self.omega_history.append(self.omega)
-        self.v_history.append(self.v)
+        self.history.append(
+            (self.time, self.x, self.y, self.theta, self.omega, self.v)
+        )
+
+    @property
+    def time_history(self):
+        return self.history.column("time")
+
+    @property
+    def x_history(self):
+        return self.history.column("x")
+
+    @property
+    def y_history(self):
+        return self.history.column("y")
+
+    @property
+    def theta_history(self):
+        return self.history.column("theta")
+
+    @property
+    def omega_history(self):
+        return self.history.column("omega")
+
+    @property
+    def v_history(self):
+        return self.history.column("v")
 
     def __update_observation(self, theta, v, dt):
         """
         dt: the sampling period.
         """
+        self.history.reserve()
         self.x += self.v * np.cos(self.theta) * dt
         self.y += self.v * np.sin(self.theta) * dt
         self.theta = theta
@@ -94,6 +178,127 @@ class UnicycleModel:
         self.v += accel * dt
         self.__update_history()
 
+    def __update(self, omega, alpha, accel, dt, integrator):
+        """Integrate the commands held constant over dt.
+
+        omega: the commanded steering rate, None to turn at the omega state.
+        """
+        if integrator == "exact":
+            rate = self.omega if omega is None else omega
+            dtheta = rate * dt + 0.5 * alpha * dt * dt
+            distance = self.v * dt + 0.5 * accel * dt * dt
+            self.x, self.y = _arc(self.x, self.y, self.theta, distance, dtheta)
+            self.theta += dtheta
+            self.omega += alpha * dt
+            self.v += accel * dt
+        else:
+
+            def derivative(state):
+                _, _, theta, rate, v = state
+                return (
+                    v * math.cos(theta),
+                    v * math.sin(theta),
+                    rate if omega is None else omega,
+                    alpha,
+                    accel,
+                )
+
+            state = (self.x, self.y, self.theta, self.omega, self.v)
+            self.x, self.y, self.theta, self.omega, self.v = _integrate(
+                derivative, state, dt, integrator
+            )
+        self.time += dt
+        self.__update_history()
+
+    def update_by_omega_and_v(self, omega, v, dt, integrator="exact"):
+        """Like update_Euler_by_omega_and_v, with v applied over the whole
+        step and a selectable integrator.
+
+        integrator: "euler" calls update_Euler_by_omega_and_v, "midpoint" and
+            "rk4" are the explicit Runge-Kutta methods, "exact" moves along
+            the circular arc of the constant twist (omega, v).
+        """
+        _check_integrator(integrator)
+        if integrator == "euler":
+            return self.update_Euler_by_omega_and_v(omega, v, dt)
+        self.history.reserve()
+        self.v = v
+        self.__update(omega, 0.0, 0.0, dt, integrator)
+
+    def update_by_omega_and_accel(self, omega, accel, dt, integrator="exact"):
+        """Like update_Euler_by_omega_and_accel with a selectable integrator.
+
+        "exact" gives the exact heading and travelled distance and follows a
+        circular arc, which is exact when accel is 0.
+        """
+        _check_integrator(integrator)
+        if integrator == "euler":
+            return self.update_Euler_by_omega_and_accel(omega, accel, dt)
+        self.history.reserve()
+        self.__update(omega, 0.0, accel, dt, integrator)
+
+    def update_by_alpha_and_accel(self, alpha, accel, dt, integrator="exact"):
+        """Like update_Euler_by_alpha_and_accel with a selectable integrator.
+
+        "exact" gives the exact heading and travelled distance and follows a
+        circular arc, which is exact when alpha and accel are 0.
+        """
+        _check_integrator(integrator)
+        if integrator == "euler":
+            return self.update_Euler_by_alpha_and_accel(alpha, accel, dt)
+        self.history.reserve()
+        self.__update(None, alpha, accel, dt, integrator)
+
+    def __rollout(self, theta, omega, v, dts):
+        """Integrate x and y from the (T + 1,) theta, omega and v states,
+        record the (T,) states after every step and move to the last one.
+        """
+        self.history.reserve(len(dts))
+        x = _accumulate(self.x, v[:-1] * np.cos(theta[:-1]) * dts)
+        y = _accumulate(self.y, v[:-1] * np.sin(theta[:-1]) * dts)
+        time = _accumulate(self.time, dts)
+        rows = np.array([time, x, y, theta, omega, v])[:, 1:]
+        self.time, self.x, self.y, self.theta, self.omega, self.v = (
+            time[-1].item(),
+            x[-1].item(),
+            y[-1].item(),
+            theta[-1].item(),
+            omega[-1].item(),
+            v[-1].item(),
+        )
+        self.history.extend(rows)
+        return dict(zip(self.COLUMNS, rows))
+
+    def rollout_Euler_by_omega_and_v(self, omegas, vs, dts):
+        """Apply update_Euler_by_omega_and_v to every command in one call.
+
+        omegas, vs, dts: (T,) arrays, scalars are broadcast.
+        Return a dict of the (T,) states after every step, keyed by COLUMNS.
+        """
+        omegas, vs, dts = _commands(omegas, vs, dts)
+        theta = _accumulate(self.theta, omegas * dts)
+        omega = np.full(len(dts) + 1, self.omega, dtype=float)
+        v = np.concatenate(([self.v], vs))
+        return self.__rollout(theta, omega, v, dts)
+
+    def rollout_Euler_by_omega_and_accel(self, omegas, accels, dts):
+        """Apply update_Euler_by_omega_and_accel to every command in one call.
+        """
+        omegas, accels, dts = _commands(omegas, accels, dts)
+        theta = _accumulate(self.theta, omegas * dts)
+        omega = np.full(len(dts) + 1, self.omega, dtype=float)
+        v = _accumulate(self.v, accels * dts)
+        return self.__rollout(theta, omega, v, dts)
+
+    def rollout_Euler_by_alpha_and_accel(self, alphas, accels, dts):
+        """Apply update_Euler_by_alpha_and_accel to every command in one call.
+        """
+        alphas, accels, dts = _commands(alphas, accels, dts)
+        omega = _accumulate(self.omega, alphas * dts)
+        theta = _accumulate(self.theta, omega[:-1] * dts)
+        v = _accumulate(self.v, accels * dts)
+        return self.__rollout(theta, omega, v, dts)
+
     def __repr__(self):
         return "x: {:.2f}, y: {:.2f}, θ: {:.2f}, v: {:.2f}".format(
             self.x, self.y, self.theta, self.v
@@ -114,8 +319,13 @@ class BicycleModel:
 
     When calling update_xxx functions, dt should be provided,
     which stands for the sampling period for this update.
+
+    history: the backend recording the states after every update,
+        ListHistory by default, see robotics.model.history.
     """
 
+    COLUMNS = ("time", "x", "y", "theta", "phi", "omega", "v")
+
     __slots__ = (
         "x",
         "y",
@@ -126,13 +336,7 @@ class BicycleModel:
         "L",
         "max_steering_angle",
         "time",
-        "x_history",
-        "y_history",
-        "theta_history",
-        "omega_history",
-        "v_history",
-        "time_history",
-        "phi_history",
+        "history",
     )
 
     def __init__(
@@ -145,6 +349,7 @@ class BicycleModel:
         omega=0.0,
         v=0.0,
         max_steering_angle=np.pi / 2,
+        history=None,
     ):
         self.x = x
         self.y = y
@@ -156,15 +361,11 @@ class BicycleModel:
         self.max_steering_angle = max_steering_angle
 
         self.time = 0
-        self.time_history = [0]
-        self.x_history = [x]
-        self.y_history = [y]
-        self.theta_history = [theta]
-        self.phi_history = [phi]
-        self.omega_history = [omega]
-        self.v_history = [v]
+        self.history = ListHistory() if history is None else history
+        self.history.start(self.COLUMNS, (0, x, y, theta, phi, omega, v))
 
     def __update_observation(self, phi, v, dt):
+        self.history.reserve()
         phi = np.clip(phi, -self.max_steering_angle, self.max_steering_angle)
         self.x += v * np.cos(self.theta) * dt
         self.y += v * np.sin(self.theta) * dt
@@ -174,13 +375,37 @@ class BicycleModel:
         self.time += dt
 
     def __update_history(self):
-        self.time_history.append(self.time)
-        self.x_history.append(self.x)
-        self.y_history.append(self.y)
-        self.theta_history.append(self.theta)
-        self.phi_history.append(self.phi)
-        self.omega_history.append(self.omega)
-        self.v_history.append(self.v)
+        self.history.append(
+            (self.time, self.x, self.y, self.theta, self.phi, self.omega, self.v)
+        )
+
+    @property
+    def time_history(self):
+        return self.history.column("time")
+
+    @property
+    def x_history(self):
+        return self.history.column("x")
+
+    @property
+    def y_history(self):
+        return self.history.column("y")
+
+    @property
+    def theta_history(self):
+        return self.history.column("theta")
+
+    @property
+    def phi_history(self):
+        return self.history.column("phi")
+
+    @property
+    def omega_history(self):
+        return self.history.column("omega")
+
+    @property
+    def v_history(self):
+        return self.history.column("v")
 
     def update_Euler_by_phi_and_accel(self, phi, accel, dt):
         """
@@ -215,6 +440,140 @@ class BicycleModel:
         self.v += accel * dt
         self.__update_history()
 
+    def __update(self, omega, alpha, accel, dt, integrator):
+        """Integrate the commands held constant over dt, the steering angle
+        is clipped whenever the heading rate is evaluated.
+
+        omega: the commanded steering rate, None to steer at the omega state.
+        """
+        limit = self.max_steering_angle
+        self.phi = min(max(self.phi, -limit), limit)
+        if integrator == "exact":
+            rate = self.omega if omega is None else omega
+            dphi = rate * dt + 0.5 * alpha * dt * dt
+            distance = self.v * dt + 0.5 * accel * dt * dt
+            # the steering angle at the middle of the step
+            phi = min(max(self.phi + 0.5 * dphi, -limit), limit)
+            dtheta = distance * math.tan(phi) / self.L
+            self.x, self.y = _arc(self.x, self.y, self.theta, distance, dtheta)
+            self.theta += dtheta
+            self.phi += dphi
+            self.omega += alpha * dt
+            self.v += accel * dt
+        else:
+
+            def derivative(state):
+                _, _, theta, phi, rate, v = state
+                phi = min(max(phi, -limit), limit)
+                return (
+                    v * math.cos(theta),
+                    v * math.sin(theta),
+                    v * math.tan(phi) / self.L,
+                    rate if omega is None else omega,
+                    alpha,
+                    accel,
+                )
+
+            state = (self.x, self.y, self.theta, self.phi, self.omega, self.v)
+            self.x, self.y, self.theta, self.phi, self.omega, self.v = _integrate(
+                derivative, state, dt, integrator
+            )
+        self.time += dt
+        self.__update_history()
+
+    def update_by_phi_and_accel(self, phi, accel, dt, integrator="exact"):
+        """Like update_Euler_by_phi_and_accel with a selectable integrator.
+
+        integrator: "euler" calls update_Euler_by_phi_and_accel, "midpoint"
+            and "rk4" are the explicit Runge-Kutta methods, "exact" moves along
+            the circular arc of the kinematic bicycle, which is exact when
+            accel is 0 and gives the exact travelled distance otherwise.
+        """
+        _check_integrator(integrator)
+        if integrator == "euler":
+            return self.update_Euler_by_phi_and_accel(phi, accel, dt)
+        self.history.reserve()
+        self.phi = phi
+        self.__update(0.0, 0.0, accel, dt, integrator)
+
+    def update_by_omega_and_accel(self, omega, accel, dt, integrator="exact"):
+        """Like update_Euler_by_omega_and_accel with a selectable integrator.
+
+        "exact" follows a circular arc with the steering angle of the middle
+        of the step, which is exact when omega and accel are 0.
+        """
+        _check_integrator(integrator)
+        if integrator == "euler":
+            return self.update_Euler_by_omega_and_accel(omega, accel, dt)
+        self.history.reserve()
+        self.__update(omega, 0.0, accel, dt, integrator)
+
+    def update_by_alpha_and_accel(self, alpha, accel, dt, integrator="exact"):
+        """Like update_Euler_by_alpha_and_accel with a selectable integrator.
+        """
+        _check_integrator(integrator)
+        if integrator == "euler":
+            return self.update_Euler_by_alpha_and_accel(alpha, accel, dt)
+        self.history.reserve()
+        self.__update(None, alpha, accel, dt, integrator)
+
+    def __rollout(self, steering, phi, omega, v, dts):
+        """Integrate x, y and theta from the (T,) clipped steering angles and
+        the (T + 1,) phi, omega and v states, record the (T,) states after
+        every step and move to the last one.
+        """
+        self.history.reserve(len(dts))
+        theta = _accumulate(self.theta, v[:-1] * np.tan(steering) / self.L * dts)
+        x = _accumulate(self.x, v[:-1] * np.cos(theta[:-1]) * dts)
+        y = _accumulate(self.y, v[:-1] * np.sin(theta[:-1]) * dts)
+        time = _accumulate(self.time, dts)
+        rows = np.array([time, x, y, theta, phi, omega, v])[:, 1:]
+        self.time, self.x, self.y, self.theta, self.phi, self.omega, self.v = (
+            time[-1].item(),
+            x[-1].item(),
+            y[-1].item(),
+            theta[-1].item(),
+            phi[-1].item(),
+            omega[-1].item(),
+            v[-1].item(),
+        )
+        self.history.extend(rows)
+        return dict(zip(self.COLUMNS, rows))
+
+    def rollout_Euler_by_phi_and_accel(self, phis, accels, dts):
+        """Apply update_Euler_by_phi_and_accel to every command in one call.
+
+        phis, accels, dts: (T,) arrays, scalars are broadcast.
+        Return a dict of the (T,) states after every step, keyed by COLUMNS.
+        """
+        phis, accels, dts = _commands(phis, accels, dts)
+        limit = self.max_steering_angle
+        steering = np.clip(phis, -limit, limit)
+        phi = np.concatenate(([self.phi], steering))
+        omega = np.full(len(dts) + 1, self.omega, dtype=float)
+        v = _accumulate(self.v, accels * dts)
+        return self.__rollout(steering, phi, omega, v, dts)
+
+    def rollout_Euler_by_omega_and_accel(self, omegas, accels, dts):
+        """Apply update_Euler_by_omega_and_accel to every command in one call.
+        """
+        omegas, accels, dts = _commands(omegas, accels, dts)
+        limit = self.max_steering_angle
+        phi = _clipped_accumulate(self.phi, omegas * dts, limit)
+        omega = np.full(len(dts) + 1, self.omega, dtype=float)
+        v = _accumulate(self.v, accels * dts)
+        return self.__rollout(np.clip(phi[:-1], -limit, limit), phi, omega, v, dts)
+
+    def rollout_Euler_by_alpha_and_accel(self, alphas, accels, dts):
+        """Apply update_Euler_by_alpha_and_accel to every command in one call.
+        """
+        alphas, accels, dts = _commands(alphas, accels, dts)
+        limit = self.max_steering_angle
+        omega = _accumulate(self.omega, alphas * dts)
+        phi = _clipped_accumulate(self.phi, omega[:-1] * dts, limit)
+        v = _accumulate(self.v, accels * dts)
+        return self.__rollout(np.clip(phi[:-1], -limit, limit), phi, omega, v, dts)
+
     def __repr__(self):
         return "x: {:.2f}, y: {:.2f}, θ: {:.2f}, φ: {:.2f}, v: {:.2f}".format(
             self.x, self.y, self.theta, self.phi, self.v
@@ -1,5 +1,10 @@
+from .compact_pose import *
+from .composition import *
 from .conversions import *
+from .lie import *
 from .quaternion import *
 from .screw import *
 from .slerp import *
+from .trajectory import *
 from .transform import *
+from .transform_tree import *
@@ -0,0 +1,435 @@
+import math
+
+import numpy as np
+
+from .conversions import rotation_to_quaternion, rotation_to_quaternion_array
+from .quaternion import (
+    Quaternion,
+    QuaternionArray,
+    _rotate_unit_array,
+    quaternion_multiply_array,
+    vector_to_quaternion,
+)
+from .slerp import angle_interpolation, quaternion_slerp, quaternion_slerp_vectors
+from .transform import (
+    rotation2D_to_angle,
+    transform2D,
+    transform2D_array,
+    transform3D,
+    transform3D_array,
+    wrap_2_pi,
+)
+
+
+class Pose2D:
+    """Generate a compact SE(2) pose.
+
+    x, y: translation in the parent frame.
+    theta: heading angle, kept wrapped to [-π, +π).
+
+    Composition, inversion and point transformation are closed form,
+    so no 3x3 homogeneous matrix is built.
+    """
+
+    __slots__ = ("x", "y", "theta")
+
+    def __init__(self, x=0.0, y=0.0, theta=0.0):
+        self.x = x
+        self.y = y
+        self.theta = theta if -math.pi <= theta < math.pi else wrap_2_pi(theta)
+
+    def __repr__(self) -> str:
+        return "x: {:.2f}, y: {:.2f}, θ: {:.2f}".format(self.x, self.y, self.theta)
+
+    def __eq__(self, other):
+        if isinstance(other, Pose2D):
+            return (
+                abs(self.x - other.x) < 1e-12
+                and abs(self.y - other.y) < 1e-12
+                and abs(wrap_2_pi(self.theta - other.theta)) < 1e-12
+            )
+        return False
+
+    __hash__ = None
+
+    def __mul__(self, other):
+        """Compose two poses, equivalent to self.to_matrix() @ other.to_matrix()
+        """
+        if not isinstance(other, Pose2D):
+            return NotImplemented
+        c = math.cos(self.theta)
+        s = math.sin(self.theta)
+        return Pose2D(
+            self.x + c * other.x - s * other.y,
+            self.y + s * other.x + c * other.y,
+            wrap_2_pi(self.theta + other.theta),
+        )
+
+    def inv(self):
+        c = math.cos(self.theta)
+        s = math.sin(self.theta)
+        return Pose2D(
+            -c * self.x - s * self.y, s * self.x - c * self.y, wrap_2_pi(-self.theta)
+        )
+
+    def transform_point(self, p: np.array) -> np.array:
+        """Map p (2,) or (N, 2) from this frame to the parent frame.
+        """
+        p = np.asarray(p, dtype=float)
+        c = math.cos(self.theta)
+        s = math.sin(self.theta)
+        result = np.empty(p.shape)
+        result[..., 0] = self.x + c * p[..., 0] - s * p[..., 1]
+        result[..., 1] = self.y + s * p[..., 0] + c * p[..., 1]
+        return result
+
+    def interpolate(self, other, ratio: float):
+        """Interpolate linearly in translation and along the shortest arc in
+        heading, as transform2D_slerp does.
+        """
+        return Pose2D(
+            self.x * (1 - ratio) + other.x * ratio,
+            self.y * (1 - ratio) + other.y * ratio,
+            angle_interpolation(self.theta, other.theta, ratio),
+        )
+
+    def to_matrix(self) -> np.array:
+        return transform2D(self.x, self.y, self.theta)
+
+    @classmethod
+    def from_matrix(cls, T: np.array):
+        return cls(T[0, 2], T[1, 2], rotation2D_to_angle(T[:2, :2]))
+
+
+class Pose3D:
+    """Generate a compact SE(3) pose.
+
+    q: unit Quaternion of the orientation.
+    t: translation (3,) in the parent frame.
+
+    Composition, inversion and point transformation are closed form,
+    so no 4x4 homogeneous matrix is built.
+    """
+
+    __slots__ = ("q", "t")
+
+    def __init__(self, q=None, t=None):
+        if q is None:
+            self.q = Quaternion(1.0, 0.0, 0.0, 0.0)
+        else:
+            # plain floats keep the closed-form arithmetic off numpy scalars
+            self.q = vector_to_quaternion(q.to_unit().to_vector().tolist())
+        self.t = np.zeros(3) if t is None else np.asarray(t, dtype=float)
+
+    @classmethod
+    def __from_unit(cls, q: Quaternion, t: np.array):
+        """Skip normalization for quaternions that are unit by construction.
+        """
+        pose = cls.__new__(cls)
+        pose.q = q
+        pose.t = t
+        return pose
+
+    def __repr__(self) -> str:
+        return "q: {}, t: {}".format(self.q, self.t)
+
+    def __eq__(self, other):
+        """Orientations are compared up to the sign of the quaternion.
+        """
+        if isinstance(other, Pose3D):
+            return (self.q == other.q or self.q == -other.q) and bool(
+                np.all(np.abs(self.t - other.t) < 1e-12)
+            )
+        return False
+
+    __hash__ = None
+
+    def __mul__(self, other):
+        """Compose two poses, equivalent to self.to_matrix() @ other.to_matrix()
+        """
+        if not isinstance(other, Pose3D):
+            return NotImplemented
+        # _rotate_unit and the Hamilton product inlined on floats, this is
+        # dominated by the call overhead
+        q0, q1 = self.q, other.q
+        w, x, y, z = q0.w, q0.x, q0.y, q0.z
+        w1, x1, y1, z1 = q1.w, q1.x, q1.y, q1.z
+        vx, vy, vz = other.t.tolist()
+        tx = 2 * (y * vz - z * vy)
+        ty = 2 * (z * vx - x * vz)
+        tz = 2 * (x * vy - y * vx)
+        t0, t1, t2 = self.t.tolist()
+        q = Quaternion(
+            w * w1 - x * x1 - y * y1 - z * z1,
+            w * x1 + x * w1 + y * z1 - z * y1,
+            w * y1 - x * z1 + y * w1 + z * x1,
+            w * z1 + x * y1 - y * x1 + z * w1,
+        )
+        t = np.array(
+            (
+                t0 + vx + w * tx + (y * tz - z * ty),
+                t1 + vy + w * ty + (z * tx - x * tz),
+                t2 + vz + w * tz + (x * ty - y * tx),
+            )
+        )
+        return Pose3D.__from_unit(q, t)
+
+    def inv(self):
+        q_inv = self.q.conj()
+        x, y, z = _rotate_unit(q_inv, *self.t.tolist())
+        return Pose3D.__from_unit(q_inv, np.array((-x, -y, -z)))
+
+    def transform_point(self, p: np.array) -> np.array:
+        """Map p (3,) or (N, 3) from this frame to the parent frame.
+        """
+        p = np.asarray(p, dtype=float)
+        return self.q.rotate_vector(p) + self.t
+
+    def interpolate(self, other, ratio: float):
+        """Slerp the orientation and lerp the translation,
+        as transform3D_slerp does.
+        """
+        return Pose3D(
+            quaternion_slerp(self.q, other.q, ratio),
+            self.t * (1 - ratio) + other.t * ratio,
+        )
+
+    def to_matrix(self) -> np.array:
+        return transform3D(self.t[0], self.t[1], self.t[2], self.q.to_rotation())
+
+    @classmethod
+    def from_matrix(cls, T: np.array):
+        return cls(rotation_to_quaternion(T[:3, :3]), T[:3, 3].copy())
+
+
+class Pose2DArray:
+    """A stack of N SE(2) poses stored as one (N, 3) array of x, y, theta rows,
+    theta kept wrapped to [-π, +π).
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        if isinstance(data, Pose2D):
+            data = [data]
+        if len(data) and isinstance(data[0], Pose2D):
+            data = [(p.x, p.y, p.theta) for p in data]
+        data = np.ascontiguousarray(data, dtype=float).reshape(-1, 3)
+        theta = data[:, 2]
+        if np.any((theta < -np.pi) | (theta >= np.pi)):
+            # wrap a copy, the caller's array may be shared
+            data = data.copy()
+            data[:, 2] = wrap_2_pi(theta)
+        self.data = data
+
+    @classmethod
+    def identity(cls, n: int):
+        return cls(np.zeros((n, 3)))
+
+    @property
+    def x(self) -> np.array:
+        return self.data[:, 0]
+
+    @property
+    def y(self) -> np.array:
+        return self.data[:, 1]
+
+    @property
+    def theta(self) -> np.array:
+        return self.data[:, 2]
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __repr__(self) -> str:
+        return "Pose2DArray({})".format(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Pose2D(*self.data[index].tolist())
+        return Pose2DArray(self.data[index])
+
+    def __mul__(self, other):
+        """Compose elementwise, a single Pose2D on either side is broadcast.
+        """
+        if isinstance(other, Pose2D):
+            other = Pose2DArray(other)
+        if not isinstance(other, Pose2DArray):
+            return NotImplemented
+        return Pose2DArray(_compose2D(self.data, other.data))
+
+    def __rmul__(self, other):
+        if isinstance(other, Pose2D):
+            return Pose2DArray(_compose2D(Pose2DArray(other).data, self.data))
+        return NotImplemented
+
+    def inv(self):
+        c = np.cos(self.theta)
+        s = np.sin(self.theta)
+        data = np.empty_like(self.data)
+        data[:, 0] = -c * self.x - s * self.y
+        data[:, 1] = s * self.x - c * self.y
+        data[:, 2] = wrap_2_pi(-self.theta)
+        return Pose2DArray(data)
+
+    def transform_point(self, p: np.array) -> np.array:
+        """Map p (2,) or (N, 2) through every pose, returning (N, 2).
+        """
+        p = np.asarray(p, dtype=float)
+        c = np.cos(self.theta)
+        s = np.sin(self.theta)
+        result = np.empty((len(self), 2))
+        result[:, 0] = self.x + c * p[..., 0] - s * p[..., 1]
+        result[:, 1] = self.y + s * p[..., 0] + c * p[..., 1]
+        return result
+
+    def interpolate(self, other, ratio):
+        """Interpolate elementwise towards other at ratio (scalar or (N,)).
+        """
+        ratio = np.asarray(ratio, dtype=float)
+        data = np.empty(np.broadcast(self.x, other.x, ratio).shape + (3,))
+        data[:, 0] = self.x * (1 - ratio) + other.x * ratio
+        data[:, 1] = self.y * (1 - ratio) + other.y * ratio
+        data[:, 2] = angle_interpolation(self.theta, other.theta, ratio)
+        return Pose2DArray(data)
+
+    def to_matrix(self, out=None) -> np.array:
+        return transform2D_array(self.x, self.y, self.theta, out=out)
+
+    @classmethod
+    def from_matrix(cls, T: np.array):
+        T = np.asarray(T, dtype=float).reshape(-1, 3, 3)
+        return cls(
+            np.stack((T[:, 0, 2], T[:, 1, 2], np.arctan2(T[:, 1, 0], T[:, 0, 0])), 1)
+        )
+
+
+class Pose3DArray:
+    """A stack of N SE(3) poses stored as (N, 4) unit quaternions q
+    and (N, 3) translations t.
+    """
+
+    __slots__ = ("q", "t")
+
+    def __init__(self, q, t):
+        self.q = QuaternionArray(q).to_unit().data
+        self.t = np.ascontiguousarray(t, dtype=float).reshape(-1, 3)
+
+    @classmethod
+    def __from_unit(cls, q: np.array, t: np.array):
+        """Skip normalization for quaternions that are unit by construction.
+        """
+        poses = cls.__new__(cls)
+        poses.q = q
+        poses.t = t
+        return poses
+
+    @classmethod
+    def _from_pose(cls, pose: Pose3D):
+        """Wrap a single Pose3D, whose quaternion is already unit.
+        """
+        q = pose.q
+        return cls.__from_unit(np.array([[q.w, q.x, q.y, q.z]]), pose.t.reshape(1, 3))
+
+    @classmethod
+    def identity(cls, n: int):
+        return cls.__from_unit(QuaternionArray.identity(n).data, np.zeros((n, 3)))
+
+    @classmethod
+    def from_poses(cls, poses):
+        return cls([p.q for p in poses], [p.t for p in poses])
+
+    def __len__(self) -> int:
+        return self.t.shape[0]
+
+    def __repr__(self) -> str:
+        return "Pose3DArray(q={}, t={})".format(self.q, self.t)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Pose3D(vector_to_quaternion(self.q[index]), self.t[index].copy())
+        return Pose3DArray(self.q[index], self.t[index])
+
+    def __mul__(self, other):
+        """Compose elementwise, a single Pose3D on either side is broadcast.
+        """
+        if isinstance(other, Pose3D):
+            other = Pose3DArray._from_pose(other)
+        if not isinstance(other, Pose3DArray):
+            return NotImplemented
+        return Pose3DArray.__from_unit(*_compose3D(self.q, self.t, other.q, other.t))
+
+    def __rmul__(self, other):
+        if isinstance(other, Pose3D):
+            other = Pose3DArray._from_pose(other)
+            return Pose3DArray.__from_unit(
+                *_compose3D(other.q, other.t, self.q, self.t)
+            )
+        return NotImplemented
+
+    def inv(self):
+        q_inv = self.q * (1.0, -1.0, -1.0, -1.0)
+        t = _rotate_unit_array(q_inv, self.t)
+        np.negative(t, out=t)
+        return Pose3DArray.__from_unit(q_inv, t)
+
+    def transform_point(self, p: np.array) -> np.array:
+        """Map p (3,) or (N, 3) through every pose, returning (N, 3).
+        """
+        result = _rotate_unit_array(self.q, p)
+        result += self.t
+        return result
+
+    def interpolate(self, other, ratio):
+        """Slerp the orientations and lerp the translations elementwise
+        at ratio (scalar or (N,)).
+        """
+        ratio = np.asarray(ratio, dtype=float)
+        q = quaternion_slerp_vectors(self.q, other.q, ratio)
+        r = ratio[..., None]
+        return Pose3DArray(q, self.t * (1 - r) + other.t * r)
+
+    def to_matrix(self, out=None) -> np.array:
+        R = QuaternionArray(self.q).to_rotation()
+        return transform3D_array(self.t[:, 0], self.t[:, 1], self.t[:, 2], R, out=out)
+
+    @classmethod
+    def from_matrix(cls, T: np.array):
+        T = np.asarray(T, dtype=float).reshape(-1, 4, 4)
+        return cls(rotation_to_quaternion_array(T[:, :3, :3]), T[:, :3, 3])
+
+
+def _rotate_unit(q: Quaternion, vx: float, vy: float, vz: float):
+    """Rotate the vector (vx, vy, vz) by the unit quaternion q with float math.
+    """
+    w, x, y, z = q.w, q.x, q.y, q.z
+    tx = 2 * (y * vz - z * vy)
+    ty = 2 * (z * vx - x * vz)
+    tz = 2 * (x * vy - y * vx)
+    return (
+        vx + w * tx + (y * tz - z * ty),
+        vy + w * ty + (z * tx - x * tz),
+        vz + w * tz + (x * ty - y * tx),
+    )
+
+
+def _compose2D(a: np.array, b: np.array) -> np.array:
+    """Compose (N, 3) or (1, 3) x, y, theta rows a and b.
+    """
+    c = np.cos(a[:, 2])
+    s = np.sin(a[:, 2])
+    data = np.empty(np.broadcast(a[:, 0], b[:, 0]).shape + (3,))
+    data[:, 0] = a[:, 0] + c * b[:, 0] - s * b[:, 1]
+    data[:, 1] = a[:, 1] + s * b[:, 0] + c * b[:, 1]
+    data[:, 2] = wrap_2_pi(a[:, 2] + b[:, 2])
+    return data
+
+
+def _compose3D(q0: np.array, t0: np.array, q1: np.array, t1: np.array):
+    """Compose (N, 4) unit quaternions and (N, 3) translations, returning
+    (q, t). The product of unit quaternions is unit, so nothing is normalized.
+    """
+    q = quaternion_multiply_array(q0, q1)
+    t = _rotate_unit_array(q0, t1)
+    t += t0
+    return q, t
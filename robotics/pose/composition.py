@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .compact_pose import Pose2DArray, Pose3DArray, _compose2D, _compose3D
+from .transform import wrap_2_pi
+
+
+def _compose_pose3D(a: np.array, b: np.array) -> np.array:
+    """Compose (N, 7) rows of quaternion w, x, y, z and translation x, y, z.
+    """
+    q, t = _compose3D(a[:, :4], a[:, 4:], b[:, :4], b[:, 4:])
+    return np.concatenate((q, t), axis=1)
+
+
+def _compose_loop(data: np.array, compose) -> np.array:
+    result = np.empty_like(data)
+    result[0] = data[0]
+    for i in range(1, len(data)):
+        result[i : i + 1] = compose(result[i - 1 : i], data[i : i + 1])
+    return result
+
+
+def _compose_doubling(data: np.array, compose) -> np.array:
+    """Hillis-Steele scan: log2(N) vectorized passes, O(N log N) work.
+    """
+    result = data.copy()
+    shift = 1
+    while shift < len(result):
+        result[shift:] = compose(result[:-shift], result[shift:])
+        shift *= 2
+    return result
+
+
+def _compose_blocked(data: np.array, compose, block_size: int, workers) -> np.array:
+    """Three phase blocked scan.
+
+    1. Scan every block locally, stepping all blocks together.
+    2. Scan the block totals sequentially to get each block's carry.
+    3. Apply the carries to all local prefixes in one vectorized pass.
+    Phases 1 and 3 are split into groups of blocks across worker threads.
+    """
+    n = len(data)
+    n_blocks = -(-n // block_size)
+    # pad with copies of the last element, the padded prefixes are dropped
+    padded = np.concatenate(
+        (data, np.repeat(data[-1:], n_blocks * block_size - n, axis=0))
+    )
+    local = padded.reshape((n_blocks, block_size) + data.shape[1:])
+
+    def scan_blocks(blocks):
+        for j in range(1, block_size):
+            local[blocks, j] = compose(local[blocks, j - 1], local[blocks, j])
+
+    def apply_carry(blocks):
+        b = np.arange(blocks.start, blocks.stop)
+        flat_carry = np.repeat(carry[b], block_size, axis=0)
+        flat = local[blocks].reshape((-1,) + data.shape[1:])
+        local[blocks] = compose(flat_carry, flat).reshape(local[blocks].shape)
+
+    groups = [
+        slice(start, min(start + -(-n_blocks // workers), n_blocks))
+        for start in range(0, n_blocks, -(-n_blocks // workers))
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(scan_blocks, groups))
+
+        carry = np.empty((n_blocks,) + data.shape[1:])
+        carry[0] = _identity_like(data[0])
+        for b in range(1, n_blocks):
+            carry[b : b + 1] = compose(carry[b - 1 : b], local[b - 1, -1:])
+
+        list(pool.map(apply_carry, groups))
+
+    return local.reshape((-1,) + data.shape[1:])[:n]
+
+
+def _identity_like(row: np.array) -> np.array:
+    if row.ndim == 2:
+        return np.eye(row.shape[0])
+    identity = np.zeros_like(row)
+    if row.shape[0] == 7:
+        identity[0] = 1.0
+    return identity
+
+
+def cumulative_compose(
+    transforms, method="blocked", block_size=None, workers=1, validate=False
+):
+    """Return all prefix products T[0] @ T[1] @ ... @ T[i] of a chain.
+
+    transforms: an (N, 3, 3) or (N, 4, 4) stack of SE(2)/SE(3) matrices,
+        a Pose2DArray or a Pose3DArray. The result has the same type.
+    method: "blocked" for a sqrt(N) x sqrt(N) blocked scan, "doubling" for a
+        log2(N) pass Hillis-Steele scan, or "loop" for the naive loop.
+    block_size: the block length of the blocked scan, defaults to sqrt(N).
+    workers: the number of threads sharing the blocked scan.
+    validate: compare the result against the naive loop and raise
+        ValueError if they disagree.
+    """
+    if isinstance(transforms, Pose2DArray):
+        data, compose = transforms.data, _compose2D
+    elif isinstance(transforms, Pose3DArray):
+        data = np.concatenate((transforms.q, transforms.t), axis=1)
+        compose = _compose_pose3D
+    else:
+        data = np.asarray(transforms, dtype=float)
+        if data.ndim != 3 or data.shape[1] != data.shape[2]:
+            raise ValueError("transforms should be an (N, k, k) stack")
+        compose = np.matmul
+
+    if len(data) == 0:
+        result = data.copy()
+    elif method == "loop":
+        result = _compose_loop(data, compose)
+    elif method == "doubling":
+        result = _compose_doubling(data, compose)
+    elif method == "blocked":
+        if block_size is None:
+            block_size = max(1, int(np.sqrt(len(data))))
+        result = _compose_blocked(data, compose, block_size, max(1, workers))
+    else:
+        raise ValueError("unknown method {}".format(method))
+
+    if validate:
+        deviation = result - _compose_loop(data, compose)
+        if compose is _compose2D:
+            deviation[:, 2] = wrap_2_pi(deviation[:, 2])
+        error = np.max(np.abs(deviation)) if len(data) else 0.0
+        if not error < 1e-6:
+            raise ValueError(
+                "{} scan deviates from the naive loop by {}".format(method, error)
+            )
+
+    if isinstance(transforms, Pose2DArray):
+        return Pose2DArray(result)
+    if isinstance(transforms, Pose3DArray):
+        return Pose3DArray(result[:, :4], result[:, 4:])
+    return result
@@ -2,7 +2,7 @@ from typing import Tuple
 
 import numpy as np
 
-from .quaternion import Quaternion
+from .quaternion import Quaternion, QuaternionArray
 from .screw import skew3D, vex3D
 
 
@@ -131,3 +131,126 @@ def axis_angle_to_rpy(axis: np.array) -> np.array:
     q = axis_angle_to_quaternion(axis)
 
     return q.to_rpy()
+
+
+def rotation_to_quaternion_array(m: np.array) -> np.array:
+    """Converts an (N, 3, 3) stack of rotation matrices to (N, 4) unit
+    quaternions, selecting the same branch per matrix as
+    rotation_to_quaternion (Shepperd's method) with masks.
+    """
+    m = np.asarray(m, dtype=float).reshape(-1, 3, 3)
+    m00, m01, m02 = m[:, 0, 0], m[:, 0, 1], m[:, 0, 2]
+    m10, m11, m12 = m[:, 1, 0], m[:, 1, 1], m[:, 1, 2]
+    m20, m21, m22 = m[:, 2, 0], m[:, 2, 1], m[:, 2, 2]
+
+    trace_branch = m00 + m11 + m22 + 1 > 1
+    x_branch = ~trace_branch & (m00 > m11) & (m00 > m22)
+    y_branch = ~trace_branch & ~x_branch & (m11 > m22)
+    z_branch = ~(trace_branch | x_branch | y_branch)
+
+    q = np.empty((m.shape[0], 4))
+    q[:, 0] = np.select(
+        [trace_branch, x_branch, y_branch],
+        [m00 + m11 + m22 + 1, m21 - m12, m02 - m20],
+        m10 - m01,
+    )
+    q[:, 1] = np.select(
+        [trace_branch, x_branch, y_branch],
+        [m21 - m12, 1 + m00 - m11 - m22, m01 + m10],
+        m02 + m20,
+    )
+    q[:, 2] = np.select(
+        [trace_branch, x_branch, y_branch],
+        [m02 - m20, m01 + m10, 1 + m11 - m00 - m22],
+        m12 + m21,
+    )
+    q[:, 3] = np.select(
+        [trace_branch, x_branch, y_branch, z_branch],
+        [m10 - m01, m02 + m20, m12 + m21, 1 + m22 - m00 - m11],
+    )
+    return QuaternionArray(q).to_unit().data
+
+
+def rpy_to_quaternion_array(rpy: np.array) -> np.array:
+    """Converts (N, 3) roll, pitch, yaw rows to (N, 4) quaternions.
+    """
+    rpy = np.asarray(rpy, dtype=float).reshape(-1, 3)
+    half = 0.5 * rpy
+    s = np.sin(half)
+    c = np.cos(half)
+    sr, sp, sy = s[:, 0], s[:, 1], s[:, 2]
+    cr, cp, cy = c[:, 0], c[:, 1], c[:, 2]
+
+    q = np.empty((rpy.shape[0], 4))
+    q[:, 0] = cr * cp * cy + sr * sp * sy
+    q[:, 1] = sr * cp * cy - cr * sp * sy
+    q[:, 2] = sr * cp * sy + cr * sp * cy
+    q[:, 3] = cr * cp * sy - sr * sp * cy
+    return q
+
+
+def axis_angle_to_quaternion_array(axis: np.array) -> np.array:
+    """Converts (N, 3) axis-angle vectors to (N, 4) quaternions.
+    """
+    axis = np.asarray(axis, dtype=float).reshape(-1, 3)
+    angle = np.linalg.norm(axis, axis=1)
+    nonzero = angle > 1e-12
+
+    scale = np.zeros_like(angle)
+    scale[nonzero] = np.sin(angle[nonzero] / 2) / angle[nonzero]
+
+    q = np.empty((axis.shape[0], 4))
+    q[:, 0] = np.cos(angle / 2)
+    q[:, 1:] = axis * scale[:, None]
+    return q
+
+
+def quaternion_to_axis_angle_array(q: np.array) -> np.array:
+    """Converts (N, 4) quaternions to (N, 3) axis-angle vectors.
+    """
+    q = QuaternionArray(q).to_unit().data
+    w = np.clip(q[:, 0], -1.0, 1.0)
+    angle = 2 * np.arccos(w)
+    s = np.sqrt(1 - w ** 2)
+    s[s < 1e-3] = 1.0
+    return q[:, 1:] * (angle / s)[:, None]
+
+
+def rotation3D_to_axis_angle_array(R: np.array) -> np.array:
+    """Return the (N, 3) axis-angle vectors for an (N, 3, 3) stack of
+    rotation matrices, handling the identity and the trace ≈ -1 cases
+    with masks as rotation3D_to_axis_angle does.
+    """
+    R = np.asarray(R, dtype=float).reshape(-1, 3, 3)
+    n = R.shape[0]
+    trace_R = np.trace(R, axis1=1, axis2=2)
+    identity = np.abs(trace_R - 3) < 1e-6
+    half_turn = np.abs(trace_R + 1) < 1e-6
+    general = ~(identity | half_turn)
+
+    result = np.zeros((n, 3))
+
+    if np.any(half_turn):
+        R_h = R[half_turn]
+        diag_R = np.diagonal(R_h, axis1=1, axis2=2)
+        max_idx = np.argmax(diag_R, axis=1)
+        rows = np.arange(R_h.shape[0])
+        max_v = diag_R[rows, max_idx]
+        col = R_h[rows, :, max_idx]
+        col[rows, max_idx] += 1
+        result[half_turn] = col / np.sqrt(2 * (1 + max_v))[:, None] * np.pi
+
+    if np.any(general):
+        R_g = R[general]
+        angle = np.arccos(np.clip((trace_R[general] - 1) / 2, -1.0, 1.0))
+        axis = np.stack(
+            (
+                R_g[:, 2, 1] - R_g[:, 1, 2],
+                R_g[:, 0, 2] - R_g[:, 2, 0],
+                R_g[:, 1, 0] - R_g[:, 0, 1],
+            ),
+            axis=1,
+        )
+        result[general] = axis * (angle / (2 * np.sin(angle)))[:, None]
+
+    return result
@@ -0,0 +1,226 @@
+"""Batched exponential and logarithm maps of SO(3) and SE(3).
+
+Tangent vectors are stacked row-wise, so(3) as (N, 3) rotation vectors φ and
+se(3) as (N, 6) twists ξ = [ρ, φ] with the translational part first.
+A single (3,) or (6,) vector is also accepted and gives an unstacked result.
+
+The coefficients of the closed-form expressions are switched to their Taylor
+series with masks where the rotation angle θ is small.
+"""
+import numpy as np
+
+from .screw import skew3D_array, vex3D_array
+
+SMALL_ANGLE = 1e-3
+
+
+def _angle(phi: np.array):
+    """Return θ, θ², a small angle mask and θ with the small angles set to 1
+    so that the closed-form expressions can be evaluated without warnings.
+    """
+    theta_sq = np.einsum("ij,ij->i", phi, phi)
+    theta = np.sqrt(theta_sq)
+    small = theta < SMALL_ANGLE
+    safe_theta = np.where(small, 1.0, theta)
+    return theta, theta_sq, small, safe_theta
+
+
+def _so3_coefficients(phi: np.array):
+    """Return A = sin θ / θ, B = (1 - cos θ) / θ², C = (θ - sin θ) / θ³
+    """
+    theta, theta_sq, small, t = _angle(phi)
+    s = np.sin(t)
+    c = np.cos(t)
+    A = np.where(small, 1 - theta_sq / 6 + theta_sq ** 2 / 120, s / t)
+    B = np.where(small, 0.5 - theta_sq / 24 + theta_sq ** 2 / 720, (1 - c) / t ** 2)
+    C = np.where(
+        small, 1 / 6 - theta_sq / 120 + theta_sq ** 2 / 5040, (t - s) / t ** 3
+    )
+    return A, B, C
+
+
+def _stacked(v: np.array, size: int):
+    v = np.asarray(v, dtype=float)
+    return v.reshape(-1, size), v.ndim == 1
+
+
+def _unstack(result: np.array, single: bool) -> np.array:
+    return result[0] if single else result
+
+
+def _polynomial(K: np.array, a, b, c) -> np.array:
+    """Return a I + b K + c K² for (N, 3, 3) K and (N,) or scalar coefficients.
+    """
+    result = np.einsum("i,ijk->ijk", np.broadcast_to(b, K.shape[:1]), K)
+    result += np.einsum("i,ijk->ijk", np.broadcast_to(c, K.shape[:1]), K @ K)
+    result[:, [0, 1, 2], [0, 1, 2]] += np.reshape(a, (-1, 1))
+    return result
+
+
+def so3_exp(phi: np.array) -> np.array:
+    """Map (N, 3) rotation vectors to (N, 3, 3) rotation matrices (Rodrigues).
+    """
+    phi, single = _stacked(phi, 3)
+    A, B, _ = _so3_coefficients(phi)
+    return _unstack(_polynomial(skew3D_array(phi), 1.0, A, B), single)
+
+
+def so3_log(R: np.array) -> np.array:
+    """Map (N, 3, 3) rotation matrices to (N, 3) rotation vectors.
+
+    Angles close to π recover the axis from the symmetric part of R,
+    where the antisymmetric part vanishes.
+    """
+    R = np.asarray(R, dtype=float)
+    single = R.ndim == 2
+    R = R.reshape(-1, 3, 3)
+
+    cos_theta = np.clip((np.trace(R, axis1=1, axis2=2) - 1) / 2, -1.0, 1.0)
+    theta = np.arccos(cos_theta)
+    sin_theta = np.sin(theta)
+    v = vex3D_array(R - R.transpose(0, 2, 1))  # 2 sin θ a
+
+    small = theta < SMALL_ANGLE
+    near_pi = theta > np.pi - 1e-2
+    regular = ~(small | near_pi)
+
+    factor = np.empty_like(theta)
+    factor[small] = 0.5 + theta[small] ** 2 / 12
+    factor[regular] = theta[regular] / (2 * sin_theta[regular])
+    phi = v * factor[:, None]
+
+    if np.any(near_pi):
+        R_p = R[near_pi]
+        # (R + R.T) / 2 - cos θ I = (1 - cos θ) a a.T
+        S = (R_p + R_p.transpose(0, 2, 1)) / 2
+        S[:, [0, 1, 2], [0, 1, 2]] -= cos_theta[near_pi, None]
+        rows = np.arange(R_p.shape[0])
+        k = np.argmax(np.diagonal(S, axis1=1, axis2=2), axis=1)
+        axis = S[rows, :, k]
+        axis /= np.linalg.norm(axis, axis=1)[:, None]
+        sign = np.where(np.einsum("ij,ij->i", axis, v[near_pi]) < 0, -1.0, 1.0)
+        phi[near_pi] = axis * (sign * theta[near_pi])[:, None]
+
+    return _unstack(phi, single)
+
+
+def so3_left_jacobian(phi: np.array) -> np.array:
+    """J_l(φ) = I + B φ^ + C φ^φ^, such that exp(φ + δ) ≈ exp(J_l δ) exp(φ)
+    """
+    phi, single = _stacked(phi, 3)
+    _, B, C = _so3_coefficients(phi)
+    return _unstack(_polynomial(skew3D_array(phi), 1.0, B, C), single)
+
+
+def so3_right_jacobian(phi: np.array) -> np.array:
+    """J_r(φ) = J_l(-φ), such that exp(φ + δ) ≈ exp(φ) exp(J_r δ)
+    """
+    phi, single = _stacked(phi, 3)
+    _, B, C = _so3_coefficients(phi)
+    return _unstack(_polynomial(skew3D_array(phi), 1.0, -B, C), single)
+
+
+def _so3_inverse_coefficient(phi: np.array) -> np.array:
+    """D = (1 - A / (2 B)) / θ²
+    """
+    theta, theta_sq, small, t = _angle(phi)
+    D = (1 - t * np.sin(t) / (2 * (1 - np.cos(t)))) / t ** 2
+    return np.where(small, 1 / 12 + theta_sq / 720 + theta_sq ** 2 / 30240, D)
+
+
+def so3_left_jacobian_inv(phi: np.array) -> np.array:
+    """J_l(φ)^-1 = I - φ^ / 2 + D φ^φ^
+    """
+    phi, single = _stacked(phi, 3)
+    D = _so3_inverse_coefficient(phi)
+    return _unstack(_polynomial(skew3D_array(phi), 1.0, -0.5, D), single)
+
+
+def so3_right_jacobian_inv(phi: np.array) -> np.array:
+    """J_r(φ)^-1 = I + φ^ / 2 + D φ^φ^
+    """
+    phi, single = _stacked(phi, 3)
+    D = _so3_inverse_coefficient(phi)
+    return _unstack(_polynomial(skew3D_array(phi), 1.0, 0.5, D), single)
+
+
+def se3_exp(xi: np.array) -> np.array:
+    """Map (N, 6) twists [ρ, φ] to (N, 4, 4) SE(3) matrices.
+    """
+    xi, single = _stacked(xi, 6)
+    rho, phi = xi[:, :3], xi[:, 3:]
+    A, B, C = _so3_coefficients(phi)
+    K = skew3D_array(phi)
+
+    T = np.zeros((xi.shape[0], 4, 4))
+    T[:, :3, :3] = _polynomial(K, 1.0, A, B)
+    T[:, :3, 3] = np.einsum("ijk,ik->ij", _polynomial(K, 1.0, B, C), rho)
+    T[:, 3, 3] = 1.0
+    return _unstack(T, single)
+
+
+def se3_log(T: np.array) -> np.array:
+    """Map (N, 4, 4) SE(3) matrices to (N, 6) twists [ρ, φ].
+    """
+    T = np.asarray(T, dtype=float)
+    single = T.ndim == 2
+    T = T.reshape(-1, 4, 4)
+
+    phi = so3_log(T[:, :3, :3])
+    xi = np.empty((T.shape[0], 6))
+    xi[:, 3:] = phi
+    xi[:, :3] = np.einsum("ijk,ik->ij", so3_left_jacobian_inv(phi), T[:, :3, 3])
+    return _unstack(xi, single)
+
+
+def _se3_Q(rho: np.array, phi: np.array) -> np.array:
+    """The coupling block Q(ρ, φ) of the SE(3) left Jacobian (Barfoot).
+    """
+    theta, theta_sq, small, t = _angle(phi)
+    s = np.sin(t)
+    c = np.cos(t)
+    c1 = np.where(
+        small, 1 / 6 - theta_sq / 120 + theta_sq ** 2 / 5040, (t - s) / t ** 3
+    )
+    c2 = np.where(
+        small,
+        1 / 24 - theta_sq / 720 + theta_sq ** 2 / 40320,
+        (t ** 2 + 2 * c - 2) / (2 * t ** 4),
+    )
+    c3 = np.where(
+        small, 1 / 120 - theta_sq / 2520, (2 * t - 3 * s + t * c) / (2 * t ** 5)
+    )
+
+    P = skew3D_array(phi)
+    Rh = skew3D_array(rho)
+    PR = P @ Rh
+    RP = Rh @ P
+    PRP = PR @ P
+    PPR = P @ PR
+    RPP = RP @ P
+    return (
+        0.5 * Rh
+        + c1[:, None, None] * (PR + RP + PRP)
+        + c2[:, None, None] * (PPR + RPP - 3 * PRP)
+        + c3[:, None, None] * (PRP @ P + P @ PRP)
+    )
+
+
+def se3_left_jacobian(xi: np.array) -> np.array:
+    """The (N, 6, 6) left Jacobians of SE(3) for twists [ρ, φ],
+    such that exp(ξ + δ) ≈ exp(J_l δ) exp(ξ).
+    """
+    xi, single = _stacked(xi, 6)
+    J = np.zeros((xi.shape[0], 6, 6))
+    J_so3 = so3_left_jacobian(xi[:, 3:])
+    J[:, :3, :3] = J_so3
+    J[:, 3:, 3:] = J_so3
+    J[:, :3, 3:] = _se3_Q(xi[:, :3], xi[:, 3:])
+    return _unstack(J, single)
+
+
+def se3_right_jacobian(xi: np.array) -> np.array:
+    """J_r(ξ) = J_l(-ξ), such that exp(ξ + δ) ≈ exp(ξ) exp(J_r δ).
+    """
+    xi, single = _stacked(xi, 6)
+    return _unstack(se3_left_jacobian(-xi), single)
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy as np
 
@@ -58,6 +58,8 @@ class Quaternion:
         return self
 
     def __add__(self, other):
+        if isinstance(other, QuaternionArray):
+            return NotImplemented
         qr = Quaternion(self.w, self.x, self.y, self.z)
         qr += other
         return qr
@@ -71,6 +73,8 @@ class Quaternion:
         return self.__iadd__(-other)
 
     def __sub__(self, other):
+        if isinstance(other, QuaternionArray):
+            return NotImplemented
         return self.__add__(-other)
 
     def __rsub__(self, other):
@@ -99,6 +103,8 @@ class Quaternion:
         return self
 
     def __mul__(self, other):
+        if isinstance(other, QuaternionArray):
+            return NotImplemented
         qr = Quaternion(self.w, self.x, self.y, self.z)
         qr *= other
         return qr
@@ -147,6 +153,8 @@ class Quaternion:
         return self
 
     def __truediv__(self, other):
+        if isinstance(other, QuaternionArray):
+            return NotImplemented
         qr = Quaternion(self.w, self.x, self.y, self.z)
         qr /= other
         return qr
@@ -218,7 +226,12 @@ class Quaternion:
         """
         Rotate the vector v by a unit quaternion q defining an
         Euler rotation (ZYX, RPY)
+
+        v can also be an (N, 3) array of points, which are rotated in a
+        single vectorized pass, see rotate_vector_array.
         """
+        if v.ndim == 2:
+            return rotate_vector_array(self.to_vector(), v)
         if v.shape != (3,):
             raise "v should be a vector of 3"
         q = self.to_unit()
@@ -230,3 +243,308 @@ class Quaternion:
 
 def vector_to_quaternion(arr: np.array) -> Quaternion:
     return Quaternion(arr[0], arr[1], arr[2], arr[3])
+
+
+def quaternion_multiply_array(a: np.array, b: np.array, out=None) -> np.array:
+    """Hamilton product of stacked quaternions a (..., 4) and b (..., 4).
+
+    Leading dimensions follow numpy broadcasting, so a single quaternion
+    of shape (4,) can be multiplied by a stack of shape (N, 4).
+    out: an optional preallocated buffer, which may alias a or b.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    w1, x1, y1, z1 = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    w2, x2, y2, z2 = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+
+    # every component is computed before out is written, so out may alias
+    # and the sums are accumulated in place to save temporaries
+    w = w1 * w2
+    w -= x1 * x2
+    w -= y1 * y2
+    w -= z1 * z2
+    x = w1 * x2
+    x += x1 * w2
+    x += y1 * z2
+    x -= z1 * y2
+    y = w1 * y2
+    y -= x1 * z2
+    y += y1 * w2
+    y += z1 * x2
+    z = w1 * z2
+    z += x1 * y2
+    z -= y1 * x2
+    z += z1 * w2
+    if out is None:
+        out = np.empty(w.shape + (4,))
+    out[..., 0] = w
+    out[..., 1] = x
+    out[..., 2] = y
+    out[..., 3] = z
+    return out
+
+
+def rotate_vector_array(q: np.array, v: np.array, out=None) -> np.array:
+    """Rotate vectors v by quaternions q in one vectorized pass.
+
+    Supported shapes are
+        q (4,)   and v (N, 3): one rotation applied to a point cloud,
+        q (N, 4) and v (N, 3): each point rotated by its own quaternion,
+        q (N, 4) and v (3,):   one vector rotated by many quaternions.
+    The quaternions are normalized in bulk, degenerate ones act as identity.
+    out: an optional preallocated (N, 3) float64 buffer, which may alias v.
+    """
+    q = np.asarray(q, dtype=float)
+    squared_norm = np.einsum("...i,...i->...", q, q)
+    degenerate = squared_norm < 1e-12
+    scale = 1.0 / np.sqrt(np.where(degenerate, 1.0, squared_norm))
+    unit = np.empty(q.shape)
+    unit[..., 0] = np.where(degenerate, 1.0, q[..., 0] * scale)
+    for i in (1, 2, 3):
+        unit[..., i] = np.where(degenerate, 0.0, q[..., i] * scale)
+    return _rotate_unit_array(unit, v, out)
+
+
+def _rotate_unit_array(q: np.array, v: np.array, out=None) -> np.array:
+    """rotate_vector_array for quaternions that are already unit,
+    without normalizing them again.
+    """
+    v = np.asarray(v, dtype=float)
+    w, qx, qy, qz = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    vx, vy, vz = v[..., 0], v[..., 1], v[..., 2]
+
+    # t = 2 * q_vec x v
+    tx = qy * vz - qz * vy
+    tx *= 2
+    ty = qz * vx - qx * vz
+    ty *= 2
+    tz = qx * vy - qy * vx
+    tz *= 2
+
+    if out is None:
+        out = np.empty(np.broadcast(w, vx).shape + (3,))
+    # v + w * t + q_vec x t, each column only reads its own column of v
+    r = w * tx
+    r += vx
+    r += qy * tz
+    r -= qz * ty
+    out[..., 0] = r
+    r = w * ty
+    r += vy
+    r += qz * tx
+    r -= qx * tz
+    out[..., 1] = r
+    r = w * tz
+    r += vz
+    r += qx * ty
+    r -= qy * tx
+    out[..., 2] = r
+    return out
+
+
+class QuaternionArray:
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        """A stack of N quaternions stored as one contiguous (N, 4) float64
+        array whose columns are w, x, y, z.
+
+        data can be an (N, 4) array, a single (4,) vector, a Quaternion,
+        or a sequence of Quaternion objects.
+        """
+        if isinstance(data, Quaternion):
+            data = [data.to_vector()]
+        elif len(data) and isinstance(data[0], Quaternion):
+            data = [q.to_vector() for q in data]
+        self.data = np.ascontiguousarray(data, dtype=float).reshape(-1, 4)
+
+    @classmethod
+    def identity(cls, n: int):
+        data = np.zeros((n, 4))
+        data[:, 0] = 1.0
+        return cls(data)
+
+    @property
+    def w(self) -> np.array:
+        return self.data[:, 0]
+
+    @property
+    def x(self) -> np.array:
+        return self.data[:, 1]
+
+    @property
+    def y(self) -> np.array:
+        return self.data[:, 2]
+
+    @property
+    def z(self) -> np.array:
+        return self.data[:, 3]
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __repr__(self) -> str:
+        return "QuaternionArray({})".format(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return vector_to_quaternion(self.data[index])
+        return QuaternionArray(self.data[index])
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Quaternion):
+            value = value.to_vector()
+        elif isinstance(value, QuaternionArray):
+            value = value.data
+        self.data[index] = value
+
+    def __iter__(self):
+        for v in self.data:
+            yield vector_to_quaternion(v)
+
+    def to_quaternions(self) -> List[Quaternion]:
+        return [vector_to_quaternion(v) for v in self.data]
+
+    def to_vector(self) -> np.array:
+        """Return a copy of the (N, 4) data, like Quaternion.to_vector.
+        """
+        return self.data.copy()
+
+    def get_vector(self) -> np.array:
+        return self.data[:, 1:]
+
+    def conj(self):
+        data = -self.data
+        data[:, 0] *= -1
+        return QuaternionArray(data)
+
+    def norm_square(self) -> np.array:
+        return np.einsum("ij,ij->i", self.data, self.data)
+
+    def norm(self) -> np.array:
+        return np.sqrt(self.norm_square())
+
+    def is_unit(self) -> np.array:
+        return np.abs(self.norm_square() - 1) < 1e-12
+
+    def to_unit(self):
+        """Return equivalent unit quaternions,
+        degenerate entries are replaced by the identity.
+        """
+        squared_norm = self.norm_square()
+        degenerate = squared_norm < 1e-12
+        squared_norm[degenerate] = 1.0
+        data = self.data / np.sqrt(squared_norm)[:, None]
+        data[degenerate] = (1.0, 0.0, 0.0, 0.0)
+        return QuaternionArray(data)
+
+    def inv(self):
+        squared_norm = self.norm_square()
+        degenerate = squared_norm < 1e-12
+        squared_norm[degenerate] = 1.0
+        data = self.conj().data / squared_norm[:, None]
+        data[degenerate] = (1.0, 0.0, 0.0, 0.0)
+        return QuaternionArray(data)
+
+    @staticmethod
+    def __as_array(other):
+        if isinstance(other, QuaternionArray):
+            return other.data
+        if isinstance(other, Quaternion):
+            return other.to_vector().astype(float)
+        return None
+
+    def __add__(self, other):
+        v = self.__as_array(other)
+        if v is not None:
+            return QuaternionArray(self.data + v)
+        data = self.data.copy()
+        data[:, 0] += other
+        return QuaternionArray(data)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return self.__add__(-other)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __neg__(self):
+        return QuaternionArray(-self.data)
+
+    def __mul__(self, other):
+        v = self.__as_array(other)
+        if v is not None:
+            return QuaternionArray(quaternion_multiply_array(self.data, v))
+        return QuaternionArray(self.data * np.reshape(other, (-1, 1)))
+
+    def __rmul__(self, other):
+        if isinstance(other, Quaternion):
+            return QuaternionArray(
+                quaternion_multiply_array(other.to_vector().astype(float), self.data)
+            )
+        return QuaternionArray(self.data * np.reshape(other, (-1, 1)))
+
+    def __imul__(self, other):
+        v = self.__as_array(other)
+        if v is not None:
+            quaternion_multiply_array(self.data, v, out=self.data)
+        else:
+            self.data *= np.reshape(other, (-1, 1))
+        return self
+
+    def __truediv__(self, other):
+        if isinstance(other, QuaternionArray):
+            return self * other.inv()
+        if isinstance(other, Quaternion):
+            return self * other.inv()
+        return QuaternionArray(self.data / np.reshape(other, (-1, 1)))
+
+    def __rtruediv__(self, other):
+        if isinstance(other, Quaternion):
+            return other * self.inv()
+        return self.inv() * other
+
+    def __eq__(self, other):
+        """Elementwise comparison with the same tolerance as Quaternion,
+        returns a boolean array of length N.
+        """
+        v = self.__as_array(other)
+        if v is None:
+            return np.zeros(len(self), dtype=bool)
+        return np.all(np.abs(self.data - v) < 1e-12, axis=-1)
+
+    def __ne__(self, other):
+        return ~self.__eq__(other)
+
+    __hash__ = None
+
+    def rotate_vector(self, v: np.array, out=None) -> np.array:
+        """Rotate v (N, 3) or (3,) by every quaternion in the array.
+        """
+        return rotate_vector_array(self.data, v, out=out)
+
+    def to_rotation(self) -> np.array:
+        """Return the equivalent (N, 3, 3) stack of rotation matrices.
+        """
+        n = self.norm_square()
+        s = np.zeros_like(n)
+        np.divide(2.0, n, out=s, where=n != 0)
+        w, x, y, z = self.data.T
+        wx, wy, wz = s * w * x, s * w * y, s * w * z
+        xx, xy, xz = s * x * x, s * x * y, s * x * z
+        yy, yz, zz = s * y * y, s * y * z, s * z * z
+
+        R = np.empty((len(self), 3, 3))
+        R[:, 0, 0] = 1 - yy - zz
+        R[:, 0, 1] = xy - wz
+        R[:, 0, 2] = xz + wy
+        R[:, 1, 0] = xy + wz
+        R[:, 1, 1] = 1 - xx - zz
+        R[:, 1, 2] = yz - wx
+        R[:, 2, 0] = xz - wy
+        R[:, 2, 1] = wx + yz
+        R[:, 2, 2] = 1 - xx - yy
+        return R
@@ -26,3 +26,24 @@ def vex3D(S: np.array) -> np.array:
     """Convert skew symmetric representation to vector v
     """
     return np.array([S[2, 1], S[0, 2], S[1, 0]])
+
+
+def skew3D_array(v: np.array) -> np.array:
+    """The (N, 3, 3) skew symmetric representations of the (N, 3) vectors v
+    """
+    v = np.asarray(v, dtype=float).reshape(-1, 3)
+    S = np.zeros((v.shape[0], 3, 3))
+    S[:, 0, 1] = -v[:, 2]
+    S[:, 0, 2] = v[:, 1]
+    S[:, 1, 0] = v[:, 2]
+    S[:, 1, 2] = -v[:, 0]
+    S[:, 2, 0] = -v[:, 1]
+    S[:, 2, 1] = v[:, 0]
+    return S
+
+
+def vex3D_array(S: np.array) -> np.array:
+    """Convert (N, 3, 3) skew symmetric representations to (N, 3) vectors
+    """
+    S = np.asarray(S, dtype=float).reshape(-1, 3, 3)
+    return np.stack((S[:, 2, 1], S[:, 0, 2], S[:, 1, 0]), axis=1)
@@ -3,12 +3,15 @@ from typing import List
 import numpy as np
 
 from .conversions import rotation_to_quaternion
-from .quaternion import Quaternion, vector_to_quaternion
+from .lie import se3_exp, se3_log
+from .quaternion import Quaternion, QuaternionArray, vector_to_quaternion
 from .transform import (
     rotation2D,
     rotation2D_to_angle,
     transform2D,
+    transform2D_array,
     transform3D,
+    transform3D_array,
     wrap_2_pi,
 )
 
@@ -48,10 +51,13 @@ def quaternion_slerp(q0: Quaternion, q1: Quaternion, ratio: float) -> Quaternion
 
 
 def quaternion_slerp_array(
-    q0: Quaternion, q1: Quaternion, ratio_list
+    q0: Quaternion, q1: Quaternion, ratio_list, as_array=False
 ) -> List[Quaternion]:
     """Slerp is shorthand for spherical linear interpolation
     https://en.wikipedia.org/wiki/Slerp
+
+    as_array: return the unit quaternions as an (N, 4) array
+        instead of a list of Quaternion objects.
     """
     ratio_array = np.array(ratio_list).reshape(-1, 1)
     v0 = q0.to_vector()
@@ -77,7 +83,39 @@ def quaternion_slerp_array(
         s0 = np.cos(theta) - dot_v0_v1 * s1
         v = np.outer(s0, v0) + np.outer(s1, v1)
 
-    return [vector_to_quaternion(r).to_unit() for r in v]
+    v = QuaternionArray(v).to_unit().data
+    if as_array:
+        return v
+    return [vector_to_quaternion(r) for r in v]
+
+
+def quaternion_slerp_vectors(v0: np.array, v1: np.array, ratio) -> np.array:
+    """Vectorized slerp between stacked quaternion vectors v0 and v1 (..., 4)
+    at ratio (...), following numpy broadcasting.
+    Returns the interpolated unit quaternions as an (..., 4) array.
+    """
+    v0 = np.asarray(v0, dtype=float)
+    v1 = np.asarray(v1, dtype=float)
+    ratio = np.asarray(ratio, dtype=float)[..., None]
+    dot_v0_v1 = np.einsum("...i,...i->...", v0, v1)[..., None]
+
+    flip = dot_v0_v1 < 0.0
+    v1 = np.where(flip, -v1, v1)
+    dot_v0_v1 = np.abs(dot_v0_v1)
+
+    DOT_THRESHOLD = 0.9995
+    linear = dot_v0_v1 > DOT_THRESHOLD
+    theta_0 = np.arccos(np.minimum(dot_v0_v1, 1.0))
+    sin_theta_0 = np.where(linear, 1.0, np.sin(theta_0))
+    theta = theta_0 * ratio
+    s1 = np.where(linear, ratio, np.sin(theta) / sin_theta_0)
+    s0 = np.where(linear, 1.0 - ratio, np.cos(theta) - dot_v0_v1 * s1)
+    v = s0 * v0 + s1 * v1
+
+    squared_norm = np.einsum("...i,...i->...", v, v)[..., None]
+    degenerate = squared_norm < 1e-12
+    v = v / np.sqrt(np.where(degenerate, 1.0, squared_norm))
+    return np.where(degenerate, (1.0, 0.0, 0.0, 0.0), v)
 
 
 def transform3D_slerp(T0: np.array, T1: np.array, ratio: float) -> np.array:
@@ -97,7 +135,11 @@ def transform3D_slerp(T0: np.array, T1: np.array, ratio: float) -> np.array:
     return transform3D(l[0], l[1], l[2], r)
 
 
-def transform3D_slerp_array(T0: np.array, T1: np.array, ratio_list) -> List[np.array]:
+def transform3D_slerp_array(
+    T0: np.array, T1: np.array, ratio_list, as_array=False
+) -> List[np.array]:
+    """as_array: return an (N, 4, 4) stack instead of a list of matrices.
+    """
     # rotation
     r0 = T0[:3, :3]
     r1 = T1[:3, :3]
@@ -107,13 +149,15 @@ def transform3D_slerp_array(T0: np.array, T1: np.array, ratio_list) -> List[np.a
 
     q0 = rotation_to_quaternion(r0)
     q1 = rotation_to_quaternion(r1)
-    q = quaternion_slerp_array(q0, q1, ratio_list)
+    q = quaternion_slerp_array(q0, q1, ratio_list, as_array=True)
     ratio_array = np.array(ratio_list).reshape(-1, 1)
     l = l0 * (1 - ratio_array) + l1 * ratio_array
-    result = [
-        transform3D(l_i[0], l_i[1], l_i[2], q_i.to_rotation()) for l_i, q_i in zip(l, q)
-    ]
-    return result
+    result = transform3D_array(
+        l[:, 0], l[:, 1], l[:, 2], QuaternionArray(q).to_rotation()
+    )
+    if as_array:
+        return result
+    return list(result)
 
 
 def transform2D_slerp(T0: np.array, T1: np.array, ratio: float) -> np.array:
@@ -132,20 +176,91 @@ def transform2D_slerp(T0: np.array, T1: np.array, ratio: float) -> np.array:
     return transform2D(l[0], l[1], a)
 
 
-def transform2D_slerp_array(T0: np.array, T1: np.array, ratio_list) -> List[np.array]:
-    # rotation
-    r0 = T0[:2, :2]
-    r1 = T1[:2, :2]
-    # translation
-    l0 = T0[:2, 2]
-    l1 = T1[:2, 2]
+def transform2D_slerp_xytheta(T0: np.array, T1: np.array, ratio_list) -> np.array:
+    """Interpolate SE(2) matrices in one vectorized pass and return the
+    (N, 3) rows of x, y, theta.
 
-    angle0 = wrap_2_pi(rotation2D_to_angle(r0))
-    angle1 = wrap_2_pi(rotation2D_to_angle(r1))
-    ratio_array = np.array(ratio_list).reshape(-1, 1)
-    l = l0 * (1 - ratio_array) + l1 * ratio_array
-    result = [
-        transform2D(l_i[0], l_i[1], angle_interpolation(angle0, angle1, ratio))
-        for l_i, ratio in zip(l, ratio_array[:, 0])
-    ]
+    T0, T1: single (3, 3) matrices or (N, 3, 3) stacks of pose pairs,
+        broadcast against the ratios.
+    """
+    T0 = np.asarray(T0, dtype=float)
+    T1 = np.asarray(T1, dtype=float)
+    ratio = np.asarray(ratio_list, dtype=float).reshape(-1)
+
+    angle0 = np.arctan2(T0[..., 1, 0], T0[..., 0, 0])
+    angle1 = np.arctan2(T1[..., 1, 0], T1[..., 0, 0])
+    n = np.broadcast(angle0, angle1, ratio).shape[0]
+
+    result = np.empty((n, 3))
+    result[:, 0] = T0[..., 0, 2] * (1 - ratio) + T1[..., 0, 2] * ratio
+    result[:, 1] = T0[..., 1, 2] * (1 - ratio) + T1[..., 1, 2] * ratio
+    result[:, 2] = angle_interpolation(angle0, angle1, ratio)
     return result
+
+
+def transform2D_slerp_array(
+    T0: np.array, T1: np.array, ratio_list, as_array=False
+) -> List[np.array]:
+    """T0, T1: single (3, 3) matrices or (N, 3, 3) stacks of pose pairs.
+    as_array: return an (N, 3, 3) stack instead of a list of matrices.
+    """
+    xytheta = transform2D_slerp_xytheta(T0, T1, ratio_list)
+    result = transform2D_array(xytheta[:, 0], xytheta[:, 1], xytheta[:, 2])
+    if as_array:
+        return result
+    return list(result)
+
+
+class ScrewInterpolation:
+    """Screw linear interpolation (ScLERP) between SE(3) poses.
+
+    The relative motion T0^-1 T1 is a screw motion with twist
+    ξ = log(T0^-1 T1), and the interpolated pose is T0 exp(ratio ξ).
+    This is the same path as dual quaternion ScLERP, rotation and
+    translation move together along the rigid-body screw.
+
+    T0, T1: single 4x4 matrices or (M, 4, 4) stacks of pose pairs.
+    The twists are computed once here, every evaluation is a single
+    batched se3_exp and matmul.
+    """
+
+    __slots__ = ("T0", "twist")
+
+    def __init__(self, T0: np.array, T1: np.array):
+        T0 = np.asarray(T0, dtype=float).reshape(-1, 4, 4)
+        T1 = np.asarray(T1, dtype=float).reshape(-1, 4, 4)
+        R0_inv = T0[:, :3, :3].transpose(0, 2, 1)
+        relative = np.zeros(np.broadcast(T0, T1).shape)
+        relative[:, :3, :3] = R0_inv @ T1[:, :3, :3]
+        relative[:, :3, 3] = np.einsum(
+            "ijk,ik->ij", R0_inv, T1[:, :3, 3] - T0[:, :3, 3]
+        )
+        relative[:, 3, 3] = 1.0
+
+        self.T0 = T0
+        self.twist = se3_log(relative)
+
+    def __len__(self) -> int:
+        return self.twist.shape[0]
+
+    def __call__(self, ratio_list) -> np.array:
+        """Return the (N, 4, 4) stack of poses at ratio_list.
+
+        With a single pair every ratio is evaluated on it, with M pairs
+        ratio_list is a scalar or (M,) with one ratio per pair.
+        """
+        ratio = np.asarray(ratio_list, dtype=float).reshape(-1, 1)
+        return self.T0 @ se3_exp(ratio * self.twist)
+
+
+def transform3D_sclerp(T0: np.array, T1: np.array, ratio: float) -> np.array:
+    """Screw linear interpolation between SE(3) matrices T0 and T1
+    """
+    return ScrewInterpolation(T0, T1)(ratio)[0]
+
+
+def transform3D_sclerp_array(T0: np.array, T1: np.array, ratio_list) -> np.array:
+    """Screw linear interpolation returning an (N, 4, 4) stack,
+    see ScrewInterpolation for the accepted shapes.
+    """
+    return ScrewInterpolation(T0, T1)(ratio_list)
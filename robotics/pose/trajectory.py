@@ -0,0 +1,166 @@
+import numpy as np
+
+from .compact_pose import Pose3D, Pose3DArray
+from .conversions import rotation_to_quaternion_array
+from .slerp import quaternion_slerp_vectors
+
+
+class PoseTrajectory:
+    """Generate a keyframe SE(3) trajectory that is resampled at arbitrary times.
+
+    timestamps: (N,) strictly increasing keyframe times.
+    poses: an (N, 4, 4) stack of SE(3) matrices or a Pose3DArray.
+    max_keyframes: keep at most this many of the newest keyframes.
+    max_duration: drop keyframes older than the newest one minus this span.
+
+    Keyframes live in preallocated buffers, so append only writes one row
+    and eviction only moves the start of the live window. The live window
+    is compacted to the front of the buffers when it reaches their end.
+    """
+
+    __slots__ = (
+        "max_keyframes",
+        "max_duration",
+        "__stamps",
+        "__q",
+        "__t",
+        "__head",
+        "__tail",
+    )
+
+    def __init__(
+        self, timestamps=(), poses=None, max_keyframes=None, max_duration=None
+    ):
+        self.max_keyframes = max_keyframes
+        self.max_duration = max_duration
+        self.__stamps = np.empty(16)
+        self.__q = np.empty((16, 4))
+        self.__t = np.empty((16, 3))
+        self.__head = 0
+        self.__tail = 0
+        if len(timestamps):
+            self.extend(timestamps, poses)
+
+    def __len__(self) -> int:
+        return self.__tail - self.__head
+
+    @property
+    def timestamps(self) -> np.array:
+        return self.__stamps[self.__head : self.__tail]
+
+    @property
+    def poses(self) -> Pose3DArray:
+        return Pose3DArray(
+            self.__q[self.__head : self.__tail], self.__t[self.__head : self.__tail]
+        )
+
+    def start_time(self) -> float:
+        return self.__stamps[self.__head]
+
+    def end_time(self) -> float:
+        return self.__stamps[self.__tail - 1]
+
+    def append(self, t: float, pose):
+        """Append a keyframe, pose is a 4x4 SE(3) matrix or a Pose3D.
+        """
+        if isinstance(pose, Pose3D):
+            pose = Pose3DArray(pose.q, pose.t)
+        self.extend([t], pose)
+
+    def extend(self, timestamps, poses):
+        """Append keyframes in bulk, poses is an (N, 4, 4) stack or a Pose3DArray.
+        """
+        timestamps = np.asarray(timestamps, dtype=float).reshape(-1)
+        if isinstance(poses, Pose3DArray):
+            q, t = poses.q, poses.t
+        else:
+            poses = np.asarray(poses, dtype=float).reshape(-1, 4, 4)
+            q = rotation_to_quaternion_array(poses[:, :3, :3])
+            t = poses[:, :3, 3]
+        n = timestamps.shape[0]
+        if q.shape[0] != n or t.shape[0] != n:
+            raise ValueError("timestamps and poses should have the same length")
+        if np.any(np.diff(timestamps) <= 0) or (
+            len(self) and n and timestamps[0] <= self.end_time()
+        ):
+            raise ValueError("timestamps should be strictly increasing")
+
+        self.__reserve(n)
+        tail = self.__tail
+        self.__stamps[tail : tail + n] = timestamps
+        self.__q[tail : tail + n] = q
+        self.__t[tail : tail + n] = t
+        self.__tail += n
+        self.__evict()
+
+    def evict_before(self, t: float):
+        """Drop the keyframes older than t, keeping the one bracketing t.
+        """
+        idx = np.searchsorted(self.timestamps, t, side="right") - 1
+        self.__head += max(0, min(idx, len(self) - 1))
+
+    def sample(self, times, clamp=False) -> Pose3DArray:
+        """Return the poses at times as a Pose3DArray.
+
+        Rotations are slerped and translations lerped between the keyframes
+        bracketing every query, located with one searchsorted call.
+        clamp: hold the first/last keyframe outside of the covered range
+            instead of raising ValueError.
+        """
+        stamps = self.timestamps
+        if not len(stamps):
+            raise ValueError("trajectory has no keyframes")
+        times = np.asarray(times, dtype=float).reshape(-1)
+        if clamp:
+            times = np.clip(times, stamps[0], stamps[-1])
+        elif np.any(times < stamps[0]) or np.any(times > stamps[-1]):
+            raise ValueError(
+                "query times should be inside [{}, {}]".format(stamps[0], stamps[-1])
+            )
+
+        q = self.__q[self.__head : self.__tail]
+        t = self.__t[self.__head : self.__tail]
+        if len(stamps) == 1:
+            return Pose3DArray(np.repeat(q, len(times), 0), np.repeat(t, len(times), 0))
+
+        idx = np.searchsorted(stamps, times, side="right") - 1
+        np.clip(idx, 0, len(stamps) - 2, out=idx)
+        t0 = stamps[idx]
+        ratio = (times - t0) / (stamps[idx + 1] - t0)
+
+        r = ratio[:, None]
+        return Pose3DArray(
+            quaternion_slerp_vectors(q[idx], q[idx + 1], ratio),
+            t[idx] * (1 - r) + t[idx + 1] * r,
+        )
+
+    def sample_matrix(self, times, clamp=False, out=None) -> np.array:
+        """Return the poses at times as an (M, 4, 4) stack.
+        """
+        return self.sample(times, clamp=clamp).to_matrix(out=out)
+
+    def __reserve(self, n: int):
+        capacity = self.__stamps.shape[0]
+        if self.__tail + n <= capacity:
+            return
+        size = len(self)
+        if size + n > capacity // 2:
+            capacity = max(2 * capacity, 2 * (size + n))
+            stamps = np.empty(capacity)
+            q = np.empty((capacity, 4))
+            t = np.empty((capacity, 3))
+        else:
+            stamps, q, t = self.__stamps, self.__q, self.__t
+        live = slice(self.__head, self.__tail)
+        stamps[:size] = self.__stamps[live]
+        q[:size] = self.__q[live]
+        t[:size] = self.__t[live]
+        self.__stamps, self.__q, self.__t = stamps, q, t
+        self.__head = 0
+        self.__tail = size
+
+    def __evict(self):
+        if self.max_keyframes is not None and len(self) > self.max_keyframes:
+            self.__head = self.__tail - self.max_keyframes
+        if self.max_duration is not None and len(self):
+            self.evict_before(self.end_time() - self.max_duration)
@@ -96,6 +96,18 @@ def transform3D(x: float, y: float, z: float, R: np.array) -> np.array:
     return T
 
 
+def transform3D_inv(T: np.array) -> np.array:
+    """Returns the inverse of the SE(3) matrix T using R.T instead of a
+    general matrix inversion.
+    """
+    R_inv = rotation_inv(T[:3, :3])
+    T_inv = np.zeros((4, 4))
+    T_inv[:3, :3] = R_inv
+    T_inv[:3, 3] = -R_inv @ T[:3, 3]
+    T_inv[3, 3] = 1.0
+    return T_inv
+
+
 def transform3D_rpy(
     x: float, y: float, z: float, roll: float, pitch: float, yaw: float
 ) -> np.array:
@@ -132,3 +144,141 @@ def rotation3D_to_rpy(R: np.array) -> Tuple[float, float, float]:
         yaw = np.arctan2(R[1, 0], R[0, 0])
         pitch = -np.arctan(R[2, 0] * np.cos(roll) / R[2, 2])
     return roll, pitch, yaw
+
+
+def rotation3D_to_rpy_array(R: np.array) -> np.array:
+    """Return (N, 3) roll, pitch, yaw rows for an (N, 3, 3) stack of ZYX
+    rotation matrices, handling gimbal lock with masks as rotation3D_to_rpy.
+    """
+    R = np.asarray(R, dtype=float).reshape(-1, 3, 3)
+    r20 = R[:, 2, 0]
+    gimbal_lock = np.abs(1 - r20) < 1e-6
+    regular = ~gimbal_lock
+
+    rpy = np.empty((R.shape[0], 3))
+    roll = np.arctan2(R[:, 2, 1], R[:, 2, 2])
+    rpy[:, 0] = np.where(gimbal_lock, 0.0, roll)
+
+    pitch = np.empty(R.shape[0])
+    pitch[gimbal_lock] = -np.arcsin(r20[gimbal_lock])
+    pitch[regular] = -np.arctan(
+        r20[regular] * np.cos(roll[regular]) / R[regular, 2, 2]
+    )
+    rpy[:, 1] = pitch
+
+    locked_yaw = np.arctan2(-R[:, 0, 1], np.where(r20 < 0, R[:, 0, 2], -R[:, 0, 2]))
+    rpy[:, 2] = np.where(gimbal_lock, locked_yaw, np.arctan2(R[:, 1, 0], R[:, 0, 0]))
+    return rpy
+
+
+def _stack_buffer(out, n: int, shape) -> np.array:
+    if out is None:
+        return np.empty((n,) + shape)
+    if out.shape != (n,) + shape:
+        raise ValueError("out should have shape {}".format((n,) + shape))
+    return out
+
+
+def rotation2D_array(angle, out=None) -> np.array:
+    """Generate an (N, 2, 2) stack of SO(2) matrices.
+
+    out: an optional preallocated (N, 2, 2) buffer that is filled in place.
+    """
+    angle = np.atleast_1d(np.asarray(angle, dtype=float))
+    R = _stack_buffer(out, angle.shape[0], (2, 2))
+    np.cos(angle, out=R[:, 0, 0])
+    np.sin(angle, out=R[:, 1, 0])
+    np.negative(R[:, 1, 0], out=R[:, 0, 1])
+    R[:, 1, 1] = R[:, 0, 0]
+    return R
+
+
+def transform2D_array(x, y, angle, out=None) -> np.array:
+    """Generate an (N, 3, 3) stack of SE(2) matrices from arrays of
+    x, y and angle, scalars are broadcast.
+
+    out: an optional preallocated (N, 3, 3) buffer that is filled in place.
+    """
+    x, y, angle = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (x, y, angle))
+    )
+    T = _stack_buffer(out, angle.shape[0], (3, 3))
+    rotation2D_array(angle, out=T[:, :2, :2])
+    T[:, 0, 2] = x
+    T[:, 1, 2] = y
+    T[:, 2, :2] = 0.0
+    T[:, 2, 2] = 1.0
+    return T
+
+
+def rotation3D_rpy_array(roll, pitch, yaw, out=None) -> np.array:
+    """Generate an (N, 3, 3) stack of ZYX rotation matrices for arrays of
+    roll, pitch, yaw, scalars are broadcast.
+
+    out: an optional preallocated (N, 3, 3) buffer that is filled in place.
+    """
+    roll, pitch, yaw = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (roll, pitch, yaw))
+    )
+    R = _stack_buffer(out, roll.shape[0], (3, 3))
+
+    sr = np.sin(roll)
+    cr = np.cos(roll)
+    sp = np.sin(pitch)
+    cp = np.cos(pitch)
+    sy = np.sin(yaw)
+    cy = np.cos(yaw)
+    cy_sp = cy * sp
+    sy_sp = sy * sp
+
+    np.multiply(cy, cp, out=R[:, 0, 0])
+    R[:, 0, 1] = cy_sp * sr - sy * cr
+    R[:, 0, 2] = cy_sp * cr + sy * sr
+    np.multiply(sy, cp, out=R[:, 1, 0])
+    R[:, 1, 1] = sy_sp * sr + cy * cr
+    R[:, 1, 2] = sy_sp * cr - cy * sr
+    np.negative(sp, out=R[:, 2, 0])
+    np.multiply(cp, sr, out=R[:, 2, 1])
+    np.multiply(cp, cr, out=R[:, 2, 2])
+    return R
+
+
+def transform3D_array(x, y, z, R: np.array, out=None) -> np.array:
+    """Generate an (N, 4, 4) stack of SE(3) matrices for arrays of x, y, z
+    and an (N, 3, 3) stack (or a single 3x3) of rotation matrices.
+
+    out: an optional preallocated (N, 4, 4) buffer that is filled in place.
+    """
+    R = np.asarray(R, dtype=float)
+    x, y, z = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (x, y, z))
+    n = np.broadcast(x, y, z, R[..., 0, 0]).shape[0]
+    T = _stack_buffer(out, n, (4, 4))
+    T[:, :3, :3] = R
+    T[:, 0, 3] = x
+    T[:, 1, 3] = y
+    T[:, 2, 3] = z
+    T[:, 3, :3] = 0.0
+    T[:, 3, 3] = 1.0
+    return T
+
+
+def transform3D_rpy_array(x, y, z, roll, pitch, yaw, out=None) -> np.array:
+    """Generate an (N, 4, 4) stack of ZYX transform matrices for arrays of
+    x, y, z, roll, pitch, yaw, scalars are broadcast.
+
+    out: an optional preallocated (N, 4, 4) buffer that is filled in place.
+    """
+    x, y, z, roll, pitch, yaw = np.broadcast_arrays(
+        *(
+            np.atleast_1d(np.asarray(v, dtype=float))
+            for v in (x, y, z, roll, pitch, yaw)
+        )
+    )
+    T = _stack_buffer(out, x.shape[0], (4, 4))
+    rotation3D_rpy_array(roll, pitch, yaw, out=T[:, :3, :3])
+    T[:, 0, 3] = x
+    T[:, 1, 3] = y
+    T[:, 2, 3] = z
+    T[:, 3, :3] = 0.0
+    T[:, 3, 3] = 1.0
+    return T
@@ -0,0 +1,224 @@
+import bisect
+
+import numpy as np
+
+from .slerp import transform3D_slerp
+from .transform import transform3D_inv
+
+
+class TransformEdge:
+    """The transform from a child frame to its parent frame.
+
+    A static edge holds a single SE(3) matrix. A dynamic edge keeps a
+    bounded history of (timestamp, SE(3) matrix) samples sorted by time.
+    """
+
+    __slots__ = ("parent", "static", "stamps", "transforms", "buffer_size")
+
+    def __init__(self, parent, buffer_size=100):
+        self.parent = parent
+        self.static = None
+        self.stamps = []
+        self.transforms = []
+        self.buffer_size = buffer_size
+
+    def is_static(self) -> bool:
+        return self.static is not None
+
+    def set_static(self, T: np.array):
+        self.static = T
+        self.stamps = []
+        self.transforms = []
+
+    def add_sample(self, t: float, T: np.array):
+        self.static = None
+        if not self.stamps or t > self.stamps[-1]:
+            self.stamps.append(t)
+            self.transforms.append(T)
+        else:
+            idx = bisect.bisect_left(self.stamps, t)
+            if idx < len(self.stamps) and self.stamps[idx] == t:
+                self.transforms[idx] = T
+            else:
+                self.stamps.insert(idx, t)
+                self.transforms.insert(idx, T)
+
+        excess = len(self.stamps) - self.buffer_size
+        if excess > 0:
+            del self.stamps[:excess]
+            del self.transforms[:excess]
+
+    def get(self, t=None) -> np.array:
+        """Return the transform at time t, slerping between the
+        neighbouring samples of a dynamic edge.
+        """
+        if self.static is not None:
+            return self.static
+        if not self.stamps:
+            raise ValueError("edge has no transform")
+        if t is None:
+            return self.transforms[-1]
+        if t < self.stamps[0] or t > self.stamps[-1]:
+            raise ValueError(
+                "time {} is outside of the buffered range [{}, {}]".format(
+                    t, self.stamps[0], self.stamps[-1]
+                )
+            )
+
+        idx = bisect.bisect_left(self.stamps, t)
+        if self.stamps[idx] == t:
+            return self.transforms[idx]
+        t0 = self.stamps[idx - 1]
+        t1 = self.stamps[idx]
+        ratio = (t - t0) / (t1 - t0)
+        return transform3D_slerp(self.transforms[idx - 1], self.transforms[idx], ratio)
+
+
+class TransformTree:
+    """A tree of named coordinate frames connected by SE(3) edges.
+
+    Every frame has at most one parent. Transforms composed over static
+    edges are cached, and the cache entries below an edge are dropped
+    whenever that edge is attached, moved or set static, so repeated
+    lookups within static subtrees are dictionary hits. Adding samples to
+    a dynamic edge does not touch the cache.
+
+    buffer_size: the number of samples kept for every dynamic edge.
+    """
+
+    def __init__(self, buffer_size=100):
+        self.buffer_size = buffer_size
+        self.__edges = {}
+        self.__children = {}
+        self.__cache = {}
+
+    def __contains__(self, frame) -> bool:
+        return frame in self.__edges or frame in self.__children
+
+    def frames(self) -> set:
+        return set(self.__edges) | set(self.__children)
+
+    def parent(self, frame):
+        edge = self.__edges.get(frame)
+        return None if edge is None else edge.parent
+
+    def set_transform(self, parent, child, T: np.array, t=None):
+        """Set the transform mapping points in child to parent.
+
+        Without t the edge becomes static and replaces any history,
+        otherwise the sample is added to the time-indexed buffer of the edge.
+        """
+        if parent == child:
+            raise ValueError("a frame can not be its own parent")
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor == child:
+                raise ValueError(
+                    "{} is an ancestor of {}, this would create a cycle".format(
+                        child, parent
+                    )
+                )
+            ancestor = self.parent(ancestor)
+
+        edge = self.__edges.get(child)
+        # lookups over dynamic edges are never cached, so a new sample on an
+        # edge that was already dynamic leaves the cache valid
+        keep_cache = (
+            t is not None
+            and edge is not None
+            and edge.parent == parent
+            and not edge.is_static()
+        )
+        if edge is None or edge.parent != parent:
+            if edge is not None:
+                self.__children[edge.parent].discard(child)
+            edge = TransformEdge(parent, self.buffer_size)
+            self.__edges[child] = edge
+            self.__children.setdefault(parent, set()).add(child)
+        self.__children.setdefault(child, set())
+
+        T = np.array(T, dtype=float)
+        if t is None:
+            edge.set_static(T)
+        else:
+            edge.add_sample(t, T)
+        if not keep_cache:
+            self.__invalidate(child)
+
+    def remove_frame(self, frame):
+        """Detach frame from its parent, its children become roots.
+        """
+        edge = self.__edges.pop(frame, None)
+        if edge is not None:
+            self.__children[edge.parent].discard(frame)
+        for child in self.__children.pop(frame, set()):
+            del self.__edges[child]
+            self.__invalidate(child)
+        self.__invalidate(frame)
+
+    def lookup(self, target, source, t=None) -> np.array:
+        """Return the SE(3) matrix mapping points in source to target.
+
+        t: the query time for dynamic edges, which are slerped between the
+            neighbouring samples. None uses the latest sample of each edge.
+        """
+        key = (target, source)
+        cached = self.__cache.get(key)
+        if cached is not None:
+            return cached
+
+        source_chain = self.__chain(source)
+        target_chain = self.__chain(target)
+        target_index = {frame: i for i, frame in enumerate(target_chain)}
+        for i, frame in enumerate(source_chain):
+            if frame in target_index:
+                ancestor = frame
+                source_chain = source_chain[:i]
+                target_chain = target_chain[: target_index[frame]]
+                break
+        else:
+            raise ValueError("{} and {} are not connected".format(target, source))
+
+        static = True
+        T_ancestor_source = np.eye(4)
+        for frame in source_chain:
+            edge = self.__edges[frame]
+            static &= edge.is_static()
+            T_ancestor_source = edge.get(t) @ T_ancestor_source
+        T_ancestor_target = np.eye(4)
+        for frame in target_chain:
+            edge = self.__edges[frame]
+            static &= edge.is_static()
+            T_ancestor_target = edge.get(t) @ T_ancestor_target
+
+        T = transform3D_inv(T_ancestor_target) @ T_ancestor_source
+        if static:
+            T.flags.writeable = False
+            self.__cache[key] = T
+        return T
+
+    def __chain(self, frame) -> list:
+        """Return frame followed by all its ancestors up to the root.
+        """
+        if frame not in self:
+            raise ValueError("unknown frame {}".format(frame))
+        chain = [frame]
+        edge = self.__edges.get(frame)
+        while edge is not None:
+            chain.append(edge.parent)
+            edge = self.__edges.get(edge.parent)
+        return chain
+
+    def __invalidate(self, frame):
+        """Drop the cached lookups that involve frame or any of its descendants.
+        """
+        if not self.__cache:
+            return
+        subtree = set()
+        stack = [frame]
+        while stack:
+            f = stack.pop()
+            subtree.add(f)
+            stack.extend(self.__children.get(f, ()))
+        for key in [k for k in self.__cache if k[0] in subtree or k[1] in subtree]:
+            del self.__cache[key]
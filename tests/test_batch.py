@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+def simulate_bicycle(scenario, out):
+    if scenario["L"] <= 0.0:
+        raise ValueError("invalid wheelbase")
+    if scenario["L"] > 100.0:
+        os._exit(1)
+    model = rbt.BicycleModel(
+        x=scenario["x"],
+        L=scenario["L"],
+        v=1.0,
+        max_steering_angle=scenario["max_steering_angle"],
+        history=rbt.ColumnarHistory(out=out),
+    )
+    model.rollout_Euler_by_phi_and_accel(np.full(scenario["steps"], 0.3), 0.0, 0.1)
+    return len(model.history)
+
+
+def reference(scenario):
+    model = rbt.BicycleModel(
+        x=scenario["x"],
+        L=scenario["L"],
+        v=1.0,
+        max_steering_angle=scenario["max_steering_angle"],
+    )
+    for _ in range(scenario["steps"]):
+        model.update_Euler_by_phi_and_accel(0.3, 0.0, 0.1)
+    return model
+
+
+class TestRunBatch:
+    scenarios = {
+        "x": [0.0, 1.0, 2.0, 3.0, 4.0],
+        "L": [1.0, 2.0, -1.0, 3.0, 4.0],
+        "max_steering_angle": [0.2, 0.4, 0.4, 0.6, 0.8],
+        "steps": [10, 20, 30, 40, 60],
+    }
+
+    @pytest.mark.parametrize("processes, chunksize", [(0, 1), (2, 2)])
+    def test_results_and_failures(self, processes, chunksize):
+        calls = []
+        with rbt.run_batch(
+            simulate_bicycle,
+            self.scenarios,
+            rbt.BicycleModel.COLUMNS,
+            max_steps=50,
+            processes=processes,
+            chunksize=chunksize,
+            progress=lambda done, total: calls.append((done, total)),
+        ) as result:
+            assert result.failed() == [2, 4]
+            assert "invalid wheelbase" in result.errors[2]
+            assert "50 records" in result.errors[4]
+            assert calls[-1] == (5, 5)
+            for i in (0, 1, 3):
+                scenario = rbt.model.batch._scenario_rows(self.scenarios)[i]
+                states = result.result(i)
+                model = reference(scenario)
+                assert result.lengths[i] == scenario["steps"] + 1
+                assert_array_almost_equal(states["x"], model.x_history)
+                assert_array_almost_equal(states["theta"], model.theta_history)
+                assert result.wall_time[i] > 0.0
+            summary = result.summary()
+            assert summary["failed"] == 2
+            assert summary["scenarios_per_second"] > 0.0
+
+    def test_mismatched_columns(self):
+        with rbt.run_batch(
+            simulate_bicycle,
+            self.scenarios,
+            rbt.UnicycleModel.COLUMNS,
+            max_steps=100,
+            processes=0,
+        ) as result:
+            assert result.failed() == [0, 1, 2, 3, 4]
+            assert "columns" in result.errors[0]
+            assert not result.data.any()
+
+    def test_worker_crash(self):
+        scenarios = [
+            {"x": float(i), "L": 1000.0 if i == 3 else 1.0, "max_steering_angle": 0.5}
+            for i in range(6)
+        ]
+        for scenario in scenarios:
+            scenario["steps"] = 5
+        with rbt.run_batch(
+            simulate_bicycle, scenarios, rbt.BicycleModel.COLUMNS, 10, 2, chunksize=2
+        ) as result:
+            assert result.failed() == [3]
+            assert result.errors[3] == "worker process died"
+            assert_almost_equal(result.result(5)["x"][0], 5.0)
+            assert list(result.lengths) == [6, 6, 6, 0, 6, 6]
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestColumnarLog:
+    def test_write_and_read(self, tmp_path):
+        path = str(tmp_path / "run.log")
+        rows = np.random.RandomState(0).randn(1000, 3)
+        rows[:, 0] = np.arange(1000) * 0.01
+        with rbt.LogWriter(path, ("time", "x", "y"), chunk_size=64) as writer:
+            for row in rows[:10]:
+                writer.append(row)
+            writer.extend(rows[10:500])
+            writer.extend(rows[500:])
+
+        reader = rbt.LogReader(path, index_stride=100)
+        assert len(reader) == 1000
+        assert reader.columns == ("time", "x", "y")
+        assert isinstance(reader.data, np.memmap)
+        assert_array_almost_equal(reader.data, rows)
+        assert_array_almost_equal(reader["x"], rows[:, 1])
+        # zero-copy views of the mapped file
+        assert np.shares_memory(reader.column("y"), reader.data)
+
+        window = reader.time_slice(2.505, 7.0)
+        assert np.shares_memory(window, reader.data)
+        assert_array_almost_equal(window, rows[251:700])
+        assert len(reader.time_slice(stop=0.0)) == 0
+        assert len(reader.time_slice(9.99)) == 1
+
+    def test_truncated_and_invalid(self, tmp_path):
+        path = str(tmp_path / "run.log")
+        with rbt.LogWriter(path, ("time", "x")) as writer:
+            writer.extend(np.ones((5, 2)))
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 12)
+        assert len(rbt.LogReader(path)) == 5
+
+        with open(path, "wb") as f:
+            f.write(b"not a log")
+        with pytest.raises(ValueError):
+            rbt.LogReader(path)
+
+    def test_model_streaming(self, tmp_path):
+        path = str(tmp_path / "bicycle.log")
+        reference = rbt.BicycleModel(L=2.0, v=1.0)
+        history = rbt.LogHistory(path, chunk_size=16, decimation=2)
+        model = rbt.BicycleModel(L=2.0, v=1.0, history=history)
+        for m in (reference, model):
+            for _ in range(25):
+                m.update_Euler_by_phi_and_accel(0.2, 0.1, 0.1)
+            m.rollout_Euler_by_phi_and_accel(np.full(50, -0.1), 0.0, 0.1)
+
+        assert_array_almost_equal(model.x_history, reference.x_history[::2])
+        history.close()
+        reader = rbt.LogReader(path)
+        assert reader.columns == rbt.BicycleModel.COLUMNS
+        assert len(reader) == 38
+        assert_almost_equal(reader["theta"][-1], reference.theta_history[-2])
+        assert_array_almost_equal(
+            reader.time_slice(0.95, 1.95)[:, 0], np.arange(10, 20, 2) * 0.1
+        )
+
+    def test_history_reader_is_cached(self, tmp_path):
+        history = rbt.LogHistory(str(tmp_path / "unicycle.log"), chunk_size=8)
+        model = rbt.UnicycleModel(v=1.0, history=history)
+        model.rollout_Euler_by_omega_and_v(0.1, 1.0, [0.1] * 20)
+        assert len(history) == 21
+        reader = history.reader()
+        assert history.reader() is reader
+        assert np.shares_memory(model.x_history, reader.data)
+
+        model.update_Euler_by_omega_and_v(0.1, 1.0, 0.1)
+        assert len(history) == 22
+        assert history.reader() is not reader
+        assert len(model.x_history) == 22
+        history.close()
+        assert history.reader() is history.reader()
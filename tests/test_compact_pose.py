@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+def random_pose3D(rng):
+    return rbt.Pose3D(rbt.QuaternionArray(rng.randn(4))[0], rng.randn(3))
+
+
+class TestPose2D:
+    def test_theta_wrapped(self):
+        assert_almost_equal(rbt.Pose2D(0.0, 0.0, 3 * np.pi / 2).theta, -np.pi / 2)
+        assert rbt.Pose2D(0.0, 0.0, 0.3).theta == 0.3
+        data = np.array([[0.0, 0.0, 7.0], [1.0, 1.0, -0.5]])
+        poses = rbt.Pose2DArray(data)
+        assert_array_almost_equal(poses.theta, [7.0 - 2 * np.pi, -0.5])
+        assert data[0, 2] == 7.0
+
+    def test_matches_matrix(self):
+        a = rbt.Pose2D(1.0, 2.0, 0.3)
+        b = rbt.Pose2D(-0.5, 0.4, 2.9)
+        assert_array_almost_equal((a * b).to_matrix(), a.to_matrix() @ b.to_matrix())
+        assert_array_almost_equal(a.inv().to_matrix(), np.linalg.inv(a.to_matrix()))
+        assert a * a.inv() == rbt.Pose2D()
+        assert rbt.Pose2D.from_matrix(b.to_matrix()) == b
+
+        p = np.array([[1.0, 2.0], [3.0, -1.0]])
+        expected = (a.to_matrix() @ np.vstack((p.T, np.ones(2))))[:2].T
+        assert_array_almost_equal(a.transform_point(p), expected)
+        assert_array_almost_equal(a.transform_point(p[0]), expected[0])
+
+    def test_interpolate(self):
+        a = rbt.Pose2D(0.0, 0.0, 0.75 * np.pi)
+        b = rbt.Pose2D(2.0, 4.0, -0.75 * np.pi)
+        assert_array_almost_equal(
+            a.interpolate(b, 0.5).to_matrix(),
+            rbt.transform2D_slerp(a.to_matrix(), b.to_matrix(), 0.5),
+        )
+
+    def test_array(self):
+        rng = np.random.RandomState(0)
+        a = rbt.Pose2DArray(rng.uniform(-3, 3, (10, 3)))
+        b = rbt.Pose2DArray(rng.uniform(-3, 3, (10, 3)))
+        assert_array_almost_equal(
+            (a * b).to_matrix(), a.to_matrix() @ b.to_matrix()
+        )
+        assert_array_almost_equal(a.inv().to_matrix(), np.linalg.inv(a.to_matrix()))
+        assert_array_almost_equal(
+            (a[0] * b).to_matrix(), a[0].to_matrix() @ b.to_matrix()
+        )
+        assert_array_almost_equal(
+            rbt.Pose2DArray.from_matrix(a.to_matrix()).data, a.data
+        )
+        c = a.interpolate(b, 0.3)
+        for i in range(10):
+            assert c[i] == a[i].interpolate(b[i], 0.3)
+            assert_array_almost_equal(
+                a.transform_point([1.0, 2.0])[i], a[i].transform_point([1.0, 2.0])
+            )
+
+
+class TestPose3D:
+    def test_matches_matrix(self):
+        rng = np.random.RandomState(0)
+        a = random_pose3D(rng)
+        b = random_pose3D(rng)
+        assert_array_almost_equal((a * b).to_matrix(), a.to_matrix() @ b.to_matrix())
+        assert_array_almost_equal(a.inv().to_matrix(), np.linalg.inv(a.to_matrix()))
+        assert a * a.inv() == rbt.Pose3D()
+        assert rbt.Pose3D.from_matrix(b.to_matrix()) == b
+
+        p = rng.randn(5, 3)
+        expected = (a.to_matrix() @ np.vstack((p.T, np.ones(5))))[:3].T
+        assert_array_almost_equal(a.transform_point(p), expected)
+        assert_array_almost_equal(a.transform_point(p[0]), expected[0])
+
+    def test_interpolate(self):
+        rng = np.random.RandomState(1)
+        a = random_pose3D(rng)
+        b = random_pose3D(rng)
+        assert_array_almost_equal(
+            a.interpolate(b, 0.3).to_matrix(),
+            rbt.transform3D_slerp(a.to_matrix(), b.to_matrix(), 0.3),
+        )
+
+    def test_array(self):
+        rng = np.random.RandomState(2)
+        a = rbt.Pose3DArray.from_poses([random_pose3D(rng) for _ in range(10)])
+        b = rbt.Pose3DArray.from_poses([random_pose3D(rng) for _ in range(10)])
+        assert_array_almost_equal(
+            (a * b).to_matrix(), a.to_matrix() @ b.to_matrix()
+        )
+        assert_array_almost_equal(a.inv().to_matrix(), np.linalg.inv(a.to_matrix()))
+        assert_array_almost_equal(
+            (a[0] * b).to_matrix(), a[0].to_matrix() @ b.to_matrix()
+        )
+        assert_array_almost_equal(
+            (a * b[0]).to_matrix(), a.to_matrix() @ b[0].to_matrix()
+        )
+        assert np.all(rbt.QuaternionArray((a * b).inv().q).is_unit())
+        assert_array_almost_equal(
+            rbt.Pose3DArray.from_matrix(a.to_matrix()).to_matrix(), a.to_matrix()
+        )
+        ratio = np.linspace(0, 1, 10)
+        c = a.interpolate(b, ratio)
+        points = a.transform_point(np.array([1.0, 2.0, 3.0]))
+        for i in range(10):
+            assert c[i] == a[i].interpolate(b[i], ratio[i])
+            assert_array_almost_equal(
+                points[i], a[i].transform_point(np.array([1.0, 2.0, 3.0]))
+            )
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestCumulativeCompose:
+    def setup_method(self):
+        rng = np.random.RandomState(0)
+        self.xyt = rng.uniform(-0.5, 0.5, (101, 3))
+        self.T2 = rbt.transform2D_array(self.xyt[:, 0], self.xyt[:, 1], self.xyt[:, 2])
+        self.P3 = rbt.Pose3DArray(rng.randn(101, 4), rng.randn(101, 3))
+        self.T3 = self.P3.to_matrix()
+
+    def test_matrix_stacks(self):
+        expected = [self.T2[0]]
+        for T in self.T2[1:]:
+            expected.append(expected[-1] @ T)
+
+        for method in ("loop", "doubling", "blocked"):
+            result = rbt.cumulative_compose(self.T2, method=method, validate=True)
+            assert_array_almost_equal(result, np.array(expected))
+
+        result = rbt.cumulative_compose(self.T3, block_size=7, workers=4, validate=True)
+        assert_array_almost_equal(
+            result[-1], np.linalg.multi_dot(list(self.T3))
+        )
+
+    def test_compact_poses(self):
+        T2 = rbt.cumulative_compose(self.T2)
+        for method in ("doubling", "blocked"):
+            P2 = rbt.cumulative_compose(
+                rbt.Pose2DArray(self.xyt), method=method, workers=3, validate=True
+            )
+            assert_array_almost_equal(P2.to_matrix(), T2)
+
+            P3 = rbt.cumulative_compose(self.P3, method=method, validate=True)
+            assert_array_almost_equal(P3.to_matrix(), rbt.cumulative_compose(self.T3))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            rbt.cumulative_compose(self.T2, method="unknown")
+        with pytest.raises(ValueError):
+            rbt.cumulative_compose(np.zeros((3, 3, 4)))
+        assert len(rbt.cumulative_compose(np.zeros((0, 4, 4)))) == 0
@@ -36,3 +36,46 @@ class TestConversions:
             np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
         )
         assert_array_almost_equal(axis, axis_z * np.pi / 2)
+
+    def test_batched_conversions_match_scalar(self):
+        rng = np.random.RandomState(0)
+        rpy = rng.uniform(-np.pi / 2, np.pi / 2, (30, 3))
+        R = np.array([rbt.rotation3D_rpy(*a) for a in rpy])
+        # identity, half turns about every axis and a gimbal locked matrix
+        R = np.concatenate(
+            (
+                R,
+                [
+                    np.eye(3),
+                    rbt.rotation3D_x(np.pi),
+                    rbt.rotation3D_y(np.pi),
+                    rbt.rotation3D_z(np.pi),
+                    rbt.rotation3D_rpy(0.3, -np.pi / 2, 0.1),
+                ],
+            )
+        )
+
+        q = rbt.rotation_to_quaternion_array(R)
+        axis = rbt.rotation3D_to_axis_angle_array(R)
+        rpy_back = rbt.rotation3D_to_rpy_array(R)
+        for i in range(len(R)):
+            assert rbt.vector_to_quaternion(q[i]) == rbt.rotation_to_quaternion(R[i])
+            assert_array_almost_equal(axis[i], rbt.rotation3D_to_axis_angle(R[i]))
+            assert_array_almost_equal(rpy_back[i], rbt.rotation3D_to_rpy(R[i]))
+
+        q = rbt.rpy_to_quaternion_array(rpy)
+        for i in range(len(rpy)):
+            assert rbt.vector_to_quaternion(q[i]) == rbt.rpy_to_quaternion(*rpy[i])
+
+        axis = rng.randn(30, 3)
+        axis[0] = 0.0
+        q = rbt.axis_angle_to_quaternion_array(axis)
+        axis_back = rbt.quaternion_to_axis_angle_array(q)
+        for i in range(len(axis)):
+            assert rbt.vector_to_quaternion(q[i]) == rbt.axis_angle_to_quaternion(
+                axis[i]
+            )
+            assert_array_almost_equal(
+                axis_back[i],
+                rbt.quaternion_to_axis_angle(rbt.vector_to_quaternion(q[i])),
+            )
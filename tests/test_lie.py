@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+def numerical_left_jacobian(exp, log, xi, eps=1e-6):
+    """Column i is log(exp(ξ + ε e_i) exp(ξ)^-1) / ε
+    """
+    T_inv = np.linalg.inv(exp(xi))
+    columns = []
+    for i in range(len(xi)):
+        delta = np.zeros(len(xi))
+        delta[i] = eps
+        columns.append(log(exp(xi + delta) @ T_inv) / eps)
+    return np.array(columns).T
+
+
+class TestLie:
+    def setup_method(self):
+        rng = np.random.RandomState(0)
+        self.phi = np.concatenate(
+            (
+                rng.uniform(-1.5, 1.5, (20, 3)),
+                [[0.0, 0.0, 0.0], [1e-5, -2e-5, 3e-6], [0.0, 0.0, np.pi - 1e-4]],
+            )
+        )
+        self.xi = np.concatenate((rng.randn(len(self.phi), 3), self.phi), axis=1)
+
+    def test_skew_vex_array(self):
+        S = rbt.skew3D_array(self.phi)
+        for i in range(len(self.phi)):
+            assert_array_almost_equal(S[i], rbt.skew3D(self.phi[i]))
+        assert_array_almost_equal(rbt.vex3D_array(S), self.phi)
+
+    def test_so3(self):
+        R = rbt.so3_exp(self.phi)
+        for i in range(len(self.phi)):
+            assert_array_almost_equal(R[i], rbt.rotation3D_axis_angle(self.phi[i]))
+        assert_array_almost_equal(rbt.so3_log(R), self.phi)
+        assert_array_almost_equal(
+            rbt.so3_log(rbt.rotation3D_x(np.pi)), [np.pi, 0, 0]
+        )
+        assert_array_almost_equal(rbt.so3_exp(self.phi[0]), R[0])
+
+    def test_so3_jacobians(self):
+        J_l = rbt.so3_left_jacobian(self.phi)
+        J_r = rbt.so3_right_jacobian(self.phi)
+        for i in range(len(self.phi) - 1):
+            assert_array_almost_equal(
+                J_l[i],
+                numerical_left_jacobian(rbt.so3_exp, rbt.so3_log, self.phi[i]),
+                decimal=5,
+            )
+            assert_array_almost_equal(J_r[i], J_l[i].T)
+        assert_array_almost_equal(
+            rbt.so3_left_jacobian_inv(self.phi) @ J_l,
+            np.broadcast_to(np.eye(3), J_l.shape),
+        )
+        assert_array_almost_equal(
+            rbt.so3_right_jacobian_inv(self.phi) @ J_r,
+            np.broadcast_to(np.eye(3), J_r.shape),
+        )
+
+    def test_se3(self):
+        T = rbt.se3_exp(self.xi)
+        assert_array_almost_equal(T[:, :3, :3], rbt.so3_exp(self.phi))
+        assert_array_almost_equal(rbt.se3_log(T), self.xi)
+        assert_array_almost_equal(rbt.se3_log(rbt.se3_exp(self.xi[3])), self.xi[3])
+
+        J_l = rbt.se3_left_jacobian(self.xi)
+        J_r = rbt.se3_right_jacobian(self.xi)
+        for i in range(len(self.xi) - 1):
+            assert_array_almost_equal(
+                J_l[i],
+                numerical_left_jacobian(rbt.se3_exp, rbt.se3_log, self.xi[i]),
+                decimal=5,
+            )
+            assert_array_almost_equal(J_r[i], rbt.se3_left_jacobian(-self.xi[i]))
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestBicycleRollouts:
+    def test_matches_bicycle_model(self):
+        rng = np.random.RandomState(0)
+        controls = rng.randn(4, 30, 2)
+        states = rbt.bicycle_rollouts(
+            (1.0, -1.0, 0.3, 2.0), controls, 0.05, L=2.0, max_steering_angle=0.4
+        )
+        assert states.shape == (4, 31, 4)
+        for k in range(4):
+            model = rbt.BicycleModel(
+                1.0, -1.0, 0.3, L=2.0, v=2.0, max_steering_angle=0.4
+            )
+            for phi, accel in controls[k]:
+                model.update_Euler_by_phi_and_accel(phi, accel, 0.05)
+            for i, name in enumerate(rbt.BICYCLE_STATE):
+                assert_array_almost_equal(
+                    states[k, :, i], model.history.column(name), decimal=12
+                )
+
+    def test_quadratic_cost(self):
+        states = np.zeros((2, 3, 4))
+        states[1, :, 0] = 1.0
+        states[1, :, 2] = 2 * np.pi
+        controls = np.ones((2, 2, 2))
+        cost = rbt.QuadraticCost(
+            (0, 0, 0, 0), Q=(1, 1, 1, 0), R=(0.5, 0), terminal=(2, 0, 0, 0)
+        )
+        # two running and one terminal state error, wrapped heading error 0
+        assert_array_almost_equal(cost(states, controls), [1.0, 5.0])
+
+
+class TestMPPI:
+    def make(self, **kwargs):
+        goal = rbt.QuadraticCost(
+            (5.0, 2.0, 0.0, 0.0), Q=(0, 0, 0, 0), terminal=(1, 1, 0, 0)
+        )
+        return rbt.MPPI(
+            np.zeros((40, 2)),
+            0.1,
+            goal,
+            samples=500,
+            temperature=0.1,
+            L=2.0,
+            max_steering_angle=0.5,
+            sigma=(0.2, 0.5),
+            seed=0,
+            **kwargs
+        )
+
+    def test_update_reduces_cost(self):
+        state = (0.0, 0.0, 0.0, 1.0)
+        mppi = self.make()
+
+        def nominal_cost():
+            controls = mppi.nominal[None]
+            states = rbt.bicycle_rollouts(state, controls, 0.1, 2.0, 0.5)
+            return mppi.cost(states, controls)[0]
+
+        initial = nominal_cost()
+        for _ in range(10):
+            nominal = mppi.update(state)
+        assert nominal_cost() < 0.1 * initial
+        assert mppi.states.shape == (500, 41, 4)
+        assert_almost_equal(mppi.weights.sum(), 1.0)
+        assert np.all(np.abs(nominal[:, 0]) <= 0.5)
+
+        last = nominal[-1].copy()
+        mppi.shift(3)
+        assert_array_almost_equal(mppi.nominal[-4:], np.tile(last, (4, 1)))
+
+    def test_shift_bounds(self):
+        mppi = self.make()
+        mppi.nominal[:] = np.arange(80).reshape(40, 2)
+        mppi.shift(0)
+        assert_array_almost_equal(mppi.nominal, np.arange(80).reshape(40, 2))
+        mppi.shift(100)
+        assert_array_almost_equal(mppi.nominal, np.tile([78, 79], (40, 1)))
+        with pytest.raises(ValueError):
+            mppi.shift(-1)
+
+    @pytest.mark.parametrize("processes", [0, 2])
+    def test_chunked_matches_unchunked(self, processes):
+        state = (0.0, 0.0, 0.0, 1.0)
+        reference = self.make().update(state)
+        with self.make(processes=processes, chunk_size=128) as mppi:
+            assert_array_almost_equal(mppi.update(state), reference)
+            assert mppi.states is None
@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestPIDBank:
+    def test_matches_scalar(self):
+        rng = np.random.RandomState(0)
+        n = 5
+        gains = rng.uniform(0, 2, (3, n))
+        bank = rbt.PIDBank(n, *gains)
+        pids = [rbt.PID(*gains[:, i]) for i in range(n)]
+
+        times = np.cumsum(rng.uniform(0, 0.1, (50, n)), axis=0)
+        times[10] = times[9]  # dt == 0 on every channel
+        times[20, 2] = times[19, 2] - 0.05  # dt < 0 on one channel
+        errors = rng.randn(50, n)
+        for k in range(50):
+            if k == 30:
+                mask = np.array([True, False, True, False, False])
+                bank.reset(mask)
+                for i in np.flatnonzero(mask):
+                    pids[i] = rbt.PID(*gains[:, i])
+            output = bank.step(errors[k], times[k])
+            expected = [
+                pid.get_output(errors[k, i], times[k, i]) for i, pid in enumerate(pids)
+            ]
+            assert_array_almost_equal(output, expected)
+            assert_array_almost_equal(bank.I, [pid.I for pid in pids])
+
+    def test_scalar_time(self):
+        bank = rbt.PIDBank(3, kP=1.0, kI=1.0)
+        assert_array_almost_equal(bank.step(np.ones(3), 0.0), np.ones(3))
+        assert_array_almost_equal(bank.step(np.ones(3), 0.5), np.full(3, 1.5))
+
+    def test_outputs_are_kept(self):
+        bank = rbt.PIDBank(3, kP=1.0)
+        first = bank.step(np.ones(3), 0.0)
+        second = bank.step(np.full(3, 2.0), 0.1)
+        assert first is not second
+        assert_array_almost_equal(first, np.ones(3))
+        assert_array_almost_equal(second, np.full(3, 2.0))
+
+
+class TestPIDClampingBank:
+    def test_matches_scalar(self):
+        rng = np.random.RandomState(1)
+        n = 6
+        gains = rng.uniform(0, 2, (3, n))
+        max_output = rng.uniform(0.5, 2, n)
+        min_output = -rng.uniform(0.5, 2, n)
+        # channel 0 uses the default symmetric limit
+        min_output[0] = -max_output[0]
+        bank = rbt.PIDClampingBank(
+            n, *gains, max_output=max_output, min_output=min_output
+        )
+        pids = [rbt.PIDClamping(*gains[:, 0], max_output=max_output[0])] + [
+            rbt.PIDClamping(
+                *gains[:, i], max_output=max_output[i], min_output=min_output[i]
+            )
+            for i in range(1, n)
+        ]
+
+        times = np.cumsum(rng.uniform(0, 0.1, (200, n)), axis=0)
+        times[10] = times[9]
+        # slowly varying errors drive the integrators into the limits
+        errors = np.cumsum(rng.randn(200, n), axis=0) * 0.3
+        saturated = np.zeros(n, dtype=bool)
+        for k in range(200):
+            output = bank.step(errors[k], times[k])
+            expected = [
+                pid.get_output(errors[k, i], times[k, i]) for i, pid in enumerate(pids)
+            ]
+            assert_array_almost_equal(output, expected)
+            assert_array_almost_equal(bank.I, [pid.I for pid in pids])
+            assert_array_almost_equal(bank.last_I, [pid.last_I for pid in pids])
+            saturated |= (output >= max_output) | (output <= min_output)
+        assert np.any(saturated)
+
+    def test_outputs_are_kept(self):
+        bank = rbt.PIDClampingBank(3, kP=1.0, max_output=5.0)
+        first = bank.step(np.ones(3), 0.0)
+        second = bank.step(np.full(3, 2.0), 0.1)
+        assert first is not second
+        assert_array_almost_equal(first, np.ones(3))
+        assert_array_almost_equal(second, np.full(3, 2.0))
+
+
+class TestPIDReplay:
+    def setup_method(self):
+        rng = np.random.RandomState(2)
+        self.timestamps = np.cumsum(rng.uniform(0, 0.1, 300))
+        self.timestamps[20] = self.timestamps[19]
+        self.timestamps[40] = self.timestamps[39] - 0.05
+        self.errors = np.cumsum(rng.randn(300)) * 0.3
+
+    def test_pid_replay(self):
+        pid = rbt.PID(1.2, 0.7, 0.1)
+        output, I, D = rbt.pid_replay(self.errors, self.timestamps, 1.2, 0.7, 0.1)
+        for k in range(len(self.errors)):
+            assert output[k] == pytest.approx(
+                pid.get_output(self.errors[k], self.timestamps[k])
+            )
+            assert I[k] == pytest.approx(pid.I)
+            assert D[k] == pytest.approx(pid.D)
+
+    def test_pid_clamping_replay(self):
+        pid = rbt.PIDClamping(1.2, 0.7, 0.1, max_output=1.5, min_output=-0.8)
+        output, I, D = rbt.pid_clamping_replay(
+            self.errors, self.timestamps, 1.2, 0.7, 0.1, 1.5, -0.8
+        )
+        for k in range(len(self.errors)):
+            assert output[k] == pytest.approx(
+                pid.get_output(self.errors[k], self.timestamps[k])
+            )
+            assert I[k] == pytest.approx(pid.I)
+            assert D[k] == pytest.approx(pid.D)
+
+
+class TestPIDFixedRate:
+    def test_matches_positional_form(self):
+        rng = np.random.RandomState(3)
+        kP, kI, kD, Ts = 1.2, 0.7, 0.1, 0.01
+        pid = rbt.PIDFixedRate(Ts, kP, kI, kD)
+        errors = rng.randn(100)
+        integral = 0.0
+        last_error = 0.0
+        for e in errors:
+            integral += e * Ts
+            expected = kP * e + kI * integral + kD * (e - last_error) / Ts
+            last_error = e
+            assert pid.step(e) == pytest.approx(expected)
+
+    def test_clamping(self):
+        pid = rbt.PIDFixedRate(0.1, kP=1.0, kI=10.0, max_output=2.0)
+        for _ in range(100):
+            assert pid.step(1.0) <= 2.0
+        # no windup, the output leaves the limit as soon as the error flips
+        assert pid.step(-1.0) < 2.0
+
+        with pytest.raises(ValueError):
+            rbt.PIDFixedRate(0.0)
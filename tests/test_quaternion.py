@@ -66,3 +66,109 @@ class TestQuaternion:
         assert q.conj().x == -q.x
         assert q.conj().y == -q.y
         assert q.conj().z == -q.z
+
+
+class TestQuaternionArray:
+    def test_construction_and_indexing(self):
+        q_list = [rbt.Quaternion(1, 2, 3, 4), rbt.Quaternion(2, 3, 4, 5)]
+        qa = rbt.QuaternionArray(q_list)
+        assert len(qa) == 2
+        assert qa.data.shape == (2, 4)
+        assert qa.data.flags["C_CONTIGUOUS"]
+        assert qa[0] == q_list[0]
+        assert qa[1] == q_list[1]
+        assert len(qa[:1]) == 1
+
+        qa[0] = rbt.Quaternion(0, 1, 0, 0)
+        assert qa[0] == rbt.Quaternion(0, 1, 0, 0)
+        assert all(q == q_list[1] for q in qa[1:])
+
+    def test_in_place_multiply(self):
+        rng = np.random.RandomState(1)
+        a = rbt.QuaternionArray(rng.randn(20, 4))
+        b = rbt.QuaternionArray(rng.randn(20, 4))
+        q = rbt.Quaternion(*rng.randn(4))
+
+        expected = (a * b).data
+        a *= b
+        assert_array_almost_equal(a.data, expected)
+
+        expected = (a * q).data
+        a *= q
+        assert_array_almost_equal(a.data, expected)
+
+    def test_matches_scalar(self):
+        rng = np.random.RandomState(0)
+        a = rbt.QuaternionArray(rng.randn(50, 4))
+        b = rbt.QuaternionArray(rng.randn(50, 4))
+
+        product = a * b
+        unit = a.to_unit()
+        inverse = a.inv()
+        for i in range(len(a)):
+            assert product[i] == a[i] * b[i]
+            assert unit[i] == a[i].to_unit()
+            assert inverse[i] == a[i].inv()
+            assert a.conj()[i] == a[i].conj()
+            assert_array_almost_equal(a.to_rotation()[i], a[i].to_rotation())
+
+        assert_array_almost_equal(a.norm_square(), [q.norm_square() for q in a])
+        assert np.all(unit.is_unit())
+        assert np.all((a * a.inv()) == rbt.Quaternion(1, 0, 0, 0))
+
+    def test_broadcast_with_quaternion(self):
+        q = rbt.Quaternion(np.sqrt(2) / 2, np.sqrt(2) / 2, 0, 0)
+        qa = rbt.QuaternionArray.identity(3)
+        assert np.all(qa * q == q)
+        assert np.all(q * qa == q)
+        assert np.all(2 * qa == rbt.Quaternion(2, 0, 0, 0))
+        assert np.all(qa + 1 == rbt.Quaternion(2, 0, 0, 0))
+
+    def test_quaternion_on_either_side(self):
+        rng = np.random.RandomState(2)
+        q = rbt.Quaternion(*rng.randn(4))
+        qa = rbt.QuaternionArray(rng.randn(5, 4))
+        for i in range(len(qa)):
+            assert (q + qa)[i] == q + qa[i]
+            assert (qa + q)[i] == qa[i] + q
+            assert (q - qa)[i] == q - qa[i]
+            assert (qa - q)[i] == qa[i] - q
+            assert (q / qa)[i] == q / qa[i]
+            assert (qa / q)[i] == qa[i] / q
+        assert np.all(2 / qa == 2 * qa.inv())
+
+    def test_to_vector_is_a_copy(self):
+        qa = rbt.QuaternionArray.identity(2)
+        v = qa.to_vector()
+        v[:] = 0.0
+        assert np.all(qa == rbt.Quaternion(1, 0, 0, 0))
+
+    def test_degenerate(self):
+        qa = rbt.QuaternionArray(np.zeros((2, 4)))
+        assert np.all(qa.to_unit() == rbt.Quaternion(1, 0, 0, 0))
+        assert np.all(qa.inv() == rbt.Quaternion(1, 0, 0, 0))
+
+    def test_rotate_vector_array(self):
+        rng = np.random.RandomState(1)
+        q = rbt.Quaternion(1, 2, 3, 4)
+        points = rng.randn(20, 3)
+        expected = np.array([q.rotate_vector(p) for p in points])
+        assert_array_almost_equal(q.rotate_vector(points), expected)
+        assert_array_almost_equal(
+            rbt.rotate_vector_array(q.to_vector(), points), expected
+        )
+
+        qa = rbt.QuaternionArray(rng.randn(20, 4))
+        expected = np.array([qa[i].rotate_vector(points[i]) for i in range(20)])
+        out = np.empty((20, 3))
+        result = qa.rotate_vector(points, out=out)
+        assert result is out
+        assert_array_almost_equal(out, expected)
+
+        v = np.array([1.0, 2.0, 3.0])
+        expected = np.array([qi.rotate_vector(v) for qi in qa])
+        assert_array_almost_equal(qa.rotate_vector(v), expected)
+
+        in_place = points.copy()
+        rbt.rotate_vector_array(q.to_vector(), in_place, out=in_place)
+        assert_array_almost_equal(in_place, q.rotate_vector(points))
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestScheduler:
+    def test_simulated_multi_rate(self):
+        scheduler = rbt.Scheduler(rbt.SimulatedClock())
+        model = rbt.BicycleModel(v=1.0)
+        pid = rbt.PID(kP=2.0)
+        command = {"phi": 0.0}
+
+        def set_steering(output):
+            command["phi"] = output
+
+        scheduler.add_controller(
+            pid,
+            0.001,
+            lambda t: 0.1 - model.theta,
+            set_steering,
+            name="heading",
+        )
+        scheduler.add_model(
+            model,
+            0.02,
+            lambda t: (command["phi"], 0.0),
+            method="update_Euler_by_phi_and_accel",
+            name="model",
+        )
+        calls = []
+
+        async def planner(t):
+            calls.append(t)
+
+        scheduler.add_task(planner, 0.5, name="planner", offset=0.1)
+        scheduler.run_sync(2.0)
+
+        stats = {row["name"]: row for row in scheduler.summary()}
+        assert stats["heading"]["runs"] == 2000
+        assert stats["model"]["runs"] == 100
+        assert_array_almost_equal(calls, [0.1, 0.6, 1.1, 1.6])
+        assert stats["heading"]["latency_max"] == 0.0
+        assert stats["model"]["jitter_max"] < 1e-9
+        assert stats["model"]["overruns"] == 0
+        assert model.time == pytest.approx(2.0)
+        assert model.theta == pytest.approx(0.1, abs=1e-2)
+
+    def test_overruns(self):
+        clock = rbt.SimulatedClock()
+        scheduler = rbt.Scheduler(clock)
+
+        def slow(t):
+            clock.time += 0.25
+
+        scheduler.add_task(slow, 0.1, name="slow")
+        scheduler.run_sync(1.0)
+        stats = scheduler.stats["slow"]
+        assert stats.latency.count == 4
+        # 0.1 and 0.2 are skipped after every run
+        assert stats.overruns.total == 8
+        assert stats.overruns.counts[:3] == [0, 0, 4]
+        assert scheduler.summary()[0]["overruns_max"] == 2
+        assert stats.execution.max == pytest.approx(0.25)
+
+    def test_monotonic_clock(self):
+        scheduler = rbt.Scheduler()
+        calls = []
+        scheduler.add_task(calls.append, 0.01, name="fast")
+        scheduler.run_sync(0.05)
+        # real time smoke test, the exact count depends on the machine load
+        assert len(calls) >= 1
+        assert scheduler.stats["fast"].latency.count == len(calls)
+
+        with pytest.raises(ValueError):
+            scheduler.add_task(calls.append, 0.01, name="fast")
+        with pytest.raises(ValueError):
+            scheduler.add_task(calls.append, 0.0)
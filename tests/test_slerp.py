@@ -71,3 +71,74 @@ class TestSlerp:
             T_list[2],
             np.array([[1, 0, 0, 5], [0, 1, 0, -5], [0, 0, 1, 5], [0, 0, 0, 1]]),
         )
+
+    def test_slerp_array_out(self):
+        T0 = rbt.transform3D_rpy(0, 0, 0, 0.1, 0.2, 0.3)
+        T1 = rbt.transform3D_rpy(10, -10, 10, -0.3, 0.5, 2.0)
+        ratio = np.linspace(0, 1, 7)
+
+        T_stack = rbt.transform3D_slerp_array(T0, T1, ratio, as_array=True)
+        assert T_stack.shape == (7, 4, 4)
+        for T, r in zip(T_stack, ratio):
+            assert_array_almost_equal(T, rbt.transform3D_slerp(T0, T1, r))
+
+        q0 = rbt.rotation_to_quaternion(T0[:3, :3])
+        q1 = rbt.rotation_to_quaternion(T1[:3, :3])
+        q = rbt.quaternion_slerp_array(q0, q1, ratio, as_array=True)
+        assert q.shape == (7, 4)
+        assert_array_almost_equal(np.linalg.norm(q, axis=1), np.ones(7))
+        for q_i, r in zip(q, ratio):
+            assert rbt.vector_to_quaternion(q_i) == rbt.quaternion_slerp(q0, q1, r)
+        assert_array_almost_equal(
+            rbt.quaternion_slerp_vectors(q0.to_vector(), q1.to_vector(), ratio), q
+        )
+
+    def test_transform2D_slerp_many_pairs(self):
+        rng = np.random.RandomState(0)
+        xyt0 = rng.uniform(-np.pi, np.pi, (6, 3))
+        xyt1 = rng.uniform(-np.pi, np.pi, (6, 3))
+        T0 = rbt.transform2D_array(xyt0[:, 0], xyt0[:, 1], xyt0[:, 2])
+        T1 = rbt.transform2D_array(xyt1[:, 0], xyt1[:, 1], xyt1[:, 2])
+        ratio = np.linspace(0, 1, 6)
+
+        T_stack = rbt.transform2D_slerp_array(T0, T1, ratio, as_array=True)
+        xytheta = rbt.transform2D_slerp_xytheta(T0, T1, ratio)
+        for i in range(6):
+            expected = rbt.transform2D_slerp(T0[i], T1[i], ratio[i])
+            assert_array_almost_equal(T_stack[i], expected)
+            assert_array_almost_equal(
+                rbt.transform2D(*xytheta[i]), expected
+            )
+
+    def test_transform3D_sclerp(self):
+        T0 = rbt.transform3D_rpy(1, 2, 3, 0.1, 0.2, 0.3)
+        T1 = rbt.transform3D_rpy(-2, 4, 0, 0.5, -0.4, 2.0)
+        assert_array_almost_equal(rbt.transform3D_sclerp(T0, T1, 0), T0)
+        assert_array_almost_equal(rbt.transform3D_sclerp(T0, T1, 1), T1)
+
+        # the rotation follows slerp, the translation follows the screw
+        ratio = np.linspace(0, 1, 5)
+        T = rbt.transform3D_sclerp_array(T0, T1, ratio)
+        T_slerp = rbt.transform3D_slerp_array(T0, T1, ratio, as_array=True)
+        assert_array_almost_equal(T[:, :3, :3], T_slerp[:, :3, :3])
+
+        # a pure rotation about the z axis through (1, 0, 0) stays on the circle
+        T0 = rbt.transform3D(2, 0, 0, np.eye(3))
+        T1 = rbt.transform3D(1, 1, 0, rbt.rotation3D_z(np.pi / 2))
+        T = rbt.transform3D_sclerp(T0, T1, 0.5)
+        assert_almost_equal(np.linalg.norm(T[:3, 3] - [1, 0, 0]), 1.0)
+
+    def test_screw_interpolation_many_pairs(self):
+        rng = np.random.RandomState(0)
+        a = rng.uniform(-1, 1, (4, 6))
+        b = rng.uniform(-1, 1, (4, 6))
+        T0 = rbt.transform3D_rpy_array(*a.T)
+        T1 = rbt.transform3D_rpy_array(*b.T)
+        ratio = np.array([0.1, 0.4, 0.6, 0.9])
+        interpolation = rbt.ScrewInterpolation(T0, T1)
+        assert len(interpolation) == 4
+        T = interpolation(ratio)
+        for i in range(4):
+            assert_array_almost_equal(
+                T[i], rbt.transform3D_sclerp(T0[i], T1[i], ratio[i])
+            )
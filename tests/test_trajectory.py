@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+def keyframes(n):
+    timestamps = np.arange(n, dtype=float) * 0.5
+    angles = np.linspace(0, 3, n)
+    poses = rbt.transform3D_rpy_array(
+        timestamps, -timestamps, 1.0, angles, 0.2, angles
+    )
+    return timestamps, poses
+
+
+class TestPoseTrajectory:
+    def test_sample_matches_slerp(self):
+        timestamps, poses = keyframes(10)
+        trajectory = rbt.PoseTrajectory(timestamps, poses)
+        times = np.array([0.0, 0.1, 1.3, 2.0, 4.5])
+        result = trajectory.sample_matrix(times)
+        for T, time in zip(result, times):
+            i = min(int(time // 0.5), 8)
+            ratio = (time - timestamps[i]) / 0.5
+            assert_array_almost_equal(
+                T, rbt.transform3D_slerp(poses[i], poses[i + 1], ratio)
+            )
+
+        with pytest.raises(ValueError):
+            trajectory.sample([5.0])
+        assert_array_almost_equal(
+            trajectory.sample_matrix([-1.0, 9.0], clamp=True), poses[[0, -1]]
+        )
+
+    def test_streaming(self):
+        timestamps, poses = keyframes(100)
+        trajectory = rbt.PoseTrajectory(max_keyframes=5)
+        for time, T in zip(timestamps, poses):
+            trajectory.append(time, T)
+        assert len(trajectory) == 5
+        assert_array_almost_equal(trajectory.timestamps, timestamps[-5:])
+        assert_array_almost_equal(
+            trajectory.sample_matrix([49.25])[0],
+            rbt.transform3D_slerp(poses[-2], poses[-1], 0.5),
+        )
+
+        with pytest.raises(ValueError):
+            trajectory.append(0.0, poses[0])
+
+        trajectory = rbt.PoseTrajectory(timestamps[:4], poses[:4], max_duration=1.2)
+        trajectory.extend(timestamps[4:60], rbt.Pose3DArray.from_matrix(poses[4:60]))
+        assert trajectory.start_time() <= timestamps[59] - 1.2
+        assert trajectory.start_time() > timestamps[59] - 1.7
+        trajectory.evict_before(timestamps[58] + 0.1)
+        assert_array_almost_equal(trajectory.timestamps, timestamps[58:60])
@@ -123,3 +123,46 @@ class TestTransform:
         assert roll == pytest.approx(0.1, 1e-9)
         assert pitch == pytest.approx(0.2, 1e-9)
         assert yaw == pytest.approx(0.3, 1e-9)
+
+    def test_batched_constructors(self):
+        rng = np.random.RandomState(0)
+        x, y, z, roll, pitch, yaw = rng.randn(6, 10)
+
+        R2 = rbt.rotation2D_array(yaw)
+        T2 = rbt.transform2D_array(x, y, yaw)
+        R3 = rbt.rotation3D_rpy_array(roll, pitch, yaw)
+        T3 = rbt.transform3D_array(x, y, z, R3)
+        T3_rpy = rbt.transform3D_rpy_array(x, y, z, roll, pitch, yaw)
+        for i in range(10):
+            assert_array_almost_equal(R2[i], rbt.rotation2D(yaw[i]))
+            assert_array_almost_equal(T2[i], rbt.transform2D(x[i], y[i], yaw[i]))
+            assert_array_almost_equal(
+                R3[i], rbt.rotation3D_rpy(roll[i], pitch[i], yaw[i])
+            )
+            assert_array_almost_equal(T3[i], rbt.transform3D(x[i], y[i], z[i], R3[i]))
+            assert_array_almost_equal(
+                T3_rpy[i],
+                rbt.transform3D_rpy(x[i], y[i], z[i], roll[i], pitch[i], yaw[i]),
+            )
+
+        assert_array_almost_equal(
+            rbt.transform3D_array(x, y, z, np.eye(3))[:, :3, :3],
+            np.broadcast_to(np.eye(3), (10, 3, 3)),
+        )
+
+    def test_batched_constructors_out(self):
+        yaw = np.linspace(-np.pi, np.pi, 5)
+        out = np.full((5, 4, 4), np.nan)
+        result = rbt.transform3D_rpy_array(1.0, 2.0, 3.0, 0.0, 0.0, yaw, out=out)
+        assert result is out
+        assert_array_almost_equal(out[:, 3], np.tile([0, 0, 0, 1.0], (5, 1)))
+        assert_array_almost_equal(out[:, :3, 3], np.tile([1.0, 2.0, 3.0], (5, 1)))
+
+        out = np.empty((5, 3, 3))
+        assert rbt.transform2D_array(0.0, 0.0, yaw, out=out) is out
+        with pytest.raises(ValueError):
+            rbt.transform2D_array(0.0, 0.0, yaw, out=np.empty((4, 3, 3)))
+
+    def test_transform3D_inv(self):
+        T = rbt.transform3D_rpy(1, 2, 3, 0.1, 0.2, 0.3)
+        assert_array_almost_equal(rbt.transform3D_inv(T), np.linalg.inv(T))
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestTransformTree:
+    def setup_method(self):
+        self.T_map_odom = rbt.transform3D_rpy(1, 2, 0, 0, 0, 0.5)
+        self.T_base_lidar = rbt.transform3D_rpy(0.2, 0, 0.5, 0, 0.1, 0)
+        self.T_base_camera = rbt.transform3D_rpy(0.3, 0.1, 0.4, 0.2, 0, 0)
+
+        self.tree = rbt.TransformTree(buffer_size=3)
+        self.tree.set_transform("map", "odom", self.T_map_odom)
+        self.tree.set_transform("base", "lidar", self.T_base_lidar)
+        self.tree.set_transform("base", "camera", self.T_base_camera)
+
+    def test_static_lookup(self):
+        tree = self.tree
+        assert_array_almost_equal(tree.lookup("map", "odom"), self.T_map_odom)
+        assert_array_almost_equal(
+            tree.lookup("camera", "lidar"),
+            np.linalg.inv(self.T_base_camera) @ self.T_base_lidar,
+        )
+        assert tree.lookup("camera", "lidar") is tree.lookup("camera", "lidar")
+        assert_array_almost_equal(tree.lookup("base", "base"), np.eye(4))
+
+        with pytest.raises(ValueError):
+            tree.lookup("map", "lidar")
+        with pytest.raises(ValueError):
+            tree.set_transform("lidar", "base", np.eye(4))
+
+    def test_cache_invalidation(self):
+        tree = self.tree
+        T = tree.lookup("camera", "lidar")
+        T_base_lidar = rbt.transform3D_rpy(0, 0, 1, 0, 0, 0)
+        tree.set_transform("base", "lidar", T_base_lidar)
+        assert tree.lookup("camera", "lidar") is not T
+        assert_array_almost_equal(
+            tree.lookup("camera", "lidar"),
+            np.linalg.inv(self.T_base_camera) @ T_base_lidar,
+        )
+
+    def test_dynamic_samples_keep_cache(self):
+        tree = self.tree
+        tree.set_transform("odom", "base", np.eye(4), t=0.0)
+        T = tree.lookup("camera", "lidar")
+        for k in range(1, 5):
+            tree.set_transform("odom", "base", np.eye(4), t=float(k))
+        assert tree.lookup("camera", "lidar") is T
+
+        # a dynamic edge set static again still invalidates its subtree
+        T_odom_base = rbt.transform3D_rpy(1, 0, 0, 0, 0, 0)
+        T_map_base = tree.lookup("map", "base", t=4.0)
+        tree.set_transform("odom", "base", T_odom_base)
+        assert_array_almost_equal(
+            tree.lookup("map", "lidar"),
+            self.T_map_odom @ T_odom_base @ self.T_base_lidar,
+        )
+        assert_array_almost_equal(T_map_base, self.T_map_odom)
+
+    def test_time_indexed_lookup(self):
+        tree = self.tree
+        T0 = rbt.transform3D_rpy(0, 0, 0, 0, 0, 0)
+        T1 = rbt.transform3D_rpy(10, 0, 0, 0, 0, 1.0)
+        tree.set_transform("odom", "base", T0, t=0.0)
+        tree.set_transform("odom", "base", T1, t=1.0)
+
+        expected = self.T_map_odom @ rbt.transform3D_slerp(T0, T1, 0.25)
+        assert_array_almost_equal(tree.lookup("map", "base", t=0.25), expected)
+        assert_array_almost_equal(
+            tree.lookup("map", "lidar", t=0.25), expected @ self.T_base_lidar
+        )
+        assert_array_almost_equal(
+            tree.lookup("map", "base"), self.T_map_odom @ T1
+        )
+        with pytest.raises(ValueError):
+            tree.lookup("map", "base", t=1.5)
+
+        # the oldest sample is evicted once the buffer is full
+        tree.set_transform("odom", "base", T1, t=2.0)
+        tree.set_transform("odom", "base", T1, t=3.0)
+        with pytest.raises(ValueError):
+            tree.lookup("map", "base", t=0.5)
@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+class TestTuning:
+    def setup_method(self):
+        self.scenario = rbt.PathFollowingScenario.from_waypoints(
+            [0.0, 10.0, 20.0, 30.0], [0.0, 2.0, -2.0, 0.0], ds=0.2, y0=1.0, dt=0.1
+        )
+        self.gains = rbt.gain_grid(kP=[0.0, 1.0, 3.0], kI=[0.0, 0.1])
+
+    def test_rollout(self):
+        result = self.scenario.rollout(3.0, 0.0, 0.0)
+        error = result["cross_track_error"]
+        assert result["completion"] > 0.95
+        assert abs(error[0]) > 0.9
+        assert np.max(np.abs(error[len(error) // 3 :])) < 0.5
+
+    def test_tune_gains(self, tmp_path):
+        ranked = rbt.tune_gains(self.scenario, self.gains, processes=0)
+        assert len(ranked) == len(self.gains)
+        costs = [row["cost"] for row in ranked]
+        assert costs == sorted(costs)
+        assert ranked[0]["kP"] > 0.0
+        assert ranked[-1]["kP"] == 0.0
+
+        checkpoint = str(tmp_path / "sweep.jsonl")
+        calls = []
+        rbt.tune_gains(
+            self.scenario, self.gains[:2], processes=2, checkpoint=checkpoint
+        )
+        resumed = rbt.tune_gains(
+            self.scenario,
+            self.gains,
+            processes=2,
+            checkpoint=checkpoint,
+            progress=lambda done, total: calls.append(done),
+        )
+        assert calls[0] == 2
+        assert calls[-1] == len(self.gains)
+        with open(checkpoint) as f:
+            assert len(f.readlines()) == len(self.gains)
+        assert [row["cost"] for row in resumed] == pytest.approx(costs)
+
+    def test_failed_rollout(self):
+        ranked = rbt.tune_gains(
+            self.scenario,
+            [[1.0, 0.0, 0.0]],
+            metrics={"bad": lambda result: 1 / 0},
+            processes=0,
+        )
+        assert ranked[0]["cost"] == np.inf
+        assert "ZeroDivisionError" in ranked[0]["error"]
+
+    def test_custom_metrics_without_weights(self):
+        ranked = rbt.tune_gains(
+            self.scenario,
+            self.gains,
+            metrics={"rms": rbt.rms_cross_track_error},
+            processes=0,
+        )
+        for row in ranked:
+            assert row["cost"] == row["rms"]
+        assert ranked[0]["kP"] > 0.0
+
+    def test_unknown_weight(self):
+        with pytest.raises(ValueError):
+            rbt.tune_gains(
+                self.scenario,
+                self.gains,
+                weights={"rms_crosstrack_error": 1.0},
+                processes=0,
+            )
@@ -0,0 +1,286 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_almost_equal
+
+import robotics as rbt
+
+
+def drive(model, n=50):
+    for i in range(n):
+        model.update_Euler_by_omega_and_accel(0.1 * np.sin(0.1 * i), 0.2, 0.1)
+    return model
+
+
+class TestHistory:
+    def test_backends_match_lists(self):
+        reference = drive(rbt.BicycleModel(L=2.0))
+        columnar = drive(rbt.BicycleModel(L=2.0, history=rbt.ColumnarHistory(4)))
+        assert isinstance(reference.x_history, list)
+        assert len(reference.x_history) == 51
+        for name in rbt.BicycleModel.COLUMNS:
+            assert_array_almost_equal(
+                columnar.history.column(name), reference.history.column(name)
+            )
+        assert_array_almost_equal(columnar.phi_history, reference.phi_history)
+        # zero-copy views of the column store
+        assert np.shares_memory(columnar.x_history, columnar.history.data)
+        assert columnar.history.to_array().shape == (7, 51)
+
+    def test_ring_and_decimation(self):
+        reference = drive(rbt.UnicycleModel())
+        ring = drive(rbt.UnicycleModel(history=rbt.RingHistory(10)))
+        assert_array_almost_equal(ring.x_history, reference.x_history[-10:])
+        assert_array_almost_equal(ring.time_history, reference.time_history[-10:])
+
+        decimated = drive(
+            rbt.UnicycleModel(history=rbt.ColumnarHistory(decimation=5))
+        )
+        assert_array_almost_equal(decimated.v_history, reference.v_history[::5])
+
+        disabled = drive(rbt.UnicycleModel(history=rbt.NullHistory()))
+        assert len(disabled.x_history) == 0
+        assert disabled.x == pytest.approx(reference.x)
+
+        with pytest.raises(ValueError):
+            rbt.RingHistory(0)
+        with pytest.raises(TypeError):
+            rbt.History()
+
+    def test_columnar_out_is_never_replaced(self):
+        out = np.zeros((6, 4))
+        model = rbt.UnicycleModel(history=rbt.ColumnarHistory(out=out))
+        model.rollout_Euler_by_omega_and_v(0.1, 1.0, [0.1] * 3)
+        assert model.history.data is out
+        assert_array_almost_equal(out[0], [0.0, 0.1, 0.2, 0.3])
+        with pytest.raises(ValueError):
+            model.update_Euler_by_omega_and_v(0.1, 1.0, 0.1)
+        with pytest.raises(ValueError):
+            rbt.BicycleModel(history=rbt.ColumnarHistory(out=out))
+
+    def test_full_out_leaves_the_state_unchanged(self):
+        out = np.zeros((7, 3))
+        model = rbt.BicycleModel(v=1.0, history=rbt.ColumnarHistory(out=out))
+        model.update_Euler_by_phi_and_accel(0.1, 1.0, 0.1)
+        model.update_Euler_by_phi_and_accel(0.1, 1.0, 0.1)
+        state = (model.time, model.x, model.y, model.theta, model.phi, model.v)
+        for update in (
+            lambda: model.update_Euler_by_phi_and_accel(0.1, 1.0, 0.1),
+            lambda: model.update_by_phi_and_accel(0.2, 1.0, 0.1, "rk4"),
+            lambda: model.rollout_Euler_by_phi_and_accel(0.1, 1.0, [0.1] * 2),
+        ):
+            with pytest.raises(ValueError):
+                update()
+            assert (
+                model.time,
+                model.x,
+                model.y,
+                model.theta,
+                model.phi,
+                model.v,
+            ) == state
+        assert_array_almost_equal(np.delete(out[:, -1], 5), state)
+
+        # with decimation 2 only every other update needs room
+        history = rbt.ColumnarHistory(decimation=2, out=out[:6])
+        model = rbt.UnicycleModel(history=history)
+        for _ in range(5):
+            model.update_Euler_by_omega_and_v(0.1, 1.0, 0.1)
+        with pytest.raises(ValueError):
+            model.update_Euler_by_omega_and_v(0.1, 1.0, 0.1)
+        assert model.time == pytest.approx(0.5)
+
+
+class TestFleet:
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "update_Euler_by_omega_and_v",
+            "update_Euler_by_omega_and_accel",
+            "update_Euler_by_alpha_and_accel",
+        ],
+    )
+    def test_unicycle_fleet_matches_models(self, method):
+        rng = np.random.RandomState(0)
+        models = [
+            rbt.UnicycleModel(*rng.randn(2), rng.uniform(-np.pi, np.pi), 0.1, 1.0)
+            for _ in range(5)
+        ]
+        fleet = rbt.UnicycleFleet.from_models(models)
+        for _ in range(20):
+            u0, u1 = rng.randn(2, 5)
+            for m, a, b in zip(models, u0, u1):
+                getattr(m, method)(a, b, 0.05)
+            getattr(fleet, method)(u0, u1, 0.05)
+        for name in ("x", "y", "theta", "omega", "v"):
+            assert_array_almost_equal(
+                getattr(fleet, name), [getattr(m, name) for m in models]
+            )
+        assert_array_almost_equal(fleet.time, [m.time for m in models])
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "update_Euler_by_phi_and_accel",
+            "update_Euler_by_omega_and_accel",
+            "update_Euler_by_alpha_and_accel",
+        ],
+    )
+    def test_bicycle_fleet_matches_models(self, method):
+        rng = np.random.RandomState(1)
+        models = [
+            rbt.BicycleModel(
+                *rng.randn(2), 0.3, L=2.0, v=1.0, max_steering_angle=0.3 + 0.1 * i
+            )
+            for i in range(5)
+        ]
+        fleet = rbt.BicycleFleet.from_models(models)
+        for _ in range(20):
+            u0, u1 = rng.randn(2, 5)
+            for m, a, b in zip(models, u0, u1):
+                getattr(m, method)(a, b, 0.05)
+            getattr(fleet, method)(u0, u1, 0.05)
+        for name in ("x", "y", "theta", "phi", "omega", "v"):
+            assert_array_almost_equal(
+                getattr(fleet, name), [getattr(m, name) for m in models]
+            )
+
+    def test_steering_clipping(self):
+        fleet = rbt.BicycleFleet(3, v=1.0, max_steering_angle=[0.1, 0.2, 0.3])
+        fleet.update_Euler_by_phi_and_accel(np.array([1.0, -1.0, 0.25]), 0.0, 0.1)
+        assert_array_almost_equal(fleet.phi, [0.1, -0.2, 0.25])
+        assert len(fleet) == 3
+
+    def test_per_vehicle_dt(self):
+        fleet = rbt.UnicycleFleet(3, v=1.0)
+        dt = np.array([0.1, 0.2, 0.3])
+        fleet.update_Euler_by_omega_and_v(0.0, 1.0, dt)
+        fleet.update_Euler_by_omega_and_v(0.0, 1.0, 0.1)
+        assert fleet.time.shape == (3,)
+        assert_array_almost_equal(fleet.time, dt + 0.1)
+        assert_array_almost_equal(fleet.x, dt + 0.1)
+
+
+class TestRollout:
+    @pytest.mark.parametrize(
+        "family", ["omega_and_v", "omega_and_accel", "alpha_and_accel"]
+    )
+    def test_unicycle_rollout_matches_stepping(self, family):
+        rng = np.random.RandomState(2)
+        u0, u1 = rng.randn(2, 200)
+        dts = rng.uniform(0.01, 0.05, 200)
+        stepped = rbt.UnicycleModel(0.5, -0.2, 0.3, 0.1, 1.0)
+        for a, b, dt in zip(u0, u1, dts):
+            getattr(stepped, "update_Euler_by_" + family)(a, b, dt)
+        rolled = rbt.UnicycleModel(0.5, -0.2, 0.3, 0.1, 1.0)
+        states = getattr(rolled, "rollout_Euler_by_" + family)(u0, u1, dts)
+        for name in rbt.UnicycleModel.COLUMNS:
+            assert_array_almost_equal(
+                states[name], stepped.history.column(name)[1:], decimal=12
+            )
+            assert_array_almost_equal(
+                rolled.history.column(name), stepped.history.column(name)
+            )
+        assert_almost_equal(rolled.x, stepped.x, decimal=12)
+
+    @pytest.mark.parametrize(
+        "family", ["phi_and_accel", "omega_and_accel", "alpha_and_accel"]
+    )
+    def test_bicycle_rollout_matches_stepping(self, family):
+        rng = np.random.RandomState(3)
+        # large commands so that the steering angle hits its limit
+        u0, u1 = 3 * rng.randn(2, 300)
+        args = dict(x=1.0, theta=0.2, L=2.0, v=2.0, max_steering_angle=0.5)
+        stepped = rbt.BicycleModel(**args)
+        for a, b in zip(u0, u1):
+            getattr(stepped, "update_Euler_by_" + family)(a, b, 0.02)
+        history = rbt.ColumnarHistory(decimation=3)
+        rolled = rbt.BicycleModel(history=history, **args)
+        states = getattr(rolled, "rollout_Euler_by_" + family)(u0, u1, 0.02)
+        for name in rbt.BicycleModel.COLUMNS:
+            assert_array_almost_equal(
+                states[name], stepped.history.column(name)[1:], decimal=12
+            )
+            assert_array_almost_equal(
+                history.column(name), stepped.history.column(name)[::3]
+            )
+        assert np.max(np.abs(states["phi"])) >= 0.5
+
+    def test_ring_history_extend(self):
+        model = rbt.UnicycleModel(history=rbt.RingHistory(7))
+        model.rollout_Euler_by_omega_and_v(0.1, 1.0, [0.1] * 3)
+        model.update_Euler_by_omega_and_v(0.1, 1.0, 0.1)
+        model.rollout_Euler_by_omega_and_v(0.1, 1.0, [0.1] * 5)
+        assert_array_almost_equal(model.time_history, 0.1 * np.arange(3, 10))
+        model.rollout_Euler_by_omega_and_v(0.1, 1.0, [0.1] * 20)
+        assert_array_almost_equal(model.time_history, 0.1 * np.arange(23, 30))
+
+
+class TestIntegrators:
+    def test_unicycle_exact_arc(self):
+        model = rbt.UnicycleModel()
+        # one quarter of the unit circle in a single step
+        model.update_by_omega_and_v(np.pi / 2, np.pi / 2, 1.0)
+        assert_almost_equal([model.x, model.y, model.theta], [1.0, 1.0, np.pi / 2])
+        model = rbt.UnicycleModel()
+        model.update_by_omega_and_v(0.0, 2.0, 0.5)
+        assert_almost_equal([model.x, model.y], [1.0, 0.0])
+
+    def test_bicycle_exact_arc(self):
+        L, phi = 2.0, 0.4
+        radius = L / np.tan(phi)
+        model = rbt.BicycleModel(L=L, v=1.0, max_steering_angle=0.5)
+        for _ in range(10):
+            model.update_by_phi_and_accel(phi, 0.0, 0.7)
+        angle = 7.0 / radius
+        assert_almost_equal(model.theta, angle)
+        assert_almost_equal(model.x, radius * np.sin(angle))
+        assert_almost_equal(model.y, radius * (1 - np.cos(angle)))
+
+    @pytest.mark.parametrize(
+        "model_type, family",
+        [
+            (rbt.UnicycleModel, "omega_and_accel"),
+            (rbt.UnicycleModel, "alpha_and_accel"),
+            (rbt.BicycleModel, "omega_and_accel"),
+            (rbt.BicycleModel, "alpha_and_accel"),
+        ],
+    )
+    def test_convergence_order(self, model_type, family):
+        def final_position(dt, integrator):
+            model = model_type(v=1.0, history=rbt.NullHistory())
+            update = getattr(model, "update_by_" + family)
+            for _ in range(int(round(2.0 / dt))):
+                update(0.3, 0.2, dt, integrator)
+            return np.array([model.x, model.y])
+
+        reference = final_position(1e-3, "rk4")
+        errors = {
+            integrator: np.linalg.norm(final_position(0.1, integrator) - reference)
+            for integrator in rbt.INTEGRATORS
+        }
+        assert errors["rk4"] < 1e-6
+        assert errors["midpoint"] < errors["euler"] / 10
+        assert errors["exact"] < errors["euler"] / 10
+
+    def test_euler_and_invalid_integrator(self):
+        a = rbt.BicycleModel(v=1.0)
+        b = rbt.BicycleModel(v=1.0)
+        for _ in range(5):
+            a.update_Euler_by_omega_and_accel(0.5, 0.1, 0.1)
+            b.update_by_omega_and_accel(0.5, 0.1, 0.1, "euler")
+        assert_array_almost_equal(a.x_history, b.x_history)
+        with pytest.raises(ValueError):
+            a.update_by_omega_and_accel(0.5, 0.1, 0.1, "rk45")
+
+        # a rejected integrator leaves the state untouched
+        bicycle = rbt.BicycleModel(phi=1.0, v=1.0, max_steering_angle=0.5)
+        unicycle = rbt.UnicycleModel(v=1.0)
+        with pytest.raises(ValueError):
+            bicycle.update_by_phi_and_accel(0.2, 0.0, 0.1, "rk5")
+        with pytest.raises(ValueError):
+            bicycle.update_by_omega_and_accel(0.2, 0.0, 0.1, "rk5")
+        with pytest.raises(ValueError):
+            unicycle.update_by_omega_and_v(0.2, 3.0, 0.1, "rk5")
+        assert bicycle.phi == 1.0
+        assert unicycle.v == 1.0
+        assert len(bicycle.x_history) == len(unicycle.x_history) == 1